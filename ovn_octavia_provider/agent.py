@@ -44,7 +44,7 @@ def OvnProviderAgent(exit_event):
 
     # NOTE(mjozefcz): This API is only for handling OVSDB events!
     ovn_nb_idl_for_events = impl_idl_ovn.OvnNbIdlForLb(
-        event_lock_name=OVN_EVENT_LOCK_NAME)
+        event_lock_name=OVN_EVENT_LOCK_NAME, lb_ports_only=True)
     ovn_nb_idl_for_events.notify_handler.watch_events(events)
     c = connection.Connection(ovn_nb_idl_for_events,
                               ovn_conf.get_ovn_ovsdb_timeout())
@@ -72,3 +72,4 @@ def OvnProviderAgent(exit_event):
     ovn_sb_idl_for_events.notify_handler.unwatch_events(sb_events)
     ovn_sb_idl_for_events.stop()
     maintenance_thread.stop()
+    helper.stop()
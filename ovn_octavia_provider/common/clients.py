@@ -10,6 +10,10 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
+import collections
+import threading
+import time
+
 from keystoneauth1 import exceptions as ks_exceptions
 from keystoneauth1 import loading as ks_loading
 
@@ -19,6 +23,7 @@ from oslo_config import cfg
 from oslo_log import log as logging
 from oslo_utils import excutils
 
+from ovn_octavia_provider.common import config as ovn_conf
 from ovn_octavia_provider.common import constants
 from ovn_octavia_provider.i18n import _
 
@@ -141,6 +146,102 @@ def get_neutron_client():
             operator_fault_string=msg)
 
 
+# The attributes of the Neutron subnets and networks used by the provider.
+# NOTE: the gateway_ip of a subnet can not be updated while a router port
+# uses it, and the router ports of the network drop its entries when they
+# change (see NeutronResourceCache), so a cached gateway_ip does not hide
+# the router a subnet is attached to.
+CachedSubnet = collections.namedtuple(
+    'CachedSubnet', ['id', 'network_id', 'cidr', 'gateway_ip', 'ip_version'])
+CachedNetwork = collections.namedtuple(
+    'CachedNetwork', ['id', 'provider_physical_network'])
+
+
+class NeutronResourceCache():
+    """Bounded LRU cache, with a TTL, of Neutron subnets and networks
+
+    Only the attributes used by the provider are kept (see CachedSubnet
+    and CachedNetwork). The entries of a network, and of its subnets, are
+    also dropped by invalidate_network, called when the Logical_Switch of
+    the network, or one of its router ports, changes in the OVN NB DB.
+    Errors are not cached.
+
+    :param ttl: time in seconds an entry is valid, 0 disables the cache.
+    :param max_size: maximum number of entries.
+    """
+
+    def __init__(self, ttl, max_size):
+        self.ttl = ttl
+        self.max_size = max_size
+        self._entries = collections.OrderedDict()
+        self._generation = 0
+        self._lock = threading.Lock()
+
+    def _get(self, key, fetch_fn):
+        if not self.ttl:
+            return fetch_fn()
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry and entry[0] > now:
+                self._entries.move_to_end(key)
+                return entry[1]
+            generation = self._generation
+        value = fetch_fn()
+        with self._lock:
+            # Not stored if invalidated while it was being retrieved.
+            if generation == self._generation:
+                self._entries[key] = (now + self.ttl, value)
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.max_size:
+                    self._entries.popitem(last=False)
+        return value
+
+    def get_subnet(self, neutron_client, subnet_id):
+        def _fetch():
+            subnet = neutron_client.get_subnet(subnet_id)
+            return CachedSubnet(subnet.id, subnet.network_id, subnet.cidr,
+                                subnet.gateway_ip, subnet.ip_version)
+        return self._get(('subnet', subnet_id), _fetch)
+
+    def get_network(self, neutron_client, network_id):
+        def _fetch():
+            network = neutron_client.get_network(network_id)
+            return CachedNetwork(network.id,
+                                 network.provider_physical_network)
+        return self._get(('network', network_id), _fetch)
+
+    def invalidate_network(self, network_id):
+        with self._lock:
+            self._generation += 1
+            for key, (_expiry, value) in list(self._entries.items()):
+                if key == ('network', network_id) or (
+                        key[0] == 'subnet' and
+                        value.network_id == network_id):
+                    del self._entries[key]
+
+    def clear(self):
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
+
+
+# NOTE: the driver, and so the OVN provider helper, is instantiated for
+# every Octavia API call, so the cache belongs to the process.
+_neutron_resource_cache = None
+_neutron_resource_cache_lock = threading.Lock()
+
+
+def get_neutron_resource_cache():
+    global _neutron_resource_cache
+    with _neutron_resource_cache_lock:
+        if _neutron_resource_cache is None:
+            _neutron_resource_cache = NeutronResourceCache(
+                ovn_conf.get_ovn_neutron_cache_ttl(),
+                ovn_conf.get_ovn_neutron_cache_size())
+        return _neutron_resource_cache
+
+
 class OctaviaAuth(metaclass=Singleton):
     def __init__(self):
         """Create Octavia client object."""
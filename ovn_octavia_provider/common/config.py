@@ -79,6 +79,86 @@ ovn_opts = [
                       'connection keepalive feature. If non-zero the value '
                       'will be forced to at least 1000 milliseconds. Defaults '
                       'to 60 seconds.')),
+    cfg.IntOpt('request_workers',
+               min=1,
+               default=1,
+               help=_('Number of threads processing the requests received '
+                      'by the OVN provider. Requests are distributed by '
+                      'load balancer, so the requests for the same load '
+                      'balancer are always processed in order by the same '
+                      'thread, while requests for different load balancers '
+                      'can be processed concurrently.')),
+    cfg.IntOpt('hm_event_request_weight',
+               min=1,
+               default=3,
+               help=_('Number of health monitor status events processed '
+                      'for every other request (load balancer, listener, '
+                      'pool, member or health monitor operations) when both '
+                      'kind of requests are waiting to be processed. Health '
+                      'monitor events are processed with higher priority, '
+                      'so the member status changes are reported to Octavia '
+                      'without waiting for the rest of queued requests.')),
+    cfg.StrOpt('metrics_file',
+               default='',
+               help=_('Path of the file where the metrics of the requests '
+                      'processed by the OVN provider (number of requests, '
+                      'queue depth, time waiting in the queue and time '
+                      'processing them per request type) are periodically '
+                      'written, using the Prometheus text exposition format. '
+                      'The string {pid} is replaced with the process id, as '
+                      'the provider runs in several processes. If empty, '
+                      'the metrics are not written.')),
+    cfg.IntOpt('metrics_interval',
+               min=1,
+               default=30,
+               help=_('Interval in seconds between writes of the metrics '
+                      'file.')),
+    cfg.StrOpt('request_journal',
+               default='',
+               help=_('Path of a local SQLite database used as journal of '
+                      'the requests accepted by the OVN provider. Requests '
+                      'are stored before being queued and removed once '
+                      'processed, so the ones not completed when a process '
+                      'stops are replayed by the next OVN provider process '
+                      'started on the same host. If empty, the journal is '
+                      'disabled.')),
+    cfg.FloatOpt('status_update_interval',
+                 min=0,
+                 default=0,
+                 help=_('Time in seconds the status updates of the processed '
+                        'requests are buffered before being sent to Octavia. '
+                        'The updates buffered meanwhile, or while the '
+                        'previous one was being sent, are merged per object '
+                        'and sent together. If zero, the status is sent as '
+                        'soon as the previous update is finished.')),
+    cfg.FloatOpt('nb_group_commit_latency',
+                 min=0,
+                 default=0,
+                 help=_('Time in seconds a request worker waits for other '
+                        'workers before committing its changes to the OVN '
+                        'Northbound DB, so the changes of the requests '
+                        'processed concurrently are committed in a single '
+                        'transaction. If that transaction fails, the changes '
+                        'of each request are committed separately. Only '
+                        'used with more than one request worker, it is '
+                        'ignored if request_workers is 1. If zero, each '
+                        'request commits its own transactions.')),
+    cfg.IntOpt('neutron_cache_ttl',
+               min=0,
+               default=60,
+               help=_('Time in seconds the subnet and network attributes '
+                      'retrieved from Neutron (network, CIDR, gateway IP and '
+                      'provider physical network) are cached. They are also '
+                      'dropped from the cache when the Logical Switch of '
+                      'their network, or one of its router ports, changes '
+                      'in the OVN Northbound DB. If '
+                      'zero, they are retrieved from Neutron every time.')),
+    cfg.IntOpt('neutron_cache_size',
+               min=1,
+               default=4096,
+               help=_('Maximum number of subnets and networks in the cache '
+                      'of Neutron attributes. The least recently used ones '
+                      'are dropped first.')),
 ]
 
 neutron_opts = [
@@ -220,3 +300,39 @@ def get_ovn_ovsdb_retry_max_interval():
 
 def get_ovn_ovsdb_probe_interval():
     return cfg.CONF.ovn.ovsdb_probe_interval
+
+
+def get_ovn_request_workers():
+    return cfg.CONF.ovn.request_workers
+
+
+def get_ovn_hm_event_request_weight():
+    return cfg.CONF.ovn.hm_event_request_weight
+
+
+def get_ovn_metrics_file():
+    return cfg.CONF.ovn.metrics_file
+
+
+def get_ovn_metrics_interval():
+    return cfg.CONF.ovn.metrics_interval
+
+
+def get_ovn_request_journal():
+    return cfg.CONF.ovn.request_journal
+
+
+def get_ovn_status_update_interval():
+    return cfg.CONF.ovn.status_update_interval
+
+
+def get_ovn_nb_group_commit_latency():
+    return cfg.CONF.ovn.nb_group_commit_latency
+
+
+def get_ovn_neutron_cache_ttl():
+    return cfg.CONF.ovn.neutron_cache_ttl
+
+
+def get_ovn_neutron_cache_size():
+    return cfg.CONF.ovn.neutron_cache_size
@@ -33,6 +33,7 @@ OVN_FIP_PORT_EXT_ID_KEY = 'neutron:fip_port_id'
 OVN_GW_PORT_EXT_ID_KEY = 'neutron:gw_port_id'
 OVN_PORT_CIDR_EXT_ID_KEY = 'neutron:cidrs'
 OVN_MEMBER_STATUS_KEY = 'neutron:member_status'
+OVN_MEMBER_STATUS_PREFIX = 'neutron:member_status:'
 OVN_ROUTER_IS_EXT_GW = 'neutron:is_ext_gw'
 
 # TODO(froyo): Use from neutron-lib once released.
@@ -75,6 +76,7 @@ REQ_TYPE_POOL_UPDATE = 'pool_update'
 REQ_TYPE_MEMBER_CREATE = 'member_create'
 REQ_TYPE_MEMBER_DELETE = 'member_delete'
 REQ_TYPE_MEMBER_UPDATE = 'member_update'
+REQ_TYPE_MEMBER_BATCH_UPDATE = 'member_batch_update'
 REQ_TYPE_LB_CREATE_LRP_ASSOC = 'lb_create_lrp_assoc'
 REQ_TYPE_LB_DELETE_LRP_ASSOC = 'lb_delete_lrp_assoc'
 REQ_TYPE_HANDLE_VIP_FIP = 'handle_vip_fip'
@@ -86,6 +88,21 @@ REQ_TYPE_HM_UPDATE_EVENT = 'hm_update_event'
 
 REQ_TYPE_EXIT = 'exit'
 
+# Requests stored in the requests journal (if enabled), the rest of them
+# are generated from OVN DB events and can not be serialized.
+REQ_TYPES_JOURNALED = (
+    REQ_TYPE_LB_CREATE, REQ_TYPE_LB_DELETE, REQ_TYPE_LB_UPDATE,
+    REQ_TYPE_LISTENER_CREATE, REQ_TYPE_LISTENER_DELETE,
+    REQ_TYPE_LISTENER_UPDATE, REQ_TYPE_POOL_CREATE, REQ_TYPE_POOL_DELETE,
+    REQ_TYPE_POOL_UPDATE, REQ_TYPE_MEMBER_CREATE, REQ_TYPE_MEMBER_DELETE,
+    REQ_TYPE_MEMBER_UPDATE, REQ_TYPE_MEMBER_BATCH_UPDATE,
+    REQ_TYPE_HANDLE_MEMBER_DVR, REQ_TYPE_HM_CREATE, REQ_TYPE_HM_UPDATE,
+    REQ_TYPE_HM_DELETE)
+REQ_JOURNAL_IDS = 'journal_ids'
+
+REQ_LANE_HM_EVENT = 'hm_event'
+REQ_LANE_CRUD = 'crud'
+
 # Request information constants
 REQ_INFO_ACTION_ASSOCIATE = 'associate'
 REQ_INFO_ACTION_SYNC = 'sync'
@@ -127,6 +144,8 @@ HM_EVENT_MEMBER_PORT_OFFLINE = ['offline']
 
 # max timeout for request
 MAX_TIMEOUT_REQUEST = 5
+# max time the agent waits for the requests queued when exiting
+MAX_TIMEOUT_STOP = 60
 
 AFFINITY_TIMEOUT = "affinity_timeout"
 # This driver only supports SOURCE_IP sesssion persistency option
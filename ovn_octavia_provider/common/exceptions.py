@@ -25,6 +25,10 @@ class RevisionConflict(n_exc.NeutronException):
                 'resource. Skipping update')
 
 
+class JournalStopped(n_exc.NeutronException):
+    message = _('The requests journal is stopped')
+
+
 class IPVersionsMixingNotSupportedError(
         driver_exceptions.UnsupportedOptionError):
     user_fault_string = _('OVN provider does not support mixing IPv4/IPv6 '
@@ -0,0 +1,247 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+from concurrent import futures
+import os
+import queue
+import socket
+import sqlite3
+import threading
+import time
+
+from oslo_log import log as logging
+from oslo_serialization import jsonutils
+from oslo_utils import uuidutils
+
+from ovn_octavia_provider.common import constants
+from ovn_octavia_provider.common import exceptions
+
+LOG = logging.getLogger(__name__)
+
+_OP_RECORD = 'record'
+_OP_COMPLETE = 'complete'
+_OP_STOP = 'stop'
+
+# Owners of the journals of this process being used, see
+# RequestJournal._is_owner_alive.
+_running_owners = set()
+_running_owners_lock = threading.Lock()
+
+
+def _get_process_start_time(pid):
+    """Return the start time of a process, or '' if it is unknown
+
+    The start time (in clock ticks since the boot) tells apart the
+    processes that got the same PID.
+    """
+    try:
+        with open(f'/proc/{pid}/stat', encoding='utf-8') as f:
+            stat = f.read()
+        # The fields following the command name, which is between brackets
+        # and can contain spaces, starting at the state (third field).
+        return stat[stat.rindex(')') + 2:].split()[19]
+    except (OSError, ValueError, IndexError):
+        return ''
+
+
+class RequestJournal():
+    """Durable journal of the requests accepted by the OVN provider
+
+    Requests are stored in a local SQLite database before being queued and
+    removed from it once they have been processed, so the requests still
+    in the journal when a process dies can be replayed by the next one
+    started on the same host.
+
+    All the writes are done by a single thread that commits in the same
+    transaction (and so with a single fsync) every write queued while the
+    previous commit was in progress (group commit). Recording a request
+    waits until its transaction is committed, while completions are
+    written asynchronously: if one is lost the request is just replayed.
+
+    The requests are owned by the journal that recorded them, identified
+    by the host, PID and start time of its process, so the requests of a
+    dead process are not kept by a new process that got the same PID, and
+    by a token of its own, as a process can use several journals (one per
+    OvnProviderHelper). The requests of another journal of the same process
+    are only taken over once it has been stopped.
+    """
+
+    def __init__(self, path):
+        self._host = socket.gethostname()
+        pid = os.getpid()
+        self._process = f'{pid}:{_get_process_start_time(pid)}'
+        self._owner = (f'{self._host}:{self._process}:'
+                       f'{uuidutils.generate_uuid()}')
+        self._ops = queue.Queue()
+        self._lock = threading.Lock()
+        self._stopped = False
+        self._conn = sqlite3.connect(path, timeout=60,
+                                     isolation_level=None,
+                                     check_same_thread=False)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute('PRAGMA synchronous=FULL')
+        self._conn.execute(
+            'CREATE TABLE IF NOT EXISTS requests ('
+            'id TEXT PRIMARY KEY, owner TEXT NOT NULL, '
+            'created_at REAL NOT NULL, request TEXT NOT NULL)')
+        self._thread = threading.Thread(target=self._writer)
+        self._thread.daemon = True
+
+    def start(self):
+        with _running_owners_lock:
+            _running_owners.add(self._owner)
+        self._thread.start()
+
+    @staticmethod
+    def _is_process_alive(pid):
+        try:
+            os.kill(pid, 0)
+        except ProcessLookupError:
+            return False
+        except PermissionError:
+            pass
+        return True
+
+    def _is_owner_alive(self, owner):
+        host, _, process = owner.partition(':')
+        if host != self._host:
+            # Requests accepted on other hosts can not be checked, they are
+            # replayed by the processes running there.
+            return True
+        if process.rpartition(':')[0] == self._process:
+            # Another journal of this process.
+            with _running_owners_lock:
+                return owner in _running_owners
+        pid, _, start_time = process.partition(':')
+        start_time = start_time.partition(':')[0]
+        try:
+            pid = int(pid)
+        except ValueError:
+            return False
+        if not self._is_process_alive(pid):
+            return False
+        # NOTE: the start time is unknown if /proc is not available, the
+        # owner is then identified by its PID only.
+        return (not start_time or
+                _get_process_start_time(pid) in ('', start_time))
+
+    def claim_incomplete(self):
+        """Take over the requests left in the journal by dead processes
+
+        It must be called before starting the journal writer.
+
+        :returns: a list of requests, in the order they were accepted,
+                  each one with its journal id in the REQ_JOURNAL_IDS key.
+        """
+        try:
+            self._conn.execute('BEGIN IMMEDIATE')
+            owners = [row[0] for row in self._conn.execute(
+                'SELECT DISTINCT owner FROM requests WHERE owner != ?',
+                (self._owner,))]
+            for owner in owners:
+                if not self._is_owner_alive(owner):
+                    self._conn.execute(
+                        'UPDATE requests SET owner = ? WHERE owner = ?',
+                        (self._owner, owner))
+            rows = self._conn.execute(
+                'SELECT id, request FROM requests WHERE owner = ? '
+                'ORDER BY created_at', (self._owner,)).fetchall()
+            self._conn.execute('COMMIT')
+        except Exception:
+            if self._conn.in_transaction:
+                self._conn.execute('ROLLBACK')
+            raise
+        requests = []
+        for journal_id, request in rows:
+            request = jsonutils.loads(request)
+            request[constants.REQ_JOURNAL_IDS] = [journal_id]
+            requests.append(request)
+        return requests
+
+    def record(self, request):
+        """Store the request, waiting until it is durable
+
+        :returns: the journal id of the request.
+        :raises JournalStopped: if the journal has been stopped.
+        """
+        journal_id = uuidutils.generate_uuid()
+        done = futures.Future()
+        with self._lock:
+            if self._stopped:
+                raise exceptions.JournalStopped()
+            self._ops.put((_OP_RECORD,
+                           (journal_id, self._owner, time.time(),
+                            jsonutils.dumps(request)),
+                           done))
+        done.result()
+        return journal_id
+
+    def complete(self, journal_ids):
+        """Remove the requests from the journal, once they are processed
+
+        The requests completed after the journal has been stopped are kept
+        in it, and replayed by the next process.
+        """
+        with self._lock:
+            if self._stopped:
+                LOG.debug('Requests %s completed after stopping the '
+                          'journal', journal_ids)
+                return
+            for journal_id in journal_ids:
+                self._ops.put((_OP_COMPLETE, (journal_id,), None))
+
+    def stop(self):
+        """Stop the writer, once the operations queued have been written"""
+        with self._lock:
+            if self._stopped:
+                return
+            self._stopped = True
+            self._ops.put((_OP_STOP, None, None))
+        if self._thread.is_alive():
+            self._thread.join()
+        # NOTE: its requests can be taken over once the completions queued
+        # have been written.
+        with _running_owners_lock:
+            _running_owners.discard(self._owner)
+
+    def _writer(self):
+        while True:
+            ops = [self._ops.get()]
+            while True:
+                try:
+                    ops.append(self._ops.get_nowait())
+                except queue.Empty:
+                    break
+            try:
+                self._conn.execute('BEGIN')
+                for op, params, _ in ops:
+                    if op == _OP_RECORD:
+                        self._conn.execute(
+                            'INSERT INTO requests VALUES (?, ?, ?, ?)',
+                            params)
+                    elif op == _OP_COMPLETE:
+                        self._conn.execute(
+                            'DELETE FROM requests WHERE id = ?', params)
+                self._conn.execute('COMMIT')
+            except Exception as e:
+                LOG.exception('Error writing to the requests journal')
+                if self._conn.in_transaction:
+                    self._conn.execute('ROLLBACK')
+                for _, _, done in ops:
+                    if done:
+                        done.set_exception(e)
+            else:
+                for _, _, done in ops:
+                    if done:
+                        done.set_result(None)
+            if any(op == _OP_STOP for op, _, _ in ops):
+                return
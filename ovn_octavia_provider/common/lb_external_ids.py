@@ -0,0 +1,226 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import functools
+
+from neutron_lib import constants as n_const
+from octavia_lib.common import constants as o_constants
+from oslo_log import log as logging
+from oslo_serialization import jsonutils
+
+from ovn_octavia_provider.common import constants
+from ovn_octavia_provider.common import utils
+
+LOG = logging.getLogger(__name__)
+
+DISABLED_SUFFIX = ':' + constants.DISABLED_RESOURCE_SUFFIX
+
+
+class Member():
+    """A member of a pool, stored as member_<id>_<ip>:<port>_<subnet_id>"""
+
+    __slots__ = ('id', 'ip', 'port', 'subnet_id')
+
+    def __init__(self, member):
+        mem_split = member.split('_')
+        self.id = mem_split[1]
+        self.ip, self.port = mem_split[2].rsplit(':', 1)
+        self.subnet_id = mem_split[3]
+
+    def as_tuple(self):
+        return (self.ip, self.port, self.subnet_id, self.id)
+
+
+@functools.lru_cache(maxsize=256)
+def parse_members(value):
+    """Return a tuple with the Members of the value of a pool key"""
+    if not value:
+        return ()
+    return tuple(Member(member) for member in value.split(','))
+
+
+class Pool():
+    """A pool_<id>[:D] key, whose value is the list of its members"""
+
+    __slots__ = ('key', 'id', 'enabled', 'value', '_members', '_member_ids',
+                 '_backends')
+
+    def __init__(self, key, value):
+        self.key = key
+        # NOTE: the id keeps the suffix of the disabled pools, as the
+        # operating statuses are reported with it.
+        self.id = key[len(constants.LB_EXT_IDS_POOL_PREFIX):]
+        self.enabled = not key.endswith(DISABLED_SUFFIX)
+        self.value = value
+        self._members = None
+        self._member_ids = None
+        self._backends = None
+
+    @property
+    def members(self):
+        # Parsed on first use, most of the callers only need the keys.
+        if self._members is None:
+            self._members = parse_members(self.value)
+        return self._members
+
+    @property
+    def member_ids(self):
+        if self._member_ids is None:
+            self._member_ids = frozenset(
+                member.id for member in self.members)
+        return self._member_ids
+
+    def get_backends(self, offline_member_ids):
+        """Return the IPv4 and IPv6 backends of the pool VIPs
+
+        The backends are the 'ip:port' (or '[ip]:port') of the members not
+        offline, comma separated as in the vips column. They are cached in
+        the pool for its last offline members. The pools not changed are
+        carried over to the new views of the external_ids (see
+        LbExternalIds), so only the pools changed since the last time the
+        vips were framed are computed again.
+        """
+        offline_member_ids = self.member_ids & offline_member_ids
+        if (self._backends is not None and
+                self._backends[0] == offline_member_ids):
+            return self._backends[1]
+        ips_v4 = []
+        ips_v6 = []
+        for member in self.members:
+            if member.id in offline_member_ids:
+                continue
+            if utils.get_ip_version(member.ip) == n_const.IP_VERSION_6:
+                ips_v6.append(f'[{member.ip}]:{member.port}')
+            else:
+                ips_v4.append(f'{member.ip}:{member.port}')
+        backends = (','.join(ips_v4), ','.join(ips_v6))
+        self._backends = (offline_member_ids, backends)
+        return backends
+
+
+class Listener():
+    """A listener_<id>[:D] key, whose value is <port>:<pool key>"""
+
+    __slots__ = ('key', 'id', 'enabled', 'port', 'pool_key', 'pool_ids')
+
+    def __init__(self, key, value):
+        self.key = key
+        self.id = key[len(constants.LB_EXT_IDS_LISTENER_PREFIX):]
+        self.enabled = not key.endswith(DISABLED_SUFFIX)
+        fields = value.split(':')
+        if len(fields) == 2:
+            self.port, self.pool_key = fields
+        else:
+            # No pool or a disabled one.
+            self.port, self.pool_key = None, None
+        self.pool_ids = [x.split('_')[1] for x in value.split(',')
+                         if constants.LB_EXT_IDS_POOL_PREFIX in x]
+
+
+def get_member_status_key(member_id):
+    """Return the external_ids key storing the status of a member"""
+    return constants.OVN_MEMBER_STATUS_PREFIX + member_id
+
+
+def get_member_status_keys(member_statuses):
+    """Return the external_ids keys storing a dict of member statuses"""
+    return {get_member_status_key(member_id): status
+            for member_id, status in member_statuses.items()}
+
+
+def _load_json(external_ids, key, default):
+    value = external_ids.get(key)
+    if not value:
+        return default
+    try:
+        return jsonutils.loads(value)
+    except (TypeError, ValueError):
+        LOG.debug("Unable to decode the %s key of external_ids: %s",
+                  key, value)
+        return default
+
+
+class LbExternalIds():
+    """Parsed view of the external_ids of an OVN Load_Balancer
+
+    The values of the view must not be modified, as it can be shared by
+    all the users of the same Load_Balancer row (see
+    impl_idl_ovn.get_lb_external_ids). The raw attribute keeps the parsed
+    external_ids.
+
+    The member statuses are stored in a neutron:member_status:<member_id>
+    key per member. The neutron:member_status key, holding the statuses of
+    all the members as JSON, is still read until it is migrated to the
+    per member keys (see has_legacy_member_status); the per member keys
+    take precedence over it.
+
+    The pools whose value did not change are taken from the previous view
+    of the same Load_Balancer, if any, with their members and backends
+    already parsed.
+    """
+
+    __slots__ = ('raw', 'enabled', 'vips', 'vip_fip', 'additional_vip_fips',
+                 'listeners', 'pools', 'ls_refs', 'hm_ids', 'member_statuses',
+                 'has_legacy_member_status', 'offline_member_ids')
+
+    def __init__(self, external_ids, previous=None):
+        self.raw = external_ids
+        self.enabled = external_ids.get('enabled') != 'False'
+        self.vips = []
+        if constants.LB_EXT_IDS_VIP_KEY in external_ids:
+            self.vips.append(external_ids[constants.LB_EXT_IDS_VIP_KEY])
+        if constants.LB_EXT_IDS_ADDIT_VIP_KEY in external_ids:
+            self.vips.extend(
+                external_ids[constants.LB_EXT_IDS_ADDIT_VIP_KEY].split(','))
+        self.vip_fip = external_ids.get(constants.LB_EXT_IDS_VIP_FIP_KEY)
+        additional_vip_fips = external_ids.get(
+            constants.LB_EXT_IDS_ADDIT_VIP_FIP_KEY)
+        self.additional_vip_fips = (
+            additional_vip_fips.split(',') if additional_vip_fips else [])
+        self.has_legacy_member_status = (
+            constants.OVN_MEMBER_STATUS_KEY in external_ids)
+        self.member_statuses = _load_json(
+            external_ids, constants.OVN_MEMBER_STATUS_KEY, {})
+        self.listeners = {}
+        self.pools = {}
+        for key, value in external_ids.items():
+            if key.startswith(constants.LB_EXT_IDS_LISTENER_PREFIX):
+                self.listeners[key] = Listener(key, value)
+            elif key.startswith(constants.LB_EXT_IDS_POOL_PREFIX):
+                pool = previous.pools.get(key) if previous else None
+                if pool is None or pool.value != value:
+                    pool = Pool(key, value)
+                self.pools[key] = pool
+            elif key.startswith(constants.OVN_MEMBER_STATUS_PREFIX):
+                self.member_statuses[
+                    key[len(constants.OVN_MEMBER_STATUS_PREFIX):]] = value
+        self.ls_refs = _load_json(
+            external_ids, constants.LB_EXT_IDS_LS_REFS_KEY, {})
+        self.hm_ids = _load_json(
+            external_ids, constants.LB_EXT_IDS_HMS_KEY, [])
+        self.offline_member_ids = frozenset(
+            member_id for member_id, status in self.member_statuses.items()
+            if status == o_constants.OFFLINE)
+
+    def get_pool_listeners(self, pool_key):
+        return [listener.id for listener in self.listeners.values()
+                if listener.pool_key == pool_key]
+
+    def get_pool_listener_port(self, pool_key):
+        for listener in self.listeners.values():
+            if listener.pool_key == pool_key:
+                return listener.port
+        return None
+
+    def get_members(self, pool_key):
+        pool = self.pools.get(pool_key)
+        return pool.members if pool else ()
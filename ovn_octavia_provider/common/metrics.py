@@ -0,0 +1,246 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import atexit
+import collections
+import os
+import threading
+import weakref
+
+from oslo_log import log as logging
+from oslo_utils import uuidutils
+
+LOG = logging.getLogger(__name__)
+
+METRICS_PREFIX = 'ovn_octavia_provider'
+
+# Upper bounds (in seconds) of the request latency histogram buckets.
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0,
+                   10.0, 30.0, 60.0, 120.0, 300.0)
+
+REQUEST_RESULT_SUCCESS = 'success'
+REQUEST_RESULT_ERROR = 'error'
+
+
+class Histogram():
+
+    def __init__(self, buckets=LATENCY_BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * len(buckets)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value):
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                self.counts[i] += 1
+        self.sum += value
+        self.count += 1
+
+
+class RequestMetrics():
+    """Metrics of the OVN provider requests pipeline
+
+    Collects, per request type, the number of requests queued, folded and
+    processed, the time they wait in the queue before a worker starts
+    them and the time their handler takes. They are rendered using the
+    Prometheus text exposition format.
+
+    The depth of the requests queues added with add_queue is rendered too,
+    while they are alive.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._queued = collections.Counter()
+        self._folded = collections.Counter()
+        self._processed = collections.Counter()
+        self._wait = collections.defaultdict(Histogram)
+        self._duration = collections.defaultdict(Histogram)
+        self._queues = weakref.WeakSet()
+
+    def add_queue(self, requests):
+        with self._lock:
+            self._queues.add(requests)
+
+    def queue_depth(self):
+        with self._lock:
+            queues = list(self._queues)
+        queue_depth = collections.Counter()
+        for requests in queues:
+            queue_depth.update(requests.lanes_qsize())
+        return queue_depth
+
+    def request_queued(self, request_type):
+        with self._lock:
+            self._queued[request_type] += 1
+
+    def request_folded(self, request_type):
+        with self._lock:
+            self._folded[request_type] += 1
+
+    def request_started(self, request_type, wait):
+        with self._lock:
+            self._wait[request_type].observe(wait)
+
+    def request_processed(self, request_type, duration,
+                          result=REQUEST_RESULT_SUCCESS):
+        with self._lock:
+            self._processed[(request_type, result)] += 1
+            self._duration[request_type].observe(duration)
+
+    @staticmethod
+    def _render_labels(labels):
+        return ','.join(f'{k}="{v}"' for k, v in labels)
+
+    def _render_counter(self, lines, name, description, counter, labels):
+        name = f'{METRICS_PREFIX}_{name}'
+        lines.append(f'# HELP {name} {description}')
+        lines.append(f'# TYPE {name} counter')
+        for key, value in sorted(counter.items()):
+            key = key if isinstance(key, tuple) else (key,)
+            lines.append(
+                f'{name}{{{self._render_labels(zip(labels, key))}}} {value}')
+
+    def _render_histogram(self, lines, name, description, histograms):
+        name = f'{METRICS_PREFIX}_{name}'
+        lines.append(f'# HELP {name} {description}')
+        lines.append(f'# TYPE {name} histogram')
+        for request_type, histogram in sorted(histograms.items()):
+            label = f'type="{request_type}"'
+            for bound, count in zip(histogram.buckets, histogram.counts):
+                lines.append(
+                    f'{name}_bucket{{{label},le="{bound}"}} {count}')
+            lines.append(
+                f'{name}_bucket{{{label},le="+Inf"}} {histogram.count}')
+            lines.append(f'{name}_sum{{{label}}} {histogram.sum}')
+            lines.append(f'{name}_count{{{label}}} {histogram.count}')
+
+    def render(self, queue_depth=None):
+        """Return the metrics in Prometheus text exposition format
+
+        :param queue_depth: dict with the number of requests currently
+                            waiting on each lane of the requests queues.
+        """
+        lines = []
+        with self._lock:
+            self._render_counter(
+                lines, 'requests_queued_total',
+                'Number of requests queued.', self._queued, ('type',))
+            self._render_counter(
+                lines, 'requests_folded_total',
+                'Number of requests folded into a queued one.',
+                self._folded, ('type',))
+            self._render_counter(
+                lines, 'requests_processed_total',
+                'Number of requests processed.', self._processed,
+                ('type', 'result'))
+            self._render_histogram(
+                lines, 'request_wait_seconds',
+                'Time requests wait in the queue until being processed.',
+                self._wait)
+            self._render_histogram(
+                lines, 'request_duration_seconds',
+                'Time spent processing requests.', self._duration)
+        if queue_depth is not None:
+            name = f'{METRICS_PREFIX}_requests_queue_depth'
+            lines.append(f'# HELP {name} Number of requests waiting in the '
+                         'queue.')
+            lines.append(f'# TYPE {name} gauge')
+            for lane, depth in sorted(queue_depth.items()):
+                lines.append(f'{name}{{lane="{lane}"}} {depth}')
+        return '\n'.join(lines) + '\n'
+
+
+class MetricsFileReporter():
+    """Periodically dump the metrics to a local file
+
+    The file is written in Prometheus text exposition format, so it can be
+    consumed by the node exporter textfile collector. As the provider runs
+    in several processes (Octavia API workers and driver agent), the
+    string {pid} in the file path is replaced with the process id. A last
+    report is written when it is stopped.
+    """
+
+    def __init__(self, path, interval, render):
+        self._path = path.replace('{pid}', str(os.getpid()))
+        self._interval = interval
+        self._render = render
+        self._stop_event = threading.Event()
+        self._thread = threading.Thread(target=self._run)
+        self._thread.daemon = True
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self):
+        if self._stop_event.is_set():
+            return
+        self._stop_event.set()
+        if self._thread.is_alive():
+            self._thread.join()
+        self.report()
+
+    def _run(self):
+        while not self._stop_event.wait(self._interval):
+            self.report()
+
+    def report(self):
+        # NOTE: every write uses its own temporary file, so concurrent
+        # reports never write into the file another one is renaming.
+        tmp_path = f'{self._path}.{uuidutils.generate_uuid()}.tmp'
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                f.write(self._render())
+            os.replace(tmp_path, self._path)
+        except Exception:
+            LOG.exception('Error writing the metrics file %s', self._path)
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+
+
+# NOTE: the driver, and so the OVN provider helper, is instantiated for
+# every Octavia API call, so the metrics and their file reporter belong to
+# the process, not to the helper.
+_request_metrics = RequestMetrics()
+_file_reporter = None
+_file_reporter_lock = threading.Lock()
+
+
+def get_request_metrics():
+    return _request_metrics
+
+
+def render():
+    return _request_metrics.render(
+        queue_depth=_request_metrics.queue_depth())
+
+
+def start_file_reporter(path, interval):
+    """Start the metrics file reporter of the process, if not running"""
+    global _file_reporter
+    with _file_reporter_lock:
+        if _file_reporter is None:
+            _file_reporter = MetricsFileReporter(path, interval, render)
+            _file_reporter.start()
+            atexit.register(stop_file_reporter)
+
+
+def stop_file_reporter():
+    """Stop the metrics file reporter, writing a last report"""
+    global _file_reporter
+    with _file_reporter_lock:
+        file_reporter, _file_reporter = _file_reporter, None
+    if file_reporter:
+        file_reporter.stop()
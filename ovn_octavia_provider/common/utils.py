@@ -10,8 +10,10 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
+import functools
 import re
 
+import netaddr
 from oslo_utils import netutils
 import tenacity
 
@@ -73,6 +75,12 @@ def remove_macs_from_lsp_addresses(addresses):
     return ip_list
 
 
+@functools.lru_cache(maxsize=4096)
+def get_ip_version(ip):
+    """Return the IP version of an address, cached as it is hot code"""
+    return netaddr.IPNetwork(ip).version
+
+
 def retry(max_=None):
     def inner(func):
         def wrapper(*args, **kwargs):
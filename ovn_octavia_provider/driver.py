@@ -48,6 +48,9 @@ class OvnProviderDriver(driver_base.ProviderDriver):
         # OvnProviderHelper and intra references modules
         ovn_conf.register_opts()
         self._ovn_helper = ovn_helper.OvnProviderHelper(notifier=False)
+        # Load balancer id of the pools created by this driver, see
+        # _get_pool_loadbalancer_id.
+        self._pool_loadbalancer_ids = {}
 
     def __del__(self):
         self._ovn_helper.shutdown()
@@ -175,6 +178,26 @@ class OvnProviderDriver(driver_base.ProviderDriver):
 
         return request_info
 
+    def _get_pool_loadbalancer_id(self, pool_id):
+        """Return the id of the load balancer of a pool
+
+        The helper distributes the requests among its worker threads by
+        their loadbalancer_id, so all the requests of a load balancer are
+        processed in order, including the requests of a pool whose creation
+        request has not been processed yet. The load balancer of the pools
+        not created by this driver is got from Octavia, not from the OVN
+        NB, where the pool may not have been created yet. With a single
+        worker the requests are not distributed, so None is returned
+        instead of calling Octavia.
+        """
+        lb_id = self._pool_loadbalancer_ids.get(pool_id)
+        if lb_id is None and len(self._ovn_helper.requests) > 1:
+            pool = self._ovn_helper._octavia_driver_lib.get_pool(pool_id)
+            if pool:
+                lb_id = pool.loadbalancer_id
+                self._pool_loadbalancer_ids[pool_id] = lb_id
+        return lb_id
+
     def _get_healthmonitor_request_info(self, healthmonitor):
         self._validate_hm_support(healthmonitor)
         admin_state_up = healthmonitor.admin_state_up
@@ -191,9 +214,10 @@ class OvnProviderDriver(driver_base.ProviderDriver):
         return request_info
 
     def loadbalancer_create(self, loadbalancer):
+        request_info = self._get_loadbalancer_request_info(loadbalancer)
+        request_info['loadbalancer_id'] = loadbalancer.loadbalancer_id
         request = {'type': ovn_const.REQ_TYPE_LB_CREATE,
-                   'info': self._get_loadbalancer_request_info(
-                       loadbalancer)}
+                   'info': request_info}
         self._ovn_helper.add_request(request)
 
         if not isinstance(loadbalancer.listeners, o_datamodels.UnsetType):
@@ -210,6 +234,7 @@ class OvnProviderDriver(driver_base.ProviderDriver):
 
     def loadbalancer_delete(self, loadbalancer, cascade=False):
         request_info = {'id': loadbalancer.loadbalancer_id,
+                        'loadbalancer_id': loadbalancer.loadbalancer_id,
                         'cascade': cascade}
         request = {'type': ovn_const.REQ_TYPE_LB_DELETE,
                    'info': request_info}
@@ -222,7 +247,8 @@ class OvnProviderDriver(driver_base.ProviderDriver):
             operator_fault_string=msg)
 
     def loadbalancer_update(self, old_loadbalancer, new_loadbalancer):
-        request_info = {'id': new_loadbalancer.loadbalancer_id}
+        request_info = {'id': new_loadbalancer.loadbalancer_id,
+                        'loadbalancer_id': new_loadbalancer.loadbalancer_id}
         if not isinstance(
                 new_loadbalancer.admin_state_up, o_datamodels.UnsetType):
             request_info['admin_state_up'] = new_loadbalancer.admin_state_up
@@ -245,6 +271,7 @@ class OvnProviderDriver(driver_base.ProviderDriver):
                         'admin_state_up': admin_state_up}
         request = {'type': ovn_const.REQ_TYPE_POOL_CREATE,
                    'info': request_info}
+        self._pool_loadbalancer_ids[pool.pool_id] = pool.loadbalancer_id
         if not isinstance(
                 pool.session_persistence, o_datamodels.UnsetType):
             self._check_for_supported_session_persistence(
@@ -268,6 +295,7 @@ class OvnProviderDriver(driver_base.ProviderDriver):
         request = {'type': ovn_const.REQ_TYPE_POOL_DELETE,
                    'info': request_info}
         self._ovn_helper.add_request(request)
+        self._pool_loadbalancer_ids.pop(pool.pool_id, None)
 
     def pool_update(self, old_pool, new_pool):
         if not isinstance(new_pool.protocol, o_datamodels.UnsetType):
@@ -395,10 +423,12 @@ class OvnProviderDriver(driver_base.ProviderDriver):
 
         if isinstance(admin_state_up, o_datamodels.UnsetType):
             admin_state_up = True
+        lb_id = self._get_pool_loadbalancer_id(member.pool_id)
         request_info = {'id': member.member_id,
                         'address': member.address,
                         'protocol_port': member.protocol_port,
                         'pool_id': member.pool_id,
+                        'loadbalancer_id': lb_id,
                         'subnet_id': subnet_id,
                         'admin_state_up': admin_state_up}
         request = {'type': ovn_const.REQ_TYPE_MEMBER_CREATE,
@@ -411,6 +441,7 @@ class OvnProviderDriver(driver_base.ProviderDriver):
         request_info = {'id': member.member_id,
                         'address': member.address,
                         'pool_id': member.pool_id,
+                        'loadbalancer_id': lb_id,
                         'subnet_id': subnet_id,
                         'action': ovn_const.REQ_INFO_MEMBER_ADDED}
         request = {'type': ovn_const.REQ_TYPE_HANDLE_MEMBER_DVR,
@@ -437,10 +468,12 @@ class OvnProviderDriver(driver_base.ProviderDriver):
                     user_fault_string=msg,
                     operator_fault_string=msg)
 
+        lb_id = self._get_pool_loadbalancer_id(member.pool_id)
         request_info = {'id': member.member_id,
                         'address': member.address,
                         'protocol_port': member.protocol_port,
                         'pool_id': member.pool_id,
+                        'loadbalancer_id': lb_id,
                         'subnet_id': subnet_id}
         request = {'type': ovn_const.REQ_TYPE_MEMBER_DELETE,
                    'info': request_info}
@@ -451,6 +484,7 @@ class OvnProviderDriver(driver_base.ProviderDriver):
         request_info = {'id': member.member_id,
                         'address': member.address,
                         'pool_id': member.pool_id,
+                        'loadbalancer_id': lb_id,
                         'subnet_id': subnet_id,
                         'action': ovn_const.REQ_INFO_MEMBER_DELETED}
         request = {'type': ovn_const.REQ_TYPE_HANDLE_MEMBER_DVR,
@@ -466,6 +500,8 @@ class OvnProviderDriver(driver_base.ProviderDriver):
                         'address': old_member.address,
                         'protocol_port': old_member.protocol_port,
                         'pool_id': old_member.pool_id,
+                        'loadbalancer_id': self._get_pool_loadbalancer_id(
+                            old_member.pool_id),
                         'old_admin_state_up': old_member.admin_state_up}
         if not isinstance(new_member.admin_state_up, o_datamodels.UnsetType):
             request_info['admin_state_up'] = new_member.admin_state_up
@@ -475,6 +511,7 @@ class OvnProviderDriver(driver_base.ProviderDriver):
 
     def member_batch_update(self, pool_id, members):
         request_list = []
+        batch_members = []
         pool_key, ovn_lb = self._ovn_helper._find_ovn_lb_by_pool_id(pool_id)
         external_ids = copy.deepcopy(ovn_lb.external_ids)
         pool = external_ids[pool_key]
@@ -520,37 +557,30 @@ class OvnProviderDriver(driver_base.ProviderDriver):
                 admin_state_up = True
 
             member_info = self._ovn_helper._get_member_info(member)
-            if member_info not in existing_members:
-                req_type = ovn_const.REQ_TYPE_MEMBER_CREATE
-            else:
-                # If member exists in pool, then Update
-                req_type = ovn_const.REQ_TYPE_MEMBER_UPDATE
+            if member_info in existing_members:
                 # Remove all updating members so only deleted ones are left
                 members_to_delete.remove(member_info)
 
-            request_info = {'id': member.member_id,
-                            'address': member.address,
-                            'protocol_port': member.protocol_port,
-                            'pool_id': member.pool_id,
-                            'subnet_id': member.subnet_id,
-                            'admin_state_up': admin_state_up}
-            request = {'type': req_type,
-                       'info': request_info}
-            request_list.append(request)
+            batch_members.append({'id': member.member_id,
+                                  'address': member.address,
+                                  'protocol_port': member.protocol_port,
+                                  'pool_id': member.pool_id,
+                                  'subnet_id': member.subnet_id,
+                                  'admin_state_up': admin_state_up})
+
+        # NOTE: the whole batch is processed by a single request, that adds,
+        # updates and removes the members of the pool in one NB transaction.
+        request_info = {'pool_id': pool_id,
+                        'loadbalancer_id': ovn_lb.name,
+                        'members': batch_members}
+        request = {'type': ovn_const.REQ_TYPE_MEMBER_BATCH_UPDATE,
+                   'info': request_info}
+        request_list.append(request)
 
         for member in members_to_delete:
             member_info = member.split('_')
             member_ip, member_port, subnet_id, member_id = (
                 self._ovn_helper._extract_member_info(member)[0])
-            request_info = {'id': member_info[1],
-                            'address': member_ip,
-                            'protocol_port': member_port,
-                            'pool_id': pool_id}
-            if len(member_info) == 4:
-                request_info['subnet_id'] = subnet_id
-            request = {'type': ovn_const.REQ_TYPE_MEMBER_DELETE,
-                       'info': request_info}
-            request_list.append(request)
 
             # NOTE(mjozefcz): If LB has FIP on VIP
             # and member had FIP we can decentralize
@@ -558,6 +588,7 @@ class OvnProviderDriver(driver_base.ProviderDriver):
             request_info = {'id': member_id,
                             'address': member_ip,
                             'pool_id': pool_id,
+                            'loadbalancer_id': ovn_lb.name,
                             'action': ovn_const.REQ_INFO_MEMBER_DELETED}
             if len(member_info) == 4:
                 request_info['subnet_id'] = subnet_id
@@ -643,6 +674,8 @@ class OvnProviderDriver(driver_base.ProviderDriver):
             admin_state_up = True
         request_info = {'id': healthmonitor.healthmonitor_id,
                         'pool_id': healthmonitor.pool_id,
+                        'loadbalancer_id': self._get_pool_loadbalancer_id(
+                            healthmonitor.pool_id),
                         'type': healthmonitor.type,
                         'interval': healthmonitor.delay,
                         'timeout': healthmonitor.timeout,
@@ -660,6 +693,8 @@ class OvnProviderDriver(driver_base.ProviderDriver):
             admin_state_up = True
         request_info = {'id': new_healthmonitor.healthmonitor_id,
                         'pool_id': old_healthmonitor.pool_id,
+                        'loadbalancer_id': self._get_pool_loadbalancer_id(
+                            old_healthmonitor.pool_id),
                         'interval': new_healthmonitor.delay,
                         'timeout': new_healthmonitor.timeout,
                         'failure_count': new_healthmonitor.max_retries_down,
@@ -671,7 +706,9 @@ class OvnProviderDriver(driver_base.ProviderDriver):
 
     def health_monitor_delete(self, healthmonitor):
         request_info = {'id': healthmonitor.healthmonitor_id,
-                        'pool_id': healthmonitor.pool_id}
+                        'pool_id': healthmonitor.pool_id,
+                        'loadbalancer_id': self._get_pool_loadbalancer_id(
+                            healthmonitor.pool_id)}
         request = {'type': ovn_const.REQ_TYPE_HM_DELETE,
                    'info': request_info}
         self._ovn_helper.add_request(request)
@@ -13,10 +13,13 @@
 #    under the License.
 
 import atexit
+import collections
 import copy
+import functools
 import queue
 import re
 import threading
+import time
 
 import netaddr
 from neutron_lib import constants as n_const
@@ -41,6 +44,9 @@ from ovn_octavia_provider.common import config as ovn_conf
 # TODO(mjozefcz): Start consuming const and utils
 # from neutron-lib once released.
 from ovn_octavia_provider.common import constants as ovn_const
+from ovn_octavia_provider.common import journal
+from ovn_octavia_provider.common import lb_external_ids
+from ovn_octavia_provider.common import metrics
 from ovn_octavia_provider.common import utils
 from ovn_octavia_provider.i18n import _
 from ovn_octavia_provider.ovsdb import impl_idl_ovn
@@ -50,22 +56,323 @@ CONF = cfg.CONF  # Gets Octavia Conf as it runs under o-api domain
 LOG = logging.getLogger(__name__)
 
 
+class RequestsQueue(queue.Queue):
+    """Queue of requests with priority lanes folding the superseded ones
+
+    Requests are split in two FIFO lanes: the health monitor events
+    (hm_update_event requests) and the rest of requests (CRUD operations).
+    When both lanes have pending requests, hm_event_weight events are
+    processed for every other request, so the health status propagation
+    does not depend on the CRUD backlog.
+
+    A request is folded into a previous one still waiting in its lane when
+    both of them refer to the same resource and the later one supersedes
+    the former (e.g. successive updates of the same member or pool, or
+    successive status events of the same backend), so only one operation
+    is executed. The folded request keeps the position of the first one.
+
+    To keep the order of the requests, a request that can not be folded
+    acts as a barrier: later requests are never folded into the ones
+    queued before it in the same lane.
+
+    If a RequestMetrics object is given, the requests queued and folded
+    and the time they wait in the queue are recorded on it.
+    """
+
+    def __init__(self, maxsize=0, hm_event_weight=1, request_metrics=None):
+        self._hm_event_weight = hm_event_weight
+        self._metrics = request_metrics
+        super().__init__(maxsize)
+
+    def _init(self, maxsize):
+        self._lanes = {ovn_const.REQ_LANE_HM_EVENT: collections.deque(),
+                       ovn_const.REQ_LANE_CRUD: collections.deque()}
+        self._pending = {lane: {} for lane in self._lanes}
+        self._hm_events_in_a_row = 0
+
+    def _qsize(self):
+        return sum(len(lane) for lane in self._lanes.values())
+
+    def lanes_qsize(self):
+        with self.mutex:
+            return {lane: len(requests)
+                    for lane, requests in self._lanes.items()}
+
+    def _put(self, item):
+        if self._metrics:
+            self._metrics.request_queued(item['type'])
+        lane = self._get_lane(item)
+        pending_requests = self._pending[lane]
+        key = self._get_coalesce_key(item)
+        pending = pending_requests.get(key) if key else None
+        if pending is not None:
+            self._fold_request(pending, item)
+            if self._metrics:
+                self._metrics.request_folded(item['type'])
+            LOG.debug("Request %(req)s with info %(info)s folded into a "
+                      "queued one", {'req': item['type'],
+                                     'info': item['info']})
+            # NOTE: put() counts the item as a new unfinished task, but
+            # the folded request is finished along with the queued one.
+            self.unfinished_tasks -= 1
+            return
+        if key:
+            pending_requests[key] = item
+        else:
+            pending_requests.clear()
+        self._lanes[lane].append((time.monotonic(), item))
+
+    def _get(self):
+        hm_events = self._lanes[ovn_const.REQ_LANE_HM_EVENT]
+        crud = self._lanes[ovn_const.REQ_LANE_CRUD]
+        if hm_events and (
+                not crud or
+                self._hm_events_in_a_row < self._hm_event_weight):
+            lane = ovn_const.REQ_LANE_HM_EVENT
+            self._hm_events_in_a_row += 1
+        else:
+            lane = ovn_const.REQ_LANE_CRUD
+            self._hm_events_in_a_row = 0
+        queued_at, item = self._lanes[lane].popleft()
+        if self._metrics:
+            self._metrics.request_started(item['type'],
+                                          time.monotonic() - queued_at)
+        key = self._get_coalesce_key(item)
+        if key and self._pending[lane].get(key) is item:
+            del self._pending[lane][key]
+        return item
+
+    @staticmethod
+    def _get_lane(request):
+        if request['type'] == ovn_const.REQ_TYPE_HM_UPDATE_EVENT:
+            return ovn_const.REQ_LANE_HM_EVENT
+        return ovn_const.REQ_LANE_CRUD
+
+    @staticmethod
+    def _get_coalesce_key(request):
+        request_type = request['type']
+        info = request.get('info')
+        if request_type in (ovn_const.REQ_TYPE_MEMBER_UPDATE,
+                            ovn_const.REQ_TYPE_POOL_UPDATE):
+            return (request_type, info[constants.ID])
+        if request_type == ovn_const.REQ_TYPE_HM_UPDATE_EVENT:
+            return (request_type,
+                    tuple(sorted(str(ovn_lb.uuid)
+                                 for ovn_lb in info['ovn_lbs'])),
+                    info['ip'], info['port'])
+        return None
+
+    @staticmethod
+    def _fold_request(pending, request):
+        if request.get(ovn_const.REQ_JOURNAL_IDS):
+            pending.setdefault(ovn_const.REQ_JOURNAL_IDS, []).extend(
+                request[ovn_const.REQ_JOURNAL_IDS])
+        if request['type'] == ovn_const.REQ_TYPE_HM_UPDATE_EVENT:
+            # The last status reported for the backend is the valid one.
+            pending['info'] = request['info']
+            return
+        info = dict(pending['info'], **request['info'])
+        if 'old_admin_state_up' in pending['info']:
+            info['old_admin_state_up'] = pending['info'][
+                'old_admin_state_up']
+        pending['info'] = info
+
+
+class StatusUpdater():
+    """Batch the status updates sent to Octavia
+
+    The statuses returned by the request handlers are buffered and sent by
+    a dedicated thread, so the request workers do not wait for Octavia
+    (including the retries done by update_status). Statuses queued while
+    waiting for the configured interval or while the previous update is
+    in progress are merged per object (the last value reported for each
+    field of the same load balancer, listener, pool, member or health
+    monitor wins) and sent in a single update per load balancer, so the
+    failure of the update of a load balancer does not drop the statuses of
+    the others. Once stopped, the statuses still pending and the ones
+    queued afterwards are sent synchronously.
+    """
+
+    STATUS_KINDS = (constants.LOADBALANCERS, constants.LISTENERS,
+                    constants.POOLS, constants.MEMBERS,
+                    constants.HEALTHMONITORS)
+
+    def __init__(self, update_status, interval=0):
+        self._update_status = update_status
+        self._interval = interval
+        self._condition = threading.Condition()
+        self._pending = {}
+        # Load balancer of every pending object, see add().
+        self._pending_lb_ids = {}
+        self._callbacks = []
+        self._stopped = False
+        self._closed = False
+        self._thread = threading.Thread(target=self._run)
+        self._thread.daemon = True
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self):
+        with self._condition:
+            self._stopped = True
+            self._condition.notify()
+        if (self._thread.is_alive() and
+                self._thread is not threading.current_thread()):
+            self._thread.join()
+        # NOTE: the statuses queued after the thread exited would never be
+        # sent, they are flushed here and add() sends the next ones itself.
+        with self._condition:
+            self._closed = True
+        self._flush()
+
+    def add(self, status, callback=None):
+        """Queue a status update
+
+        :param status: status dict as expected by Octavia.
+        :param callback: function called once the status has been sent.
+        """
+        status = OvnProviderHelper._delete_disabled_from_status(status)
+        # NOTE: the objects of a status reporting several load balancers, or
+        # none, can not be told apart, they are sent in an update of their
+        # own.
+        lb_ids = {lb_status.get(constants.ID)
+                  for lb_status in status.get(constants.LOADBALANCERS, [])}
+        lb_id = lb_ids.pop() if len(lb_ids) == 1 else None
+        with self._condition:
+            for kind in self.STATUS_KINDS:
+                for obj_status in status.get(kind, []):
+                    key = (kind, obj_status.get(constants.ID))
+                    pending = self._pending.setdefault(key, {})
+                    pending.update(obj_status)
+                    self._pending_lb_ids[key] = (
+                        key[1] if kind == constants.LOADBALANCERS else lb_id)
+            if callback:
+                self._callbacks.append(callback)
+            self._condition.notify()
+            closed = self._closed
+        if closed:
+            self._flush()
+
+    def _get_pending(self):
+        with self._condition:
+            statuses = {}
+            for key, obj_status in self._pending.items():
+                status = statuses.setdefault(self._pending_lb_ids[key], {})
+                status.setdefault(key[0], []).append(obj_status)
+            callbacks = self._callbacks
+            self._pending = {}
+            self._pending_lb_ids = {}
+            self._callbacks = []
+            return statuses, callbacks
+
+    def _run(self):
+        while True:
+            with self._condition:
+                while not (self._pending or self._callbacks or
+                           self._stopped):
+                    self._condition.wait()
+                if self._stopped and not (self._pending or self._callbacks):
+                    return
+            if self._interval and not self._stopped:
+                time.sleep(self._interval)
+            self._flush()
+
+    def _flush(self):
+        statuses, callbacks = self._get_pending()
+        for status in statuses.values():
+            try:
+                self._update_status(status)
+            except driver_exceptions.UpdateStatusError as e:
+                LOG.error("Error while updating the load balancer status: %s",
+                          e.fault_string)
+                # TODO(haleyb): The resource(s) we were updating status for
+                # should be cleaned-up
+            except Exception:
+                LOG.exception('Unexpected exception updating the status')
+        for callback in callbacks:
+            try:
+                callback()
+            except Exception:
+                LOG.exception('Unexpected exception in status update '
+                              'callback')
+
+
 class OvnProviderHelper():
 
     def __init__(self, notifier=True):
-        self.requests = queue.Queue()
-        self.helper_thread = threading.Thread(target=self.request_handler)
-        self.helper_thread.daemon = True
+        # Every worker thread owns a requests queue. Requests are dispatched
+        # to them by load balancer (see _get_request_queue), so the ones
+        # related to the same load balancer keep their order.
+        self.metrics = metrics.get_request_metrics()
+        self.requests = [
+            RequestsQueue(
+                hm_event_weight=ovn_conf.get_ovn_hm_event_request_weight(),
+                request_metrics=self.metrics)
+            for _ in range(ovn_conf.get_ovn_request_workers())]
+        for requests in self.requests:
+            self.metrics.add_queue(requests)
+        self.helper_threads = []
+        self._running_workers = len(self.requests)
+        self._workers_lock = threading.Lock()
+        self._shutting_down = False
+        for requests in self.requests:
+            helper_thread = threading.Thread(target=self.request_handler,
+                                             args=(requests,))
+            helper_thread.daemon = True
+            self.helper_threads.append(helper_thread)
         self._octavia_driver_lib = o_driver_lib.DriverLibrary()
         ovsdb_monitor.check_and_set_ssl_files('OVN_Northbound')
         self._init_lb_actions()
 
         i = impl_idl_ovn.OvnNbIdlForLb(notifier=notifier)
+        self._neutron_cache = clients.get_neutron_resource_cache()
+        i.ls_change_callbacks.append(self._neutron_cache.invalidate_network)
         c = connection.Connection(i, ovn_conf.get_ovn_ovsdb_timeout())
         self.ovn_nbdb_api = impl_idl_ovn.OvsdbNbOvnIdl(c)
         atexit.register(self.ovn_nbdb_api.ovsdb_connection.stop)
 
-        self.helper_thread.start()
+        # NOTE: the group commit is optional, as it delays the commit of
+        # every transaction by the latency budget. With a single request
+        # worker there is no other transaction to group with, so it would
+        # only add that latency.
+        self._nb_group_committer = None
+        if ovn_conf.get_ovn_nb_group_commit_latency():
+            if len(self.requests) > 1:
+                self._nb_group_committer = impl_idl_ovn.NbGroupCommitter(
+                    self.ovn_nbdb_api,
+                    ovn_conf.get_ovn_nb_group_commit_latency())
+            else:
+                LOG.warning('Ignoring the [ovn] nb_group_commit_latency '
+                            'option, the group commit requires more than '
+                            'one request worker ([ovn] request_workers).')
+
+        if ovn_conf.get_ovn_metrics_file():
+            metrics.start_file_reporter(
+                ovn_conf.get_ovn_metrics_file(),
+                ovn_conf.get_ovn_metrics_interval())
+
+        self._status_updater = StatusUpdater(
+            self._update_status_to_octavia,
+            interval=ovn_conf.get_ovn_status_update_interval())
+        self._status_updater.start()
+
+        self._journal = None
+        incomplete_requests = []
+        if ovn_conf.get_ovn_request_journal():
+            self._journal = journal.RequestJournal(
+                ovn_conf.get_ovn_request_journal())
+            incomplete_requests = self._journal.claim_incomplete()
+            self._journal.start()
+
+        for helper_thread in self.helper_threads:
+            helper_thread.start()
+
+        for request in incomplete_requests:
+            LOG.info("Replaying request %(req)s with info %(info)s not "
+                     "completed by a previous process",
+                     {'req': request['type'], 'info': request['info']})
+            self.add_request(request)
 
     def _init_lb_actions(self):
         self._lb_request_func_maps = {
@@ -81,6 +388,7 @@ class OvnProviderHelper():
             ovn_const.REQ_TYPE_MEMBER_CREATE: self.member_create,
             ovn_const.REQ_TYPE_MEMBER_DELETE: self.member_delete,
             ovn_const.REQ_TYPE_MEMBER_UPDATE: self.member_update,
+            ovn_const.REQ_TYPE_MEMBER_BATCH_UPDATE: self.member_batch_update,
             ovn_const.REQ_TYPE_LB_CREATE_LRP_ASSOC: self.lb_create_lrp_assoc,
             ovn_const.REQ_TYPE_LB_DELETE_LRP_ASSOC: self.lb_delete_lrp_assoc,
             ovn_const.REQ_TYPE_HANDLE_VIP_FIP: self.handle_vip_fip,
@@ -107,8 +415,50 @@ class OvnProviderHelper():
             for k, v in status.items()}
 
     def shutdown(self):
-        self.requests.put({'type': ovn_const.REQ_TYPE_EXIT},
-                          timeout=ovn_const.MAX_TIMEOUT_REQUEST)
+        """Ask the workers to exit, without waiting for them
+
+        It is called when the driver is garbage collected, in an API
+        thread, so it must not block. The workers exit once they have
+        processed the requests already queued (see _worker_exited).
+        """
+        with self._workers_lock:
+            if self._shutting_down:
+                return
+            self._shutting_down = True
+        for requests in self.requests:
+            requests.put({'type': ovn_const.REQ_TYPE_EXIT},
+                         timeout=ovn_const.MAX_TIMEOUT_REQUEST)
+
+    def stop(self, timeout=ovn_const.MAX_TIMEOUT_STOP):
+        """Stop the workers, waiting up to timeout seconds for them
+
+        Used by the driver agent when exiting, so the requests already
+        queued are processed and their statuses sent to Octavia. The last
+        metrics report of the process is written then.
+        """
+        self.shutdown()
+        deadline = time.monotonic() + timeout
+        for helper_thread in self.helper_threads:
+            if helper_thread is threading.current_thread():
+                continue
+            helper_thread.join(max(0, deadline - time.monotonic()))
+            if helper_thread.is_alive():
+                LOG.warning('The OVN provider request workers did not '
+                            'finish in %s seconds', timeout)
+                break
+        metrics.stop_file_reporter()
+
+    def _worker_exited(self):
+        # NOTE: the last worker exiting sends the statuses still pending to
+        # Octavia, which completes their journal entries, and then stops
+        # the journal.
+        with self._workers_lock:
+            self._running_workers -= 1
+            if self._running_workers:
+                return
+        self._status_updater.stop()
+        if self._journal:
+            self._journal.stop()
 
     @staticmethod
     def _map_val(row, col, key):
@@ -348,6 +698,7 @@ class OvnProviderHelper():
         for lb in ovn_lbs:
             port = neutron_client.get_port(vip_lp.name)
             request_info = {'ovn_lb': lb,
+                            'loadbalancer_id': lb.name,
                             'vip_fip': fip,
                             'vip_related': [],
                             'additional_vip_fip': additional_vip,
@@ -383,39 +734,86 @@ class OvnProviderHelper():
         return self.ovn_nbdb_api.find_lb_in_table(
             lb, table).execute(check_error=True)
 
-    def request_handler(self):
+    def request_handler(self, requests):
         while True:
             try:
-                request = self.requests.get(
+                request = requests.get(
                     timeout=ovn_const.MAX_TIMEOUT_REQUEST)
             except queue.Empty:
                 continue
 
             request_type = request['type']
             if request_type == ovn_const.REQ_TYPE_EXIT:
+                self._worker_exited()
                 break
 
             request_handler = self._lb_request_func_maps.get(request_type)
+            status = None
             try:
                 if request_handler:
                     LOG.debug("Handling request %(req)s with info %(info)s",
                               {'req': request_type, 'info': request['info']})
-                    status = request_handler(request['info'])
-                    if status:
-                        self._update_status_to_octavia(status)
-                self.requests.task_done()
-            except driver_exceptions.UpdateStatusError as e:
-                LOG.error("Error while updating the load balancer status: %s",
-                          e.fault_string)
-                # TODO(haleyb): The resource(s) we were updating status for
-                # should be cleaned-up
+                    start = time.monotonic()
+                    try:
+                        status = request_handler(request['info'])
+                    except Exception:
+                        self.metrics.request_processed(
+                            request_type, time.monotonic() - start,
+                            result=metrics.REQUEST_RESULT_ERROR)
+                        raise
+                    self.metrics.request_processed(
+                        request_type, time.monotonic() - start)
+                requests.task_done()
             except Exception:
                 # If any unexpected exception happens we don't want the
                 # notify_loop to exit.
                 LOG.exception('Unexpected exception in request_handler')
 
+            # NOTE: journaled requests are completed once their status has
+            # been sent to Octavia, so the objects are not left in PENDING
+            # status if the process stops before.
+            callback = None
+            if self._journal and request.get(ovn_const.REQ_JOURNAL_IDS):
+                callback = functools.partial(
+                    self._journal.complete,
+                    request[ovn_const.REQ_JOURNAL_IDS])
+            if status:
+                self._status_updater.add(status, callback=callback)
+            elif callback:
+                callback()
+
     def add_request(self, req):
-        self.requests.put(req, timeout=ovn_const.MAX_TIMEOUT_REQUEST)
+        if (self._journal and
+                req['type'] in ovn_const.REQ_TYPES_JOURNALED and
+                ovn_const.REQ_JOURNAL_IDS not in req):
+            req[ovn_const.REQ_JOURNAL_IDS] = [self._journal.record(req)]
+        self._get_request_queue(req).put(
+            req, timeout=ovn_const.MAX_TIMEOUT_REQUEST)
+
+    def _get_request_queue(self, req):
+        if len(self.requests) == 1:
+            return self.requests[0]
+        shard_key = self._get_request_shard_key(req)
+        if shard_key is None:
+            return self.requests[0]
+        return self.requests[hash(shard_key) % len(self.requests)]
+
+    def _get_request_shard_key(self, req):
+        """Return the load balancer the request is related to
+
+        The requests are distributed among the worker threads using the
+        load balancer id (the Load_Balancer name in OVN NB), so all the
+        requests related to the same load balancer are processed in order.
+        The driver sets the loadbalancer_id of every request related to a
+        load balancer, including the pool, member and health monitor ones.
+
+        :returns: the shard key, or None if the request is not related to
+                  any load balancer (e.g. LRP association requests).
+        """
+        info = req.get('info')
+        if not isinstance(info, dict):
+            return None
+        return info.get('loadbalancer_id')
 
     @tenacity.retry(
         retry=tenacity.retry_if_exception_type(
@@ -470,6 +868,14 @@ class OvnProviderHelper():
             LOG.warn(f"Cannot get client from neutron {e}")
             return None
 
+    def _get_subnet(self, neutron_client, subnet_id):
+        """Return the cached attributes of a Neutron subnet"""
+        return self._neutron_cache.get_subnet(neutron_client, subnet_id)
+
+    def _get_network(self, neutron_client, network_id):
+        """Return the cached attributes of a Neutron network"""
+        return self._neutron_cache.get_network(neutron_client, network_id)
+
     def _get_vip_port_and_subnet_from_lb(self, neutron_client, vip_port_id,
                                          vip_net_id, vip_address,
                                          subnet_requested=True):
@@ -551,7 +957,7 @@ class OvnProviderHelper():
                               loadbalancer):
         # NOTE(ltomasbo): If the VIP is on a provider network, it does
         # not need to be associated to its LS
-        network = neutron_client.get_network(port.network_id)
+        network = self._get_network(neutron_client, port.network_id)
         if network and not network.provider_physical_network:
             # NOTE(froyo): This is the association of the lb to the VIP ls
             # so this is executed right away. For the additional vip ports
@@ -752,7 +1158,8 @@ class OvnProviderHelper():
         """Retrieve the logical router related to the member's subnet."""
         neutron_client = clients.get_neutron_client()
         try:
-            subnet = neutron_client.get_subnet(member[constants.SUBNET_ID])
+            subnet = self._get_subnet(neutron_client,
+                                      member[constants.SUBNET_ID])
             ls_name = utils.ovn_name(subnet.network_id)
             ovn_ls = self.ovn_nbdb_api.ls_get(ls_name).execute(
                 check_error=True)
@@ -788,8 +1195,7 @@ class OvnProviderHelper():
         :raises:  RowNotFound can be generated if the LoadBalancer is not
                   found.
         """
-        lbs = self.ovn_nbdb_api.db_find_rows(
-            'Load_Balancer', ('name', '=', lb_id)).execute()
+        lbs = self.ovn_nbdb_api.get_lbs_by_name(lb_id).execute()
         if not protocol:
             if lbs:
                 return lbs
@@ -875,15 +1281,12 @@ class OvnProviderHelper():
         return self._find_ovn_lbs(lb_id, protocol=protocol)
 
     def _find_ovn_lb_with_pool_key(self, pool_key):
-        lbs = self.ovn_nbdb_api.db_list_rows(
-            'Load_Balancer').execute(check_error=True)
-        for lb in lbs:
-            # Skip load balancers used by port forwarding plugin
-            if lb.external_ids.get(ovn_const.OVN_DEVICE_OWNER_EXT_ID_KEY) == (
-                    ovn_const.PORT_FORWARDING_PLUGIN):
-                continue
-            if pool_key in lb.external_ids:
-                return lb
+        # NOTE: the index skips the load balancers used by the port
+        # forwarding plugin.
+        lbs = self.ovn_nbdb_api.get_lbs_by_pool_key(pool_key).execute(
+            check_error=True)
+        if lbs:
+            return lbs[0]
 
     def _find_ovn_lb_by_pool_id(self, pool_id):
         pool_key = self._get_pool_key(pool_id)
@@ -904,7 +1307,7 @@ class OvnProviderHelper():
         if lb and lb.vip_subnet_id:
             neutron_client = clients.get_neutron_client()
             try:
-                subnet = neutron_client.get_subnet(lb.vip_subnet_id)
+                subnet = self._get_subnet(neutron_client, lb.vip_subnet_id)
                 vip_subnet_cidr = subnet.cidr
             except openstack.exceptions.ResourceNotFound:
                 LOG.warning('Subnet %s not found while trying to '
@@ -914,7 +1317,9 @@ class OvnProviderHelper():
         return None, None
 
     def _execute_commands(self, commands):
-        if commands:
+        if commands and self._nb_group_committer:
+            self._nb_group_committer.execute(commands)
+        elif commands:
             with self.ovn_nbdb_api.transaction(check_error=True) as txn:
                 for command in commands:
                     txn.add(command)
@@ -941,11 +1346,14 @@ class OvnProviderHelper():
                                            subnet_id=None, associate=True,
                                            update_ls_ref=True,
                                            additional_vips=True,
-                                           is_sync=False):
+                                           is_sync=False, ls_refs=None):
         """Update LB association with Logical Switch
 
            This function deals with updating the References of Logical Switch
            in LB and addition of LB to LS.
+           If ls_refs is given, it is updated instead of a copy of the LB
+           references, so several associations can be computed before
+           storing them.
         """
         ovn_ls = None
         commands = []
@@ -959,7 +1367,7 @@ class OvnProviderHelper():
             if not neutron_client:
                 return []
             try:
-                subnet = neutron_client.get_subnet(subnet_id)
+                subnet = self._get_subnet(neutron_client, subnet_id)
                 ls_name = utils.ovn_name(subnet.network_id)
             except openstack.exceptions.ResourceNotFound:
                 LOG.warning('Subnet %s not found while trying to '
@@ -988,14 +1396,9 @@ class OvnProviderHelper():
                         skip_ls_lb_actions = True
                         break
 
-        ls_refs = ovn_lb.external_ids.get(ovn_const.LB_EXT_IDS_LS_REFS_KEY)
-        if ls_refs:
-            try:
-                ls_refs = jsonutils.loads(ls_refs)
-            except ValueError:
-                ls_refs = {}
-        else:
-            ls_refs = {}
+        if ls_refs is None:
+            # Copied, as it is updated below.
+            ls_refs = dict(impl_idl_ovn.get_lb_external_ids(ovn_lb).ls_refs)
 
         if skip_ls_lb_actions:
             if ls_name not in ls_refs:
@@ -1038,13 +1441,8 @@ class OvnProviderHelper():
         if update_ls_ref:
             check_ls_refs = False
             if is_sync:
-                ovn_ls_refs = ovn_lb.external_ids.get(
-                    ovn_const.LB_EXT_IDS_LS_REFS_KEY, {})
-                if ovn_ls_refs:
-                    try:
-                        ovn_ls_refs = jsonutils.loads(ovn_ls_refs)
-                    except ValueError:
-                        ovn_ls_refs = {}
+                ovn_ls_refs = impl_idl_ovn.get_lb_external_ids(
+                    ovn_lb).ls_refs
                 if ovn_ls_refs.keys() == ls_refs.keys():
                     check_ls_refs = True
             if not check_ls_refs:
@@ -1209,16 +1607,10 @@ class OvnProviderHelper():
         if not lrp_name:
             return
 
-        lrs = self.ovn_nbdb_api.get_lrs().execute(check_error=True)
-        for lr in lrs:
-            for lrp in lr.ports:
-                if lrp.name == lrp_name:
-                    return lr
-            # Handles networks with only gateway port in the router
-            if (utils.ovn_lrouter_port_name(
-                    lr.external_ids.get(ovn_const.OVN_GW_PORT_EXT_ID_KEY)) ==
-                    lrp_name):
-                return lr
+        lrs = self.ovn_nbdb_api.get_lrs_by_lrp_name(lrp_name).execute(
+            check_error=True)
+        if lrs:
+            return lrs[0]
 
     def _get_listener_key(self, listener_id, is_enabled=True):
         listener_key = ovn_const.LB_EXT_IDS_LISTENER_PREFIX + str(listener_id)
@@ -1233,16 +1625,8 @@ class OvnProviderHelper():
         return pool_key
 
     def _extract_member_info(self, member):
-        mem_info = []
-        if member:
-            for mem in member.split(','):
-                mem_split = mem.split('_')
-                mem_id = mem_split[1]
-                mem_ip_port = mem_split[2]
-                mem_ip, mem_port = mem_ip_port.rsplit(':', 1)
-                mem_subnet = mem_split[3]
-                mem_info.append((mem_ip, mem_port, mem_subnet, mem_id))
-        return mem_info
+        return [mem.as_tuple()
+                for mem in lb_external_ids.parse_members(member)]
 
     def _get_member_info(self, member):
         member_info = ''
@@ -1269,104 +1653,81 @@ class OvnProviderHelper():
         else:
             return (None, None)
 
-    def _is_listener_disabled(self, listener_key):
-        v = listener_key.split(':')
-        if len(v) == 2 and v[1] == ovn_const.DISABLED_RESOURCE_SUFFIX:
-            return True
-
-        return False
-
     def _get_pool_listeners(self, ovn_lb, pool_key):
-        pool_listeners = []
-        for k, v in ovn_lb.external_ids.items():
-            if ovn_const.LB_EXT_IDS_LISTENER_PREFIX not in k:
-                continue
-            vip_port, p_key = self._extract_listener_key_value(v)
-            if pool_key == p_key:
-                pool_listeners.append(
-                    k[len(ovn_const.LB_EXT_IDS_LISTENER_PREFIX):])
-        return pool_listeners
+        return impl_idl_ovn.get_lb_external_ids(
+            ovn_lb).get_pool_listeners(pool_key)
 
     def _get_pool_listener_port(self, ovn_lb, pool_key):
-        for k, v in ovn_lb.external_ids.items():
-            if ovn_const.LB_EXT_IDS_LISTENER_PREFIX not in k:
-                continue
-            vip_port, p_key = self._extract_listener_key_value(v)
-            if pool_key == p_key:
-                return vip_port
-        return None
-
-    def _is_member_offline(self, ovn_lb, member_id):
-        return constants.OFFLINE == self._find_member_status(ovn_lb, member_id)
+        return impl_idl_ovn.get_lb_external_ids(
+            ovn_lb).get_pool_listener_port(pool_key)
 
-    def _frame_vip_ips(self, ovn_lb, lb_external_ids):
+    def _frame_vip_ips(self, ovn_lb, lb_external_ids,
+                       offline_member_ids=None):
         vip_ips = {}
+        lb_ext_ids = impl_idl_ovn.get_lb_external_ids(ovn_lb, lb_external_ids)
         # If load balancer is disabled, return
-        if lb_external_ids.get('enabled') == 'False':
+        if not lb_ext_ids.enabled:
             return vip_ips
-        lb_vips = []
-        if ovn_const.LB_EXT_IDS_VIP_KEY in lb_external_ids:
-            lb_vips.append(lb_external_ids.get(ovn_const.LB_EXT_IDS_VIP_KEY))
-        if ovn_const.LB_EXT_IDS_ADDIT_VIP_KEY in lb_external_ids:
-            lb_vips.extend(lb_external_ids.get(
-                ovn_const.LB_EXT_IDS_ADDIT_VIP_KEY).split(','))
-
-        vip_fip = lb_external_ids.get(ovn_const.LB_EXT_IDS_VIP_FIP_KEY)
-        additional_vip_fips = lb_external_ids.get(
-            ovn_const.LB_EXT_IDS_ADDIT_VIP_FIP_KEY)
-
-        for k, v in lb_external_ids.items():
-            if (ovn_const.LB_EXT_IDS_LISTENER_PREFIX not in k or
-                    self._is_listener_disabled(k)):
+        lb_vips = lb_ext_ids.vips
+        vip_fip = lb_ext_ids.vip_fip
+        additional_vip_fips = lb_ext_ids.additional_vip_fips
+        # The member statuses are the ones stored in the LB, unless the
+        # caller is updating them in the same transaction.
+        if offline_member_ids is None:
+            offline_member_ids = impl_idl_ovn.get_lb_external_ids(
+                ovn_lb).offline_member_ids
+
+        for listener in lb_ext_ids.listeners.values():
+            if not listener.enabled:
                 continue
 
-            vip_port, pool_id = self._extract_listener_key_value(v)
-            if not vip_port or not pool_id:
+            vip_port = listener.port
+            if not vip_port or not listener.pool_key:
                 continue
 
-            if pool_id not in lb_external_ids or not lb_external_ids[pool_id]:
+            pool = lb_ext_ids.pools.get(listener.pool_key)
+            if not pool or not pool.value:
                 continue
 
-            ips_v4 = []
-            ips_v6 = []
-            for mb_ip, mb_port, mb_subnet, mb_id in self._extract_member_info(
-                    lb_external_ids[pool_id]):
-                if not self._is_member_offline(ovn_lb, mb_id):
-                    if netaddr.IPNetwork(
-                            mb_ip).version == n_const.IP_VERSION_6:
-                        ips_v6.append(f'[{mb_ip}]:{mb_port}')
-                    else:
-                        ips_v4.append(f'{mb_ip}:{mb_port}')
+            # NOTE: the backends of the pools not changed are not computed
+            # again, see Pool.get_backends.
+            ips_v4, ips_v6 = pool.get_backends(offline_member_ids)
 
             for lb_vip in lb_vips:
-                if ips_v4 and netaddr.IPNetwork(
-                        lb_vip).version == n_const.IP_VERSION_4:
-                    vip_ips[lb_vip + ':' + vip_port] = ','.join(ips_v4)
-                if ips_v6 and netaddr.IPNetwork(
-                        lb_vip).version == n_const.IP_VERSION_6:
+                if ips_v4 and utils.get_ip_version(
+                        lb_vip) == n_const.IP_VERSION_4:
+                    vip_ips[lb_vip + ':' + vip_port] = ips_v4
+                if ips_v6 and utils.get_ip_version(
+                        lb_vip) == n_const.IP_VERSION_6:
                     lb_vip = f'[{lb_vip}]'
-                    vip_ips[lb_vip + ':' + vip_port] = ','.join(ips_v6)
+                    vip_ips[lb_vip + ':' + vip_port] = ips_v6
 
             if ips_v4 and vip_fip:
-                if netaddr.IPNetwork(vip_fip).version == n_const.IP_VERSION_4:
-                    vip_ips[vip_fip + ':' + vip_port] = ','.join(ips_v4)
+                if utils.get_ip_version(vip_fip) == n_const.IP_VERSION_4:
+                    vip_ips[vip_fip + ':' + vip_port] = ips_v4
 
             if ips_v4 and additional_vip_fips:
-                for addi_vip_fip in additional_vip_fips.split(','):
-                    if netaddr.IPNetwork(
-                            addi_vip_fip).version == n_const.IP_VERSION_4:
-                        vip_ips[addi_vip_fip + ':' + vip_port] = ','.join(
-                            ips_v4)
+                for addi_vip_fip in additional_vip_fips:
+                    if utils.get_ip_version(
+                            addi_vip_fip) == n_const.IP_VERSION_4:
+                        vip_ips[addi_vip_fip + ':' + vip_port] = ips_v4
         return vip_ips
 
-    def _refresh_lb_vips(self, ovn_lb, lb_external_ids, is_sync=False):
-        vip_ips = self._frame_vip_ips(ovn_lb, lb_external_ids)
-        if is_sync and ovn_lb.vips == vip_ips:
+    def _refresh_lb_vips(self, ovn_lb, lb_external_ids,
+                         offline_member_ids=None):
+        vip_ips = self._frame_vip_ips(ovn_lb, lb_external_ids,
+                                      offline_member_ids=offline_member_ids)
+        # NOTE: only the VIPs added, removed or with different backends are
+        # written, so the size of the transaction (and the work done by
+        # northd and ovn-controller) does not depend on the size of the LB.
+        vips = ovn_lb.vips
+        vips_to_set = {vip: backends for vip, backends in vip_ips.items()
+                       if vips.get(vip) != backends}
+        vips_to_del = [vip for vip in vips if vip not in vip_ips]
+        if not vips_to_set and not vips_to_del:
             return []
-        return [self.ovn_nbdb_api.db_clear('Load_Balancer', ovn_lb.uuid,
-                                           'vips'),
-                self.ovn_nbdb_api.db_set('Load_Balancer', ovn_lb.uuid,
-                                         ('vips', vip_ips))]
+        return [self.ovn_nbdb_api.lb_update_vips(ovn_lb.uuid, vips_to_set,
+                                                 vips_to_del)]
 
     def _is_listener_in_lb(self, lb):
         for key in list(lb.external_ids):
@@ -1401,18 +1762,22 @@ class OvnProviderHelper():
             for ip in port.fixed_ips:
                 if ip.get('ip_address') == address:
                     if subnet_required:
-                        subnet = neutron_client.get_subnet(ip.get('subnet_id'))
+                        subnet = self._get_subnet(neutron_client,
+                                                  ip.get('subnet_id'))
                     break
         elif network_id and address:
-            ports = self._neutron_list_ports(neutron_client,
-                                             network_id=network_id)
+            # NOTE: the ports are filtered by address on the Neutron side,
+            # instead of listing all the ports of the network.
+            ports = self._neutron_list_ports(
+                neutron_client, network_id=network_id,
+                fixed_ips=['ip_address=%s' % address])
             for p in ports:
                 for ip in p.fixed_ips:
                     if ip.get('ip_address') == address:
                         port = p
                         if subnet_required:
-                            subnet = neutron_client.get_subnet(
-                                ip.get('subnet_id'))
+                            subnet = self._get_subnet(
+                                neutron_client, ip.get('subnet_id'))
                         break
         return port, subnet
 
@@ -1594,7 +1959,7 @@ class OvnProviderHelper():
 
             # NOTE(ltomasbo): If the VIP is on a provider network, it does
             # not need to be associated to its LS
-            network = neutron_client.get_network(port.network_id)
+            network = self._get_network(neutron_client, port.network_id)
             if not network.provider_physical_network:
                 # NOTE(froyo): This is the association of the lb to the VIP ls
                 # so this is executed right away. For the additional vip ports
@@ -1777,6 +2142,7 @@ class OvnProviderHelper():
             for key, value in ovn_lb.external_ids.items():
                 if key.startswith(ovn_const.LB_EXT_IDS_POOL_PREFIX):
                     pool_id = key.split('_')[1]
+                    members_dvr_info = []
                     # Delete all members in the pool
                     if value and len(value.split(',')) > 0:
                         for mem_info in value.split(','):
@@ -1792,18 +2158,19 @@ class OvnProviderHelper():
                                 'pool_id': pool_id,
                                 'subnet_id': member_subnet}
                             self.member_delete(member)
-                            member_info = {
+                            members_dvr_info.append({
                                 'id': member_id,
                                 'address': member_ip,
                                 'pool_id': pool_id,
                                 'subnet_id': member_subnet,
-                                'action': ovn_const.REQ_INFO_MEMBER_DELETED}
-                            self.handle_member_dvr(member_info)
+                                'action': ovn_const.REQ_INFO_MEMBER_DELETED})
 
                             status[constants.MEMBERS].append({
                                 constants.ID: mem_info.split('_')[1],
                                 constants.PROVISIONING_STATUS:
                                     constants.DELETED})
+                    if members_dvr_info:
+                        self.handle_members_dvr(pool_id, members_dvr_info)
                     status[constants.POOLS].append(
                         {constants.ID: pool_id,
                          constants.PROVISIONING_STATUS: constants.DELETED})
@@ -1820,12 +2187,7 @@ class OvnProviderHelper():
                 self.ovn_nbdb_api.db_clear('Load_Balancer', ovn_lb.uuid,
                                            'health_check'))
 
-        ls_refs = ovn_lb.external_ids.get(ovn_const.LB_EXT_IDS_LS_REFS_KEY, {})
-        if ls_refs:
-            try:
-                ls_refs = jsonutils.loads(ls_refs)
-            except ValueError:
-                ls_refs = {}
+        ls_refs = impl_idl_ovn.get_lb_external_ids(ovn_lb).ls_refs
         for ls_name in ls_refs.keys():
             try:
                 ovn_ls = self.ovn_nbdb_api.ls_get(ls_name).execute(
@@ -2030,8 +2392,7 @@ class OvnProviderHelper():
         self._update_protocol_if_needed(listener, ovn_lb, commands)
 
         try:
-            commands.extend(self._refresh_lb_vips(
-                ovn_lb, external_ids, is_sync=True))
+            commands.extend(self._refresh_lb_vips(ovn_lb, external_ids))
         except Exception as e:
             LOG.exception(f"Failed to refresh LB VIPs: {e}")
             return
@@ -2479,82 +2840,69 @@ class OvnProviderHelper():
 
     def _find_member_status(self, ovn_lb, member_id):
         # NOTE (froyo): Search on lb.external_ids under tag
-        # neutron:member_status, if member not found we will return
+        # neutron:member_status (or the neutron:member_status:<member_id>
+        # key of the member), if member not found we will return
         # NO_MONITOR
-        try:
-            existing_members = ovn_lb.external_ids.get(
-                ovn_const.OVN_MEMBER_STATUS_KEY)
-            existing_members = jsonutils.loads(existing_members)
-            return existing_members[member_id]
-        except TypeError:
-            LOG.debug("no member status on external_ids: %s",
-                      str(existing_members))
-        except KeyError:
-            LOG.debug("Error member_id %s not found on member_status",
-                      str(member_id))
+        member_statuses = impl_idl_ovn.get_lb_external_ids(
+            ovn_lb).member_statuses
+        if member_id in member_statuses:
+            return member_statuses[member_id]
+        LOG.debug("Member_id %s not found on member_status", str(member_id))
         return constants.NO_MONITOR
 
     def _update_member_statuses(self, ovn_lb, pool_id, provisioning_status,
                                 operating_status):
         member_statuses = []
-        existing_members = ovn_lb.external_ids.get(
-            ovn_const.LB_EXT_IDS_POOL_PREFIX + str(pool_id))
-        if len(existing_members) > 0:
-            for mem_info in existing_members.split(','):
-                member_statuses.append({
-                    constants.ID: mem_info.split('_')[1],
-                    constants.PROVISIONING_STATUS: provisioning_status,
-                    constants.OPERATING_STATUS: operating_status})
-                self._update_external_ids_member_status(
-                    ovn_lb,
-                    mem_info.split('_')[1],
-                    operating_status)
+        for member in impl_idl_ovn.get_lb_external_ids(ovn_lb).get_members(
+                self._get_pool_key(pool_id)):
+            member_statuses.append({
+                constants.ID: member.id,
+                constants.PROVISIONING_STATUS: provisioning_status,
+                constants.OPERATING_STATUS: operating_status})
+            self._update_external_ids_member_status(
+                ovn_lb, member.id, operating_status)
         return member_statuses
 
-    def _update_external_ids_member_status(self, ovn_lb, member, status=None,
-                                           delete=False):
-        existing_members = ovn_lb.external_ids.get(
-            ovn_const.OVN_MEMBER_STATUS_KEY)
-        try:
-            existing_members = jsonutils.loads(existing_members)
-        except TypeError:
-            LOG.debug("no member status on external_ids: %s",
-                      str(existing_members))
-            existing_members = {}
+    def _get_member_status_commands(self, ovn_lb, member, status=None,
+                                    delete=False):
+        """Return the commands storing the status of a member in the LB
 
+        The commands are meant to be committed in the same transaction as
+        the rest of the changes of the member operation, so the vips and the
+        member statuses are always updated together. Only the key of the
+        member is written, unless the LB still has the legacy
+        neutron:member_status key, which is then migrated to per member keys.
+        """
+        lb_ext_ids = impl_idl_ovn.get_lb_external_ids(ovn_lb)
+        member_statuses = {}
+        keys_to_del = []
+        if lb_ext_ids.has_legacy_member_status:
+            member_statuses.update(lb_ext_ids.member_statuses)
+            keys_to_del.append(ovn_const.OVN_MEMBER_STATUS_KEY)
         if delete:
-            if member in existing_members:
-                del existing_members[member]
+            member_statuses.pop(member, None)
+            keys_to_del.append(lb_external_ids.get_member_status_key(member))
         else:
-            existing_members[member] = status
+            member_statuses[member] = status
+        return [self.ovn_nbdb_api.lb_update_external_ids(
+            ovn_lb.uuid,
+            lb_external_ids.get_member_status_keys(member_statuses),
+            keys_to_del)]
 
+    def _update_external_ids_member_status(self, ovn_lb, member, status=None,
+                                           delete=False):
         try:
-            if existing_members:
-                member_status = {
-                    ovn_const.OVN_MEMBER_STATUS_KEY:
-                        jsonutils.dumps(existing_members)}
-                self.ovn_nbdb_api.db_set(
-                    'Load_Balancer', ovn_lb.uuid,
-                    ('external_ids', member_status)).execute()
-            else:
-                self.ovn_nbdb_api.db_remove(
-                    'Load_Balancer', ovn_lb.uuid, 'external_ids',
-                    (ovn_const.OVN_MEMBER_STATUS_KEY)).execute()
+            self._execute_commands(self._get_member_status_commands(
+                ovn_lb, member, status=status, delete=delete))
         except Exception:
             LOG.exception("Error storing member status on external_ids member:"
                           " %s delete: %s status: %s", str(member),
                           str(delete), str(status))
 
     def _get_members_in_ovn_lb(self, ovn_lb, pool_key):
-        existing_members = ovn_lb.external_ids.get(pool_key, None)
-        if existing_members:
-            existing_members = existing_members.split(",")
-            return [
-                self._extract_member_info(
-                    member)[0] for member in existing_members
-            ]
-        else:
-            return []
+        return [member.as_tuple() for member in
+                impl_idl_ovn.get_lb_external_ids(ovn_lb).get_members(
+                    pool_key)]
 
     def member_sync(self, member, ovn_lb, pool_key):
         """Sync Member object with an OVN LoadBalancer
@@ -2580,8 +2928,7 @@ class OvnProviderHelper():
 
         try:
             if member.get(constants.ADMIN_STATE_UP, False):
-                commands.extend(self._refresh_lb_vips(
-                    ovn_lb, external_ids, is_sync=True))
+                commands.extend(self._refresh_lb_vips(ovn_lb, external_ids))
         except Exception as e:
             LOG.exception(f"Failed to refresh LB VIPs: {e}")
             return
@@ -2612,7 +2959,7 @@ class OvnProviderHelper():
             member[constants.ID],
             constants.NO_MONITOR)
 
-    def _add_member(self, member, ovn_lb, pool_key):
+    def _add_member(self, member, ovn_lb, pool_key, operating_status=None):
         external_ids = copy.deepcopy(ovn_lb.external_ids)
         existing_members = external_ids[pool_key]
         if existing_members:
@@ -2638,6 +2985,11 @@ class OvnProviderHelper():
         if member.get(constants.ADMIN_STATE_UP, False):
             commands.extend(self._refresh_lb_vips(ovn_lb, external_ids))
 
+        # The status of the member, if already known, is stored with it.
+        if operating_status:
+            commands.extend(self._get_member_status_commands(
+                ovn_lb, member[constants.ID], operating_status))
+
         # Note (froyo): commands are now splitted to separate atomic process,
         # leaving outside the not mandatory ones to allow add_member
         # finish correctly
@@ -2654,7 +3006,7 @@ class OvnProviderHelper():
         neutron_client = clients.get_neutron_client()
         ovn_lr = None
         try:
-            subnet = neutron_client.get_subnet(subnet_id)
+            subnet = self._get_subnet(neutron_client, subnet_id)
             ls_name = utils.ovn_name(subnet.network_id)
             ovn_ls = self.ovn_nbdb_api.ls_get(ls_name).execute(
                 check_error=True)
@@ -2678,10 +3030,18 @@ class OvnProviderHelper():
 
     def member_create(self, member):
         new_member = None
+        stored_status = None
         try:
             pool_key, ovn_lb = self._find_ovn_lb_by_pool_id(
                 member[constants.POOL_ID])
-            new_member = self._add_member(member, ovn_lb, pool_key)
+            # NOTE: the status is stored with the member unless it depends
+            # on the health check of the member, set up once it is added.
+            if not member[constants.ADMIN_STATE_UP]:
+                stored_status = constants.OFFLINE
+            elif not ovn_lb.health_check:
+                stored_status = constants.NO_MONITOR
+            new_member = self._add_member(member, ovn_lb, pool_key,
+                                          operating_status=stored_status)
             operating_status = constants.NO_MONITOR
         except Exception:
             LOG.exception(ovn_const.EXCEPTION_MSG, "creation of member")
@@ -2699,10 +3059,11 @@ class OvnProviderHelper():
                 if mb_status != constants.ONLINE else mb_status
             )
 
-        self._update_external_ids_member_status(
-            ovn_lb,
-            member[constants.ID],
-            operating_status)
+        if not (new_member and stored_status):
+            self._update_external_ids_member_status(
+                ovn_lb,
+                member[constants.ID],
+                operating_status)
 
         status = self._get_current_operating_statuses(ovn_lb)
         return status
@@ -2733,6 +3094,8 @@ class OvnProviderHelper():
             external_ids[pool_key] = ",".join(existing_members)
             commands.extend(
                 self._refresh_lb_vips(ovn_lb, external_ids))
+            commands.extend(self._get_member_status_commands(
+                ovn_lb, member[constants.ID], delete=True))
             self._execute_commands(commands)
             self._update_lb_to_ls_association(
                 ovn_lb, subnet_id=member.get(constants.SUBNET_ID),
@@ -2743,22 +3106,22 @@ class OvnProviderHelper():
             LOG.warning(msg)
 
     def _members_in_subnet(self, ovn_lb, subnet_id):
-        for key, value in ovn_lb.external_ids.items():
-            if key.startswith(ovn_const.LB_EXT_IDS_POOL_PREFIX):
-                if value and len(value.split(',')) > 0:
-                    for m_info in value.split(','):
-                        mem_id, mem_ip_port, mem_subnet = m_info.split('_')[1:]
-                        if mem_subnet == subnet_id:
-                            return True
+        for pool in impl_idl_ovn.get_lb_external_ids(ovn_lb).pools.values():
+            for member in pool.members:
+                if member.subnet_id == subnet_id:
+                    return True
         return False
 
     def member_delete(self, member):
         error_deleting_member = False
+        status_removed = False
         try:
             pool_key, ovn_lb = self._find_ovn_lb_by_pool_id(
                 member[constants.POOL_ID])
 
-            self._remove_member(member, ovn_lb, pool_key)
+            # The status of the member is removed with it.
+            status_removed = bool(
+                self._remove_member(member, ovn_lb, pool_key))
 
             if ovn_lb.health_check:
                 mem_subnet = member[constants.SUBNET_ID]
@@ -2771,8 +3134,9 @@ class OvnProviderHelper():
         except Exception:
             LOG.exception(ovn_const.EXCEPTION_MSG, "deletion of member")
             error_deleting_member = True
-        self._update_external_ids_member_status(
-            ovn_lb, member[constants.ID], None, delete=True)
+        if not status_removed:
+            self._update_external_ids_member_status(
+                ovn_lb, member[constants.ID], None, delete=True)
         status = self._get_current_operating_statuses(ovn_lb)
         status[constants.MEMBERS] = [
             {constants.ID: member[constants.ID],
@@ -2802,7 +3166,7 @@ class OvnProviderHelper():
                 else:
                     member_operating_status = constants.OFFLINE
 
-                self._update_external_ids_member_status(
+                commands = self._get_member_status_commands(
                     ovn_lb,
                     member[constants.ID],
                     member_operating_status)
@@ -2816,10 +3180,16 @@ class OvnProviderHelper():
                     last_status == constants.OFFLINE and
                     member_operating_status != constants.OFFLINE
                 ):
-                    commands = []
-                    commands.extend(self._refresh_lb_vips(ovn_lb,
-                                                          ovn_lb.external_ids))
-                    self._execute_commands(commands)
+                    # The new status is committed with the vips, so they
+                    # are framed with it.
+                    offline_member_ids = impl_idl_ovn.get_lb_external_ids(
+                        ovn_lb).offline_member_ids - {member[constants.ID]}
+                    if member_operating_status == constants.OFFLINE:
+                        offline_member_ids |= {member[constants.ID]}
+                    commands.extend(self._refresh_lb_vips(
+                        ovn_lb, ovn_lb.external_ids,
+                        offline_member_ids=offline_member_ids))
+                self._execute_commands(commands)
 
         except Exception:
             LOG.exception(ovn_const.EXCEPTION_MSG, "update of member")
@@ -2835,6 +3205,202 @@ class OvnProviderHelper():
                 constants.ERROR)
         return status
 
+    def _get_member_batch_subnets(self, subnet_ids):
+        neutron_client = clients.get_neutron_client()
+        subnets = {}
+        for subnet_id in subnet_ids:
+            try:
+                subnets[subnet_id] = self._get_subnet(neutron_client,
+                                                      subnet_id)
+            except openstack.exceptions.ResourceNotFound:
+                LOG.warning('Subnet %s not found while trying to '
+                            'fetch its data.', subnet_id)
+        return subnets
+
+    def _update_members_in_batch(self, ovn_lb, pool_key, members,
+                                 members_to_delete):
+        external_ids = copy.deepcopy(ovn_lb.external_ids)
+        lb_ext_ids = impl_idl_ovn.get_lb_external_ids(ovn_lb)
+        existing_members = [
+            member for member in (external_ids[pool_key] or '').split(',')
+            if member]
+        members_to_add = [member_info for member_info in members
+                          if member_info not in existing_members]
+        deleted_members = [
+            lb_external_ids.Member(member) for member in members_to_delete]
+
+        hm_statuses = {}
+        if ovn_lb.health_check:
+            # NOTE: the ip_port_mappings of the removed members are cleaned
+            # while they are still in the pool, as in _remove_member.
+            for member in deleted_members:
+                self._update_hm_member(ovn_lb, pool_key, member.ip,
+                                       delete=True)
+            # NOTE: the health check of the new members is set up before
+            # committing them, so their statuses are written in the same
+            # transaction as the pool members.
+            for member_info in members_to_add:
+                member = members[member_info]
+                if member[constants.ADMIN_STATE_UP]:
+                    mb_status = self._update_hm_member(
+                        ovn_lb, pool_key, member[constants.ADDRESS],
+                        pool_members=member_info)
+                    hm_statuses[member[constants.ID]] = (
+                        constants.ERROR if mb_status != constants.ONLINE
+                        else mb_status)
+
+        member_statuses = dict(lb_ext_ids.member_statuses)
+        for member in deleted_members:
+            member_statuses.pop(member.id, None)
+        operating_statuses = {}
+        for member_info, member in members.items():
+            if not member[constants.ADMIN_STATE_UP]:
+                operating_status = constants.OFFLINE
+            elif member[constants.ID] in hm_statuses:
+                operating_status = hm_statuses[member[constants.ID]]
+            elif member_info in members_to_add or not ovn_lb.health_check:
+                operating_status = constants.NO_MONITOR
+            else:
+                # If HM exists trust on neutron:member_status as the last
+                # status valid for the member, as member_update does.
+                operating_status = self._find_member_status(
+                    ovn_lb, member[constants.ID])
+            operating_statuses[member[constants.ID]] = operating_status
+        member_statuses.update(operating_statuses)
+
+        subnets = self._get_member_batch_subnets(
+            {member.subnet_id for member in deleted_members} |
+            {members[member_info][constants.SUBNET_ID]
+             for member_info in members_to_add})
+        ls_refs = dict(lb_ext_ids.ls_refs)
+        commands = []
+        for subnet_id, associate in (
+                [(member.subnet_id, False) for member in deleted_members] +
+                [(members[member_info][constants.SUBNET_ID], True)
+                 for member_info in members_to_add]):
+            if subnet_id not in subnets:
+                continue
+            commands.extend(self._get_lb_to_ls_association_commands(
+                ovn_lb, network_id=subnets[subnet_id].network_id,
+                associate=associate, update_ls_ref=False,
+                additional_vips=False, ls_refs=ls_refs))
+
+        # The pool members, LS references and member statuses are all
+        # written with a single update of the external_ids.
+        lb_data = {pool_key: ','.join(
+            [member for member in existing_members
+             if member not in members_to_delete] + members_to_add)}
+        if ls_refs != lb_ext_ids.ls_refs:
+            lb_data[ovn_const.LB_EXT_IDS_LS_REFS_KEY] = jsonutils.dumps(
+                ls_refs)
+        if lb_ext_ids.has_legacy_member_status:
+            # Migrate the legacy neutron:member_status key.
+            lb_data.update(
+                lb_external_ids.get_member_status_keys(member_statuses))
+            removed_keys = [ovn_const.OVN_MEMBER_STATUS_KEY]
+        else:
+            # Only the keys of the members whose status changed.
+            lb_data.update(lb_external_ids.get_member_status_keys(
+                {member_id: status
+                 for member_id, status in operating_statuses.items()
+                 if lb_ext_ids.member_statuses.get(member_id) != status}))
+            removed_keys = []
+        removed_keys.extend(
+            lb_external_ids.get_member_status_key(member.id)
+            for member in deleted_members)
+        for key in removed_keys:
+            external_ids.pop(key, None)
+        commands.append(self.ovn_nbdb_api.lb_update_external_ids(
+            ovn_lb.uuid, lb_data, removed_keys))
+        external_ids.update(lb_data)
+        offline_member_ids = frozenset(
+            member_id for member_id, status in member_statuses.items()
+            if status == constants.OFFLINE)
+        commands.extend(self._refresh_lb_vips(
+            ovn_lb, external_ids, offline_member_ids=offline_member_ids))
+        self._execute_commands(commands)
+
+        # Make sure that all logical switches related to the logical routers
+        # of the new members are associated with the load balancer, as
+        # _add_member does.
+        ovn_lrs = {}
+        for subnet_id in {members[member_info][constants.SUBNET_ID]
+                          for member_info in members_to_add}:
+            subnet = subnets.get(subnet_id)
+            if not subnet:
+                continue
+            try:
+                ovn_ls = self.ovn_nbdb_api.ls_get(
+                    utils.ovn_name(subnet.network_id)).execute(
+                        check_error=True)
+                ovn_lr = self._find_lr_of_ls(ovn_ls, subnet.gateway_ip)
+            except idlutils.RowNotFound:
+                continue
+            if ovn_lr:
+                ovn_lrs[ovn_lr.uuid] = ovn_lr
+        for ovn_lr in ovn_lrs.values():
+            self._sync_lb_to_lr_association(ovn_lb, ovn_lr)
+
+        if ovn_lb.health_check:
+            for subnet_id in {member.subnet_id for member in deleted_members}:
+                if not self._members_in_subnet(ovn_lb, subnet_id):
+                    # NOTE(froyo): if member is last member from the subnet
+                    # we should clean up the ovn-lb-hm-port.
+                    self._clean_up_hm_port(subnet_id)
+        return operating_statuses
+
+    def member_batch_update(self, info):
+        """Set the members of a pool to the ones in the request
+
+        The members not yet in the pool are added, the ones in the pool but
+        not in the request are removed and the rest are updated. The pool
+        members, member statuses, Logical_Switch associations and vips of
+        the OVN Load_Balancer are computed for the whole batch and committed
+        in a single NB transaction, and a single status is returned for all
+        the members.
+        """
+        members = {self._get_member_info(member): member
+                   for member in info[constants.MEMBERS]}
+        ovn_lb = None
+        members_to_delete = []
+        operating_statuses = {}
+        error_updating_members = False
+        try:
+            pool_key, ovn_lb = self._find_ovn_lb_by_pool_id(
+                info[constants.POOL_ID])
+            existing_members = ovn_lb.external_ids[pool_key]
+            members_to_delete = [
+                member for member in (
+                    existing_members.split(',') if existing_members else [])
+                if member not in members]
+            operating_statuses = self._update_members_in_batch(
+                ovn_lb, pool_key, members, members_to_delete)
+        except Exception:
+            LOG.exception(ovn_const.EXCEPTION_MSG, "batch update of members")
+            error_updating_members = True
+
+        status = (self._get_current_operating_statuses(ovn_lb) if ovn_lb
+                  else {})
+        status[constants.MEMBERS] = []
+        for member in members.values():
+            member_status = {constants.ID: member[constants.ID]}
+            if error_updating_members:
+                member_status[constants.PROVISIONING_STATUS] = (
+                    constants.ERROR)
+            else:
+                member_status[constants.PROVISIONING_STATUS] = (
+                    constants.ACTIVE)
+                member_status[constants.OPERATING_STATUS] = (
+                    operating_statuses[member[constants.ID]])
+            status[constants.MEMBERS].append(member_status)
+        for member in members_to_delete:
+            status[constants.MEMBERS].append(
+                {constants.ID: lb_external_ids.Member(member).id,
+                 constants.PROVISIONING_STATUS: (
+                     constants.ERROR if error_updating_members
+                     else constants.DELETED)})
+        return status
+
     def _get_existing_pool_members(self, pool_id):
         pool_key, ovn_lb = self._find_ovn_lb_by_pool_id(pool_id)
         if not ovn_lb:
@@ -3080,63 +3646,81 @@ class OvnProviderHelper():
                     commands.append(self.ovn_nbdb_api.db_destroy(
                         'Load_Balancer_Health_Check', lb_hc.uuid))
                     break
-        commands.extend(
-            self._refresh_lb_vips(
-                ovn_lb,
-                external_ids,
-                is_sync=(
-                    fip_info['action'] == ovn_const.REQ_INFO_ACTION_SYNC)
-            )
-        )
+        commands.extend(self._refresh_lb_vips(ovn_lb, external_ids))
         self._execute_commands(commands)
 
     def handle_member_dvr(self, info):
-        pool_key, ovn_lb = self._find_ovn_lb_by_pool_id(info['pool_id'])
+        self.handle_members_dvr(info['pool_id'], [info])
+
+    def handle_members_dvr(self, pool_id, members_info):
+        """Update the FIPs of the members of a pool on their add/delete
+
+        The members are resolved to their ports and FIPs in one pass, so it
+        is used to handle all the members of a pool at once (e.g. during a
+        cascade delete).
+
+        :param pool_id: the id of the pool of the members.
+        :param members_info: list of dicts with the id, address, subnet_id
+                             and action of each member.
+        """
+        pool_key, ovn_lb = self._find_ovn_lb_by_pool_id(pool_id)
         if ((not ovn_lb.external_ids.get(ovn_const.LB_EXT_IDS_VIP_FIP_KEY)) and
                 (not ovn_lb.external_ids.get(
                     ovn_const.LB_EXT_IDS_ADDIT_VIP_FIP_KEY))):
             LOG.debug("LB %(lb)s has no FIP on VIP configured. "
                       "There is no need to centralize member %(member)s "
                       "traffic.",
-                      {'lb': ovn_lb.uuid, 'member': info['id']})
+                      {'lb': ovn_lb.uuid,
+                       'member': ', '.join(info['id']
+                                           for info in members_info)})
             return
 
-        # Find out if member has FIP assigned.
+        # Find out if members have FIP assigned.
         neutron_client = clients.get_neutron_client()
+        subnets_ls = {}
+        members_port = {}
+        for info in members_info:
+            if info['subnet_id'] not in subnets_ls:
+                subnets_ls[info['subnet_id']] = self._get_member_dvr_ls(
+                    neutron_client, info['subnet_id'])
+            ls = subnets_ls[info['subnet_id']]
+            if not ls:
+                continue
+            port = self._find_ls_port_by_ip(ls, info['address'])
+            if port:
+                members_port[info['id']] = port.name
+
+        fips = {}
+        if members_port:
+            fips = self.ovn_nbdb_api.get_nats_by_fip_port_ids(
+                list(members_port.values())).execute(check_error=True)
+
+        for info in members_info:
+            fip = fips.get(members_port.get(info['id']))
+            if not fip:
+                LOG.debug('Member %s has no FIP assigned. '
+                          'There is no need to modify its NAT.',
+                          info['id'])
+                continue
+            self._handle_member_dvr_fip(neutron_client, ovn_lb, info, fip[0])
+
+    def _get_member_dvr_ls(self, neutron_client, subnet_id):
         try:
-            subnet = neutron_client.get_subnet(info['subnet_id'])
+            subnet = self._get_subnet(neutron_client, subnet_id)
             ls_name = utils.ovn_name(subnet.network_id)
         except openstack.exceptions.ResourceNotFound:
             LOG.exception('Subnet %s not found while trying to '
-                          'fetch its data.', info['subnet_id'])
+                          'fetch its data.', subnet_id)
             return
 
         try:
-            ls = self.ovn_nbdb_api.lookup('Logical_Switch', ls_name)
+            return self.ovn_nbdb_api.lookup('Logical_Switch', ls_name)
         except idlutils.RowNotFound:
             LOG.warning("Logical Switch %s not found. "
                         "Cannot verify member FIP configuration.",
                         ls_name)
-            return
-
-        fip = None
-        f = utils.remove_macs_from_lsp_addresses
-        for port in ls.ports:
-            if info['address'] in f(port.addresses):
-                # We found particular port
-                fip = self.ovn_nbdb_api.db_find_rows(
-                    'NAT', ('external_ids', '=', {
-                        ovn_const.OVN_FIP_PORT_EXT_ID_KEY: port.name})
-                ).execute(check_error=True)
-                fip = fip[0] if fip else fip
-                break
-
-        if not fip:
-            LOG.debug('Member %s has no FIP assigned. '
-                      'There is no need to modify its NAT.',
-                      info['id'])
-            return
 
+    def _handle_member_dvr_fip(self, neutron_client, ovn_lb, info, fip):
         if info['action'] == ovn_const.REQ_INFO_MEMBER_ADDED:
             LOG.info('Member %(member)s is added to Load Balancer %(lb)s '
                      'and both have FIP assigned. Member FIP %(fip)s '
@@ -3189,7 +3773,7 @@ class OvnProviderHelper():
     def _get_member_lsp(self, member_ip, member_subnet_id):
         neutron_client = clients.get_neutron_client()
         try:
-            member_subnet = neutron_client.get_subnet(member_subnet_id)
+            member_subnet = self._get_subnet(neutron_client, member_subnet_id)
         except openstack.exceptions.ResourceNotFound:
             LOG.exception('Subnet %s not found while trying to '
                           'fetch its data.', member_subnet_id)
@@ -3200,11 +3784,13 @@ class OvnProviderHelper():
         except idlutils.RowNotFound:
             LOG.warning("Logical Switch %s not found.", ls_name)
             return
-        f = utils.remove_macs_from_lsp_addresses
-        for port in ls.ports:
-            if member_ip in f(port.addresses):
-                # We found particular port
-                return port
+        return self._find_ls_port_by_ip(ls, member_ip)
+
+    def _find_ls_port_by_ip(self, ls, ip):
+        lsps = self.ovn_nbdb_api.get_lsps_by_ip(ls.name, ip).execute(
+            check_error=True)
+        if lsps:
+            return lsps[0]
 
     def get_fip_from_vip(self, lb):
         neutron_client = clients.get_neutron_client()
@@ -3548,23 +4134,16 @@ class OvnProviderHelper():
             # any other existing HM. To prevent accidentally removing the
             # member we can use the neutron:member_status to search for any
             # other members with the same address
+            lb_ext_ids = impl_idl_ovn.get_lb_external_ids(ovn_lb)
             members_try_remove = self._extract_member_info(
                 ovn_lb.external_ids[pool_key])
             other_members = []
-            for k, v in ovn_lb.external_ids.items():
-                if ovn_const.LB_EXT_IDS_POOL_PREFIX in k and k != pool_key:
-                    other_members.extend(self._extract_member_info(
-                        ovn_lb.external_ids[k]))
-
-            member_statuses = ovn_lb.external_ids.get(
-                ovn_const.OVN_MEMBER_STATUS_KEY)
+            for pool in lb_ext_ids.pools.values():
+                if pool.key != pool_key:
+                    other_members.extend(
+                        member.as_tuple() for member in pool.members)
 
-            try:
-                member_statuses = jsonutils.loads(member_statuses)
-            except TypeError:
-                LOG.debug("no member status on external_ids: %s",
-                          str(member_statuses))
-                member_statuses = {}
+            member_statuses = lb_ext_ids.member_statuses
 
             for (mb_ip, mb_port, mb_subnet, mb_id) in members_try_remove:
                 delete = True
@@ -3579,10 +4158,14 @@ class OvnProviderHelper():
                     self.ovn_nbdb_api.lb_del_ip_port_mapping(
                         ovn_lb.uuid, mb_ip).execute()
 
-    def _update_hm_member(self, ovn_lb, pool_key, backend_ip, delete=False):
-        # Update just the backend_ip member
+    def _update_hm_member(self, ovn_lb, pool_key, backend_ip, delete=False,
+                          pool_members=None):
+        # Update just the backend_ip member, looked up in pool_members when
+        # it is not yet in the pool of the OVN LB.
+        if pool_members is None:
+            pool_members = ovn_lb.external_ids[pool_key]
         for mb_ip, mb_port, mb_subnet, mb_id in self._extract_member_info(
-                ovn_lb.external_ids[pool_key]):
+                pool_members):
             if mb_ip == backend_ip:
                 member_lsp = self._get_member_lsp(mb_ip, mb_subnet)
                 if not member_lsp:
@@ -3629,27 +4212,17 @@ class OvnProviderHelper():
         return constants.ERROR
 
     def _lookup_lbhcs_by_hm_id(self, hm_id):
-        lbhc_rows = self.ovn_nbdb_api.db_list_rows(
-            'Load_Balancer_Health_Check').execute(check_error=True)
-        lbhcs = []
-        for lbhc in lbhc_rows:
-            if (ovn_const.LB_EXT_IDS_HM_KEY in lbhc.external_ids and
-                    lbhc.external_ids[ovn_const.LB_EXT_IDS_HM_KEY] == hm_id):
-                lbhcs.append(lbhc)
+        lbhcs = self.ovn_nbdb_api.get_lbhcs_by_hm_id(hm_id).execute(
+            check_error=True)
         if lbhcs:
             return lbhcs
         raise idlutils.RowNotFound(table='Load_Balancer_Health_Check',
                                    col='external_ids', match=hm_id)
 
     def _find_ovn_lb_from_hm_id(self, hm_id, lbhc_vip=None):
-        lbs = self.ovn_nbdb_api.db_list_rows(
-            'Load_Balancer').execute(check_error=True)
-        ovn_lb = None
-        for lb in lbs:
-            if (ovn_const.LB_EXT_IDS_HMS_KEY in lb.external_ids.keys() and
-                    hm_id in lb.external_ids[ovn_const.LB_EXT_IDS_HMS_KEY]):
-                ovn_lb = lb
-                break
+        lbs = self.ovn_nbdb_api.get_lbs_by_hm_id(hm_id).execute(
+            check_error=True)
+        ovn_lb = lbs[0] if lbs else None
 
         try:
             lbhcs_by_hm_id = self._lookup_lbhcs_by_hm_id(hm_id)
@@ -3947,20 +4520,9 @@ class OvnProviderHelper():
         """
         # ip_port_mappings: {"MEMBER_IP"="LSP_NAME_MEMBER:HEALTH_SRC"}
         # There could be more than one entry in ip_port_mappings!
-        mappings = {}
-        hm_source_ip = str(row.src_ip)
-        member_ip = str(row.ip)
-        member_src = f'{row.logical_port}:'
-        if netaddr.IPNetwork(hm_source_ip).version == n_const.IP_VERSION_6:
-            member_src += f'[{hm_source_ip}]'
-        else:
-            member_src += f'{hm_source_ip}'
-        if netaddr.IPNetwork(member_ip).version == n_const.IP_VERSION_6:
-            member_ip = f'[{member_ip}]'
-        mappings[member_ip] = member_src
-        lbs = self.ovn_nbdb_api.db_find_rows(
-            'Load_Balancer', ('ip_port_mappings', '=', mappings),
-            ('protocol', '=', row.protocol[0])).execute()
+        lbs = self.ovn_nbdb_api.get_lbs_by_ip_port_mapping(
+            str(row.ip), row.logical_port, str(row.src_ip),
+            row.protocol[0]).execute()
         return lbs if lbs else None
 
     def sm_update_event_handler(self, row, sm_delete_event=False):
@@ -3979,22 +4541,32 @@ class OvnProviderHelper():
             LOG.debug("Load balancer not found")
             return
 
-        request_info = {
-            "ovn_lbs": ovn_lbs,
-            "ip": row.ip,
-            "port": str(row.port),
-            "status": row.status
-            if not sm_delete_event
-            else ovn_const.HM_EVENT_MEMBER_PORT_OFFLINE,
-        }
-        self.add_request({'type': ovn_const.REQ_TYPE_HM_UPDATE_EVENT,
-                          'info': request_info})
+        # NOTE: the member can belong to several load balancers, and the
+        # requests are distributed among the workers by load balancer, so
+        # a request is sent for every load balancer (their OVN LBs, one per
+        # protocol, share the name).
+        lbs_by_name = {}
+        for ovn_lb in ovn_lbs:
+            lbs_by_name.setdefault(ovn_lb.name, []).append(ovn_lb)
+        for lb_id, lb_ovn_lbs in lbs_by_name.items():
+            request_info = {
+                "ovn_lbs": lb_ovn_lbs,
+                "loadbalancer_id": lb_id,
+                "ip": row.ip,
+                "port": str(row.port),
+                "status": row.status
+                if not sm_delete_event
+                else ovn_const.HM_EVENT_MEMBER_PORT_OFFLINE,
+            }
+            self.add_request({'type': ovn_const.REQ_TYPE_HM_UPDATE_EVENT,
+                              'info': request_info})
 
     def _get_current_operating_statuses(self, ovn_lb):
         # NOTE (froyo) We would base all logic in the external_ids field
-        # 'neutron:member_status' that should include all LB member status
-        # in order to calculate the global LB status (listeners, pools, members
-        # included)
+        # 'neutron:member_status' (and the per member
+        # 'neutron:member_status:<member_id>' keys) that should include all
+        # LB member status in order to calculate the global LB status
+        # (listeners, pools, members included)
         status = {
             constants.LOADBALANCERS: [],
             constants.LISTENERS: [],
@@ -4002,28 +4574,12 @@ class OvnProviderHelper():
             constants.MEMBERS: []
         }
 
-        listeners = {}
-        pools = {}
-        member_statuses = ovn_lb.external_ids.get(
-            ovn_const.OVN_MEMBER_STATUS_KEY)
-
-        try:
-            member_statuses = jsonutils.loads(member_statuses)
-        except TypeError:
-            LOG.debug("no member status on external_ids: %s",
-                      str(member_statuses))
-            member_statuses = {}
-
-        for k, v in ovn_lb.external_ids.items():
-            if ovn_const.LB_EXT_IDS_LISTENER_PREFIX in k:
-                listeners[k.split('_')[1]] = [
-                    x.split('_')[1] for x in v.split(',')
-                    if ovn_const.LB_EXT_IDS_POOL_PREFIX in x]
-                continue
-            if ovn_const.LB_EXT_IDS_POOL_PREFIX in k:
-                pools[k.split('_')[1]] = [
-                    x.split('_')[1] for x in v.split(',') if x]
-                continue
+        lb_ext_ids = impl_idl_ovn.get_lb_external_ids(ovn_lb)
+        member_statuses = lb_ext_ids.member_statuses
+        listeners = {listener.id: list(listener.pool_ids)
+                     for listener in lb_ext_ids.listeners.values()}
+        pools = {pool.id: [member.id for member in pool.members]
+                 for pool in lb_ext_ids.pools.values()}
 
         for member_id, member_status in member_statuses.items():
             status[constants.MEMBERS].append({
@@ -4162,10 +4718,7 @@ class OvnProviderHelper():
             LOG.debug(f"OVN loadbalancer {lb_id} not found.")
         fetch_hc_ids = []
         for ovn_lb in ovn_lbs:
-            hm_ids = ovn_lb.external_ids.get(
-                ovn_const.LB_EXT_IDS_HMS_KEY, [])
-            if hm_ids:
-                hm_ids = jsonutils.loads(hm_ids)
+            hm_ids = impl_idl_ovn.get_lb_external_ids(ovn_lb).hm_ids
             for hm_id in hm_ids:
                 lbhcs = []
                 try:
@@ -25,6 +25,7 @@ from ovsdbapp.backend.ovs_idl import connection
 from ovn_octavia_provider.common import clients
 from ovn_octavia_provider.common import config as ovn_conf
 from ovn_octavia_provider.common import constants as ovn_const
+from ovn_octavia_provider.common import lb_external_ids
 from ovn_octavia_provider.ovsdb import impl_idl_ovn
 
 CONF = cfg.CONF  # Gets Octavia Conf as it runs under o-api domain
@@ -163,3 +164,45 @@ class DBInconsistenciesPeriodics(object):
         LOG.debug('Maintenance task: no more ip_port_mappings to format, '
                   'stopping the periodic task.')
         raise periodics.NeverAgain()
+
+    # TODO(froyo): Remove this once the OVN LBs can not have the legacy
+    # neutron:member_status key anymore.
+    @periodics.periodic(spacing=600, run_immediately=True)
+    def migrate_member_status_to_member_keys(self):
+        """Move the member statuses of the OVN LBs to per member keys.
+
+        The member statuses of an OVN LB were stored together, as JSON, in
+        the `neutron:member_status` key of its external_ids. They are now
+        stored in a `neutron:member_status:${MEMBER_ID}` key per member, so
+        a member status change only writes the key of the member. The LBs
+        are migrated on their next member status change anyway, this task
+        migrates the ones not changed since the upgrade.
+
+        During a rolling upgrade, the OVN providers not upgraded yet only
+        read the `neutron:member_status` key: they report the members not
+        found in it as NO_MONITOR, and store the statuses they set in it
+        again. The upgraded providers only use those statuses for the
+        members without a key of their own, and migrate them on the next
+        member status change of the LB.
+        """
+        LOG.debug('Maintenance task: migrating the member statuses of the '
+                  'OVN LBs to per member keys.')
+        ovn_lbs = self.ovn_nbdb_api.db_find_rows('Load_Balancer').execute()
+        for lb in ovn_lbs:
+            if ovn_const.OVN_MEMBER_STATUS_KEY not in lb.external_ids:
+                continue
+            # The statuses already stored in the key of the member are the
+            # newest ones.
+            member_statuses = {
+                member_id: status for member_id, status in
+                impl_idl_ovn.get_lb_external_ids(lb).member_statuses.items()
+                if lb_external_ids.get_member_status_key(member_id) not in
+                lb.external_ids}
+            self.ovn_nbdb_api.lb_update_external_ids(
+                lb.uuid,
+                lb_external_ids.get_member_status_keys(member_statuses),
+                [ovn_const.OVN_MEMBER_STATUS_KEY]).execute(check_error=True)
+
+        LOG.debug('Maintenance task: no more member statuses to migrate, '
+                  'stopping the periodic task.')
+        raise periodics.NeverAgain()
@@ -12,14 +12,19 @@
 
 import atexit
 import contextlib
+import threading
+import time
 
 import netaddr
 from neutron_lib import constants as n_const
 from neutron_lib import exceptions as n_exc
 from oslo_log import log
+from oslo_serialization import jsonutils
+from ovs.db import idl as ovs_db_idl
 from ovsdbapp.backend import ovs_idl
 from ovsdbapp.backend.ovs_idl import command
 from ovsdbapp.backend.ovs_idl import connection
+from ovsdbapp.backend.ovs_idl import event as row_event
 from ovsdbapp.backend.ovs_idl import idlutils
 from ovsdbapp.backend.ovs_idl import rowview
 from ovsdbapp.backend.ovs_idl import transaction as idl_trans
@@ -28,7 +33,9 @@ from ovsdbapp.schema.ovn_southbound import impl_idl as sb_impl_idl
 import tenacity
 
 from ovn_octavia_provider.common import config
+from ovn_octavia_provider.common import constants as ovn_const
 from ovn_octavia_provider.common import exceptions as ovn_exc
+from ovn_octavia_provider.common import lb_external_ids
 from ovn_octavia_provider.common import utils
 from ovn_octavia_provider.i18n import _
 from ovn_octavia_provider.ovsdb import ovsdb_monitor
@@ -36,6 +43,257 @@ from ovn_octavia_provider.ovsdb import ovsdb_monitor
 
 LOG = log.getLogger(__name__)
 
+# Names of the in-memory indexes kept on the rows of the NB IDL tables. They
+# must not match any column name, as ovsdbapp looks up the indexes by column
+# name to build the monitor conditions.
+LB_BY_NAME_INDEX = 'octavia_lb_by_name'
+LB_BY_POOL_KEY_INDEX = 'octavia_lb_by_pool_key'
+LB_BY_HM_ID_INDEX = 'octavia_lb_by_hm_id'
+LBHC_BY_HM_ID_INDEX = 'octavia_lbhc_by_hm_id'
+LRP_BY_NAME_INDEX = 'octavia_lrp_by_name'
+LR_BY_PORT_INDEX = 'octavia_lr_by_port'
+LSP_BY_IP_INDEX = 'octavia_lsp_by_ip'
+LS_BY_PORT_INDEX = 'octavia_ls_by_port'
+NAT_BY_FIP_PORT_INDEX = 'octavia_nat_by_fip_port'
+LB_BY_IP_PORT_MAPPING_INDEX = 'octavia_lb_by_ip_port_mapping'
+LB_BY_VIP_PORT_INDEX = 'octavia_lb_by_vip_port'
+
+# Monitor condition clauses of the Logical_Switch_Port rows relevant to the
+# load balancers, besides the VIP ports: the router ports and the health
+# monitor ports.
+LSP_LB_CONDITION = [
+    ['type', '==', 'router'],
+    ['external_ids', 'includes',
+     ['map', [[ovn_const.OVN_DEVICE_OWNER_EXT_ID_KEY,
+               ovn_const.OVN_LB_HM_PORT_DISTRIBUTED]]]],
+]
+
+
+def _get_ref_uuids(row, column):
+    # NOTE: use the UUIDs stored in the row instead of the referenced rows,
+    # as those may not be in the IDL yet when the row is indexed (e.g. a
+    # router and its ports created in the same transaction).
+    return [atom.value for atom in row._data[column].values]
+
+
+def _name_keys(row):
+    return [row.name]
+
+
+def _lb_pool_keys(row):
+    # Skip load balancers used by port forwarding plugin
+    if row.external_ids.get(ovn_const.OVN_DEVICE_OWNER_EXT_ID_KEY) == (
+            ovn_const.PORT_FORWARDING_PLUGIN):
+        return []
+    # Both the enabled (pool_<id>) and the disabled (pool_<id>:D) keys.
+    return [key for key in row.external_ids
+            if key.startswith(ovn_const.LB_EXT_IDS_POOL_PREFIX)]
+
+
+def _lb_hm_keys(row):
+    # The health monitors of a load balancer are stored as a JSON list.
+    hms = row.external_ids.get(ovn_const.LB_EXT_IDS_HMS_KEY)
+    return jsonutils.loads(hms) if hms else []
+
+
+def _lb_ip_port_mapping_keys(row):
+    # ip_port_mappings: {"MEMBER_IP": "LSP_NAME_MEMBER:HEALTH_SRC"}, with
+    # the IPv6 addresses enclosed in brackets. Each entry is indexed as
+    # (member IP, logical port, health source IP, protocol).
+    keys = []
+    for protocol in row.protocol:
+        for member_ip, port_src in row.ip_port_mappings.items():
+            logical_port, sep, src_ip = port_src.partition(':')
+            keys.append((member_ip.strip('[]'), logical_port,
+                         src_ip.strip('[]'), protocol))
+    return keys
+
+
+def _lb_vip_port_keys(row):
+    # The Neutron ports of the VIP and of the additional VIPs.
+    keys = [row.external_ids.get(ovn_const.LB_EXT_IDS_VIP_PORT_ID_KEY)]
+    keys.extend(row.external_ids.get(
+        ovn_const.LB_EXT_IDS_ADDIT_VIP_PORT_ID_KEY, '').split(','))
+    return [key for key in keys if key]
+
+
+def _lbhc_hm_keys(row):
+    hm_id = row.external_ids.get(ovn_const.LB_EXT_IDS_HM_KEY)
+    return [hm_id] if hm_id else []
+
+
+def _ls_port_keys(row):
+    return _get_ref_uuids(row, 'ports')
+
+
+def _lsp_ip_keys(row):
+    return utils.remove_macs_from_lsp_addresses(row.addresses)
+
+
+def _nat_fip_port_keys(row):
+    port_id = row.external_ids.get(ovn_const.OVN_FIP_PORT_EXT_ID_KEY)
+    return [port_id] if port_id else []
+
+
+def _lr_port_keys(row):
+    # The UUIDs of the router ports plus the name of the gateway port, to
+    # also find the routers of networks with only the gateway port.
+    keys = _get_ref_uuids(row, 'ports')
+    gw_port_id = row.external_ids.get(ovn_const.OVN_GW_PORT_EXT_ID_KEY)
+    if gw_port_id:
+        keys.append(utils.ovn_lrouter_port_name(gw_port_id))
+    return keys
+
+
+# Index name -> (table, function returning the keys of a row).
+NB_ROW_INDEXES = {
+    LB_BY_NAME_INDEX: ('Load_Balancer', _name_keys),
+    LB_BY_POOL_KEY_INDEX: ('Load_Balancer', _lb_pool_keys),
+    LB_BY_HM_ID_INDEX: ('Load_Balancer', _lb_hm_keys),
+    LB_BY_IP_PORT_MAPPING_INDEX: ('Load_Balancer', _lb_ip_port_mapping_keys),
+    LB_BY_VIP_PORT_INDEX: ('Load_Balancer', _lb_vip_port_keys),
+    LBHC_BY_HM_ID_INDEX: ('Load_Balancer_Health_Check', _lbhc_hm_keys),
+    LRP_BY_NAME_INDEX: ('Logical_Router_Port', _name_keys),
+    LR_BY_PORT_INDEX: ('Logical_Router', _lr_port_keys),
+    LSP_BY_IP_INDEX: ('Logical_Switch_Port', _lsp_ip_keys),
+    LS_BY_PORT_INDEX: ('Logical_Switch', _ls_port_keys),
+    NAT_BY_FIP_PORT_INDEX: ('NAT', _nat_fip_port_keys),
+}
+
+
+def _get_row_keys(key_fn, row):
+    try:
+        return set(key_fn(row))
+    except Exception:
+        # NOTE: a row with unexpected values (e.g. a malformed JSON in its
+        # external_ids) is just not indexed.
+        LOG.debug('Unable to get the index keys of row %s', row.uuid)
+        return set()
+
+
+class RowIndex():
+    """In-memory index of the rows of an IDL table
+
+    It is plugged into the IndexedRows of the table, so the IDL keeps it
+    up to date when the rows are inserted, updated (removed with their old
+    values and added back with the new ones) or deleted, in the same thread
+    that processes the updates received from the OVSDB server.
+
+    Each row can be indexed under several keys, as returned by key_fn.
+    """
+
+    # NOTE: Row.__setattr__ re-indexes a row written by a transaction in the
+    # indexes whose columns include the written column. None is listed, so
+    # the index only holds the values received from the OVSDB server.
+    columns = ()
+
+    def __init__(self, name, key_fn):
+        self.name = name
+        self.key_fn = key_fn
+        self._rows = {}
+        self._keys = {}
+
+    def add(self, row):
+        self.remove(row)
+        keys = _get_row_keys(self.key_fn, row)
+        if keys:
+            self._keys[row.uuid] = keys
+        for key in keys:
+            self._rows.setdefault(key, {})[row.uuid] = row
+
+    def remove(self, row):
+        for key in self._keys.pop(row.uuid, ()):
+            rows = self._rows[key]
+            rows.pop(row.uuid, None)
+            if not rows:
+                del self._rows[key]
+
+    def clear(self):
+        self._rows.clear()
+        self._keys.clear()
+
+    def lookup(self, key):
+        return list(self._rows.get(key, {}).values())
+
+    def keys(self):
+        return self._rows.keys()
+
+
+class ParsedRowCache():
+    """Cache of a parsed view of a column of the rows of an IDL table
+
+    The views are built on demand by the threads reading the rows, and
+    stored with the datum of the column they were parsed from. The IDL
+    replaces the datum of a column when it updates its value, so a view is
+    only returned for the values it was parsed from. The view of an updated
+    row is passed to parse_fn when parsing the new values, to reuse what
+    did not change.
+
+    Unlike RowIndex, it is not plugged into the IndexedRows of the table:
+    the IDL removes the views of the rows deleted from its row events (see
+    OvnNbIdlForLb.notify).
+    """
+
+    def __init__(self, column, parse_fn):
+        self.column = column
+        self.parse_fn = parse_fn
+        self._views = {}
+
+    def remove(self, row):
+        self._views.pop(row.uuid, None)
+
+    def prune(self, rows):
+        # NOTE: the rows deleted while the IDL is reconnecting are not
+        # notified, their views are removed once there are more views than
+        # rows.
+        if len(self._views) > len(rows):
+            for row_uuid in list(self._views):
+                if row_uuid not in rows:
+                    self._views.pop(row_uuid, None)
+
+    def get(self, row):
+        datum = row._data.get(self.column)
+        cached = self._views.get(row.uuid)
+        previous = None
+        if cached is not None:
+            if cached[0] is datum:
+                return cached[1]
+            previous = cached[1]
+        view = self.parse_fn(row, previous)
+        if datum is not None:
+            self._views[row.uuid] = (datum, view)
+        return view
+
+
+def get_lb_external_ids(ovn_lb, external_ids=None):
+    """Return the parsed external_ids of a Load_Balancer
+
+    The view is cached per row for the rows of an OvnNbIdlForLb IDL, and
+    parsed on every call for any other object (e.g. a frozen row).
+
+    :param ovn_lb: the Load_Balancer row (or a RowView of it).
+    :param external_ids: the external_ids to parse instead of the ones of
+                         the row, typically a modified copy of them. The
+                         pools not modified are reused from the cached
+                         view of the row.
+    :returns: a lb_external_ids.LbExternalIds object, which must not be
+              modified.
+    """
+    row = getattr(ovn_lb, '_row', ovn_lb)
+    cache = None
+    # Rows with changes pending to be committed are not cached.
+    if (isinstance(row, ovs_db_idl.Row) and row._data is not None and
+            not row._changes and not row._mutations):
+        cache = getattr(row._idl, 'lb_external_ids_cache', None)
+    if cache is None:
+        if external_ids is None:
+            external_ids = ovn_lb.external_ids
+        return lb_external_ids.LbExternalIds(external_ids)
+    view = cache.get(row)
+    if external_ids is not None and external_ids != view.raw:
+        return lb_external_ids.LbExternalIds(external_ids, previous=view)
+    return view
+
 
 class OvnNbTransaction(idl_trans.Transaction):
 
@@ -51,6 +309,77 @@ class OvnNbTransaction(idl_trans.Transaction):
         self.api.nb_global.increment('nb_cfg')
 
 
+class _GroupCommitEntry():
+
+    __slots__ = ('commands', 'error', 'done')
+
+    def __init__(self, commands):
+        self.commands = commands
+        self.error = None
+        self.done = threading.Event()
+
+
+class NbGroupCommitter():
+    """Commit the commands of concurrent requests in shared transactions
+
+    The first thread calling execute() waits for the latency budget and
+    then commits, in a single NB transaction, its commands and the ones
+    given meanwhile by other threads, so all of them share the same round
+    trip to the database. If that transaction fails, every set of commands
+    is committed again in its own transaction, so the error is raised only
+    to the thread whose commands caused it.
+    """
+
+    def __init__(self, api, latency_budget):
+        self.api = api
+        self.latency_budget = latency_budget
+        self._lock = threading.Lock()
+        self._group = None
+
+    def execute(self, commands):
+        entry = _GroupCommitEntry(commands)
+        with self._lock:
+            group = self._group
+            is_leader = group is None
+            if is_leader:
+                group = self._group = []
+            group.append(entry)
+        if is_leader:
+            time.sleep(self.latency_budget)
+            with self._lock:
+                self._group = None
+            try:
+                self._commit_group(group)
+            finally:
+                for other in group:
+                    other.done.set()
+        else:
+            entry.done.wait()
+        if entry.error:
+            raise entry.error
+
+    def _commit(self, commands):
+        with self.api.transaction(check_error=True) as txn:
+            for cmd in commands:
+                txn.add(cmd)
+
+    def _commit_group(self, group):
+        if len(group) > 1:
+            try:
+                self._commit([cmd for entry in group
+                              for cmd in entry.commands])
+                return
+            except Exception as e:
+                LOG.debug("Transaction of %(count)s requests failed, "
+                          "committing them separately. Reason: %(reason)s",
+                          {'count': len(group), 'reason': e})
+        for entry in group:
+            try:
+                self._commit(entry.commands)
+            except Exception as e:
+                entry.error = e
+
+
 class Backend(ovs_idl.Backend):
 
     def is_table_present(self, table_name):
@@ -99,6 +428,72 @@ class FindLbInTableCommand(command.ReadOnlyCommand):
             if self.lb in item.load_balancer]
 
 
+def _lookup_rows(api, index_name, key):
+    table, key_fn = NB_ROW_INDEXES[index_name]
+    rows = api.tables[table].rows
+    index = rows.indexes.get(index_name)
+    if isinstance(index, RowIndex):
+        return index.lookup(key)
+    # The IDL is not an OvnNbIdlForLb one, fall back to a full scan
+    return [row for row in rows.values()
+            if key in _get_row_keys(key_fn, row)]
+
+
+class LookupByIndexCommand(command.ReadOnlyCommand):
+    def __init__(self, api, index, key):
+        super().__init__(api)
+        self.index = index
+        self.key = key
+
+    def run_idl(self, txn):
+        self.result = [rowview.RowView(row) for row in
+                       _lookup_rows(self.api, self.index, self.key)]
+
+
+class LookupByIndexKeysCommand(command.ReadOnlyCommand):
+    def __init__(self, api, index, keys):
+        super().__init__(api)
+        self.index = index
+        self.keys = keys
+
+    def run_idl(self, txn):
+        self.result = {}
+        for key in self.keys:
+            rows = _lookup_rows(self.api, self.index, key)
+            if rows:
+                self.result[key] = [rowview.RowView(row) for row in rows]
+
+
+class GetLspsByIpCommand(command.ReadOnlyCommand):
+    def __init__(self, api, ls_name, ip):
+        super().__init__(api)
+        self.ls_name = ls_name
+        self.ip = ip
+
+    def run_idl(self, txn):
+        self.result = [
+            rowview.RowView(lsp) for lsp in
+            _lookup_rows(self.api, LSP_BY_IP_INDEX, self.ip)
+            if any(ls.name == self.ls_name for ls in
+                   _lookup_rows(self.api, LS_BY_PORT_INDEX, lsp.uuid))]
+
+
+class GetLrsByLrpNameCommand(command.ReadOnlyCommand):
+    def __init__(self, api, lrp_name):
+        super().__init__(api)
+        self.lrp_name = lrp_name
+
+    def run_idl(self, txn):
+        lrs = {}
+        for lrp in _lookup_rows(self.api, LRP_BY_NAME_INDEX, self.lrp_name):
+            for lr in _lookup_rows(self.api, LR_BY_PORT_INDEX, lrp.uuid):
+                lrs[lr.uuid] = lr
+        # Handles networks with only gateway port in the router
+        for lr in _lookup_rows(self.api, LR_BY_PORT_INDEX, self.lrp_name):
+            lrs.setdefault(lr.uuid, lr)
+        self.result = [rowview.RowView(lr) for lr in lrs.values()]
+
+
 class GetLrsCommand(command.ReadOnlyCommand):
     def run_idl(self, txn):
         self.result = [
@@ -153,6 +548,44 @@ class AddBackendToIPPortMapping(command.BaseCommand):
                           "for LB uuid %s", str(self.backend_ip), str(self.lb))
 
 
+class UpdateLbVipsCommand(command.BaseCommand):
+    table = 'Load_Balancer'
+
+    def __init__(self, api, lb, vips_to_set, vips_to_del):
+        super().__init__(api)
+        self.lb = lb
+        self.vips_to_set = vips_to_set
+        self.vips_to_del = vips_to_del
+
+    def run_idl(self, txn):
+        # NOTE: the vips are updated with mutations of the keys changed,
+        # instead of writing the whole column.
+        lb = self.api.lookup(self.table, self.lb)
+        for vip in self.vips_to_del:
+            lb.delkey('vips', vip)
+        for vip, backends in self.vips_to_set.items():
+            lb.setkey('vips', vip, backends)
+
+
+class UpdateLbExternalIdsCommand(command.BaseCommand):
+    table = 'Load_Balancer'
+
+    def __init__(self, api, lb, keys_to_set, keys_to_del):
+        super().__init__(api)
+        self.lb = lb
+        self.keys_to_set = keys_to_set
+        self.keys_to_del = keys_to_del
+
+    def run_idl(self, txn):
+        # NOTE: as for the vips, only the keys changed are mutated, instead
+        # of verifying and writing the whole external_ids column.
+        lb = self.api.lookup(self.table, self.lb)
+        for key in self.keys_to_del:
+            lb.delkey('external_ids', key)
+        for key, value in self.keys_to_set.items():
+            lb.setkey('external_ids', key, value)
+
+
 class OvsdbNbOvnIdl(nb_impl_idl.OvnNbApiIdlImpl, Backend):
     def __init__(self, connection):
         super().__init__(connection)
@@ -188,6 +621,44 @@ class OvsdbNbOvnIdl(nb_impl_idl.OvnNbApiIdlImpl, Backend):
     def get_lrs(self):
         return GetLrsCommand(self)
 
+    def get_lbs_by_name(self, name):
+        return LookupByIndexCommand(self, LB_BY_NAME_INDEX, name)
+
+    def get_lbs_by_pool_key(self, pool_key):
+        return LookupByIndexCommand(self, LB_BY_POOL_KEY_INDEX, pool_key)
+
+    def get_lbs_by_hm_id(self, hm_id):
+        return LookupByIndexCommand(self, LB_BY_HM_ID_INDEX, hm_id)
+
+    def get_lbs_by_ip_port_mapping(self, member_ip, logical_port, src_ip,
+                                   protocol):
+        return LookupByIndexCommand(
+            self, LB_BY_IP_PORT_MAPPING_INDEX,
+            (member_ip, logical_port, src_ip, protocol))
+
+    def get_lbhcs_by_hm_id(self, hm_id):
+        return LookupByIndexCommand(self, LBHC_BY_HM_ID_INDEX, hm_id)
+
+    def get_lrs_by_lrp_name(self, lrp_name):
+        return GetLrsByLrpNameCommand(self, lrp_name)
+
+    def get_lsps_by_ip(self, ls_name, ip):
+        return GetLspsByIpCommand(self, ls_name, ip)
+
+    def get_nats_by_fip_port_ids(self, port_ids):
+        """Return a dict with the NAT rows of the FIPs of each port"""
+        return LookupByIndexKeysCommand(self, NAT_BY_FIP_PORT_INDEX,
+                                        port_ids)
+
+    def lb_update_vips(self, lb_uuid, vips_to_set, vips_to_del):
+        """Set and delete the given keys of the vips of a Load_Balancer"""
+        return UpdateLbVipsCommand(self, lb_uuid, vips_to_set, vips_to_del)
+
+    def lb_update_external_ids(self, lb_uuid, keys_to_set, keys_to_del):
+        """Set and delete the given keys of the external_ids of a LB"""
+        return UpdateLbExternalIdsCommand(self, lb_uuid, keys_to_set,
+                                          keys_to_del)
+
     # NOTE(froyo): remove this method once ovsdbapp manages the IPv6 into [ ]
     def lb_del_ip_port_mapping(self, lb_uuid, backend_ip):
         return DelBackendFromIPPortMapping(self, lb_uuid, backend_ip)
@@ -205,24 +676,126 @@ class OvsdbSbOvnIdl(sb_impl_idl.OvnSbApiIdlImpl, Backend):
             config.get_ovn_ovsdb_probe_interval())
 
 
+def register_tables(helper, tables):
+    """Register the tables in the schema helper
+
+    :param helper: the ovs.db.idl.SchemaHelper of the IDL.
+    :param tables: dict of table name -> list of columns to replicate, or
+                   None to replicate all the columns of the table.
+    """
+    for table, columns in tables.items():
+        if columns is None:
+            helper.register_table(table)
+        else:
+            helper.register_columns(table, list(columns))
+
+
 class OvnNbIdlForLb(ovsdb_monitor.OvnIdl):
     SCHEMA = "OVN_Northbound"
-    TABLES = ('Logical_Switch', 'Load_Balancer', 'Load_Balancer_Health_Check',
-              'Logical_Router', 'Logical_Switch_Port', 'Logical_Router_Port',
-              'Gateway_Chassis', 'NAT')
-
-    def __init__(self, event_lock_name=None, notifier=True):
+    # Table -> columns replicated in the IDL, None meaning all of them.
+    # NOTE: every column read or written by the provider, including the
+    # ones written by the ovsdbapp commands it uses (e.g. ls_lb_add writes
+    # Logical_Switch.load_balancer), must be listed here.
+    TABLES = {
+        'Logical_Switch': ('name', 'ports', 'load_balancer', 'external_ids'),
+        'Load_Balancer': None,
+        'Load_Balancer_Health_Check': None,
+        'Logical_Router': ('name', 'ports', 'load_balancer', 'external_ids'),
+        'Logical_Switch_Port': ('name', 'addresses', 'external_ids', 'type',
+                                'options'),
+        'Logical_Router_Port': ('name', 'networks', 'gateway_chassis',
+                                'external_ids'),
+        'Gateway_Chassis': ('name',),
+        'NAT': ('external_ids', 'external_ip', 'external_mac',
+                'logical_port'),
+    }
+
+    def __init__(self, event_lock_name=None, notifier=True,
+                 lb_ports_only=False):
         self.conn_string = config.get_ovn_nb_connection()
         ovsdb_monitor.check_and_set_ssl_files(self.SCHEMA)
         helper = self._get_ovsdb_helper(self.conn_string)
-        for table in OvnNbIdlForLb.TABLES:
-            helper.register_table(table)
+        register_tables(helper, OvnNbIdlForLb.TABLES)
         super().__init__(
             driver=None, remote=self.conn_string, schema=helper,
             notifier=notifier)
+        self._create_row_indexes()
+        self.lb_external_ids_cache = ParsedRowCache(
+            'external_ids',
+            lambda row, previous: lb_external_ids.LbExternalIds(
+                row.external_ids, previous=previous))
         self.event_lock_name = event_lock_name
         if self.event_lock_name:
             self.set_lock(self.event_lock_name)
+        # NOTE: with lb_ports_only, only the Logical_Switch_Port rows
+        # relevant to the load balancers are received from the server
+        # (see LSP_LB_CONDITION), plus the VIP ports of the Load_Balancer
+        # rows, whose names are added to the monitor condition as the load
+        # balancers are created and deleted.
+        self._lb_ports_only = lb_ports_only
+        self._lsp_condition_ports = None
+        self._vip_ports_changed = False
+        # Functions called with the network id of the Logical_Switch rows,
+        # and of the router Logical_Switch_Port rows, created, deleted or
+        # whose external_ids changed (e.g. to drop the cached Neutron
+        # attributes of the network).
+        self.ls_change_callbacks = []
+        if self._lb_ports_only:
+            self._update_lsp_condition()
+
+    def _create_row_indexes(self):
+        for name, (table, key_fn) in NB_ROW_INDEXES.items():
+            if table in self.tables:
+                self.tables[table].rows.indexes[name] = RowIndex(name, key_fn)
+
+    def _update_lsp_condition(self):
+        ports = set(self.tables['Load_Balancer'].rows.indexes[
+            LB_BY_VIP_PORT_INDEX].keys())
+        if ports == self._lsp_condition_ports:
+            return
+        self._lsp_condition_ports = ports
+        self.cond_change(
+            'Logical_Switch_Port',
+            LSP_LB_CONDITION + [['name', '==', port]
+                                for port in sorted(ports)])
+
+    def notify(self, event, row, updates=None):
+        if (row._table.name == 'Load_Balancer' and
+                event == row_event.RowEvent.ROW_DELETE):
+            self.lb_external_ids_cache.remove(row)
+        if self._lb_ports_only and row._table.name == 'Load_Balancer' and (
+                event != row_event.RowEvent.ROW_UPDATE or
+                hasattr(updates, 'external_ids')):
+            self._vip_ports_changed = True
+        if self.ls_change_callbacks and (
+                event != row_event.RowEvent.ROW_UPDATE or
+                hasattr(updates, 'external_ids')):
+            network_id = self._get_changed_network_id(row)
+            if network_id:
+                for callback in self.ls_change_callbacks:
+                    callback(network_id)
+        super().notify(event, row, updates)
+
+    @staticmethod
+    def _get_changed_network_id(row):
+        if row._table.name == 'Logical_Switch':
+            return utils.ovn_uuid(row.name)
+        if row._table.name == 'Logical_Switch_Port' and row.type == 'router':
+            network_name = row.external_ids.get(
+                ovn_const.OVN_NETWORK_NAME_EXT_ID_KEY)
+            if network_name:
+                return utils.ovn_uuid(network_name)
+        return None
+
+    def run(self):
+        # The monitor condition is updated once all the updates received
+        # from the server have been processed, not once per row.
+        ret = super().run()
+        if self._vip_ports_changed:
+            self._vip_ports_changed = False
+            self._update_lsp_condition()
+        self.lb_external_ids_cache.prune(self.tables['Load_Balancer'].rows)
+        return ret
 
     @utils.retry()
     def _get_ovsdb_helper(self, connection_string):
@@ -231,14 +804,17 @@ class OvnNbIdlForLb(ovsdb_monitor.OvnIdl):
 
 class OvnSbIdlForLb(ovsdb_monitor.OvnIdl):
     SCHEMA = "OVN_Southbound"
-    TABLES = ('Load_Balancer', 'Service_Monitor')
+    # Only the Service_Monitor columns used by ServiceMonitorUpdateEvent.
+    TABLES = {
+        'Service_Monitor': ('ip', 'port', 'protocol', 'logical_port',
+                            'src_ip', 'status'),
+    }
 
     def __init__(self, event_lock_name=None):
         self.conn_string = config.get_ovn_sb_connection()
         ovsdb_monitor.check_and_set_ssl_files(self.SCHEMA)
         helper = self._get_ovsdb_helper(self.conn_string)
-        for table in OvnSbIdlForLb.TABLES:
-            helper.register_table(table)
+        register_tables(helper, OvnSbIdlForLb.TABLES)
         super().__init__(
             driver=None, remote=self.conn_string, schema=helper)
         self.event_lock_name = event_lock_name
@@ -213,6 +213,13 @@ class TestOvnOctaviaBase(base.TestOVNFunctionalBase,
                 external_ids[
                     ovn_const.OVN_MEMBER_STATUS_KEY] = jsonutils.loads(
                         member_status)
+            # Gather the per member status keys with the legacy ones.
+            for key in list(external_ids):
+                if key.startswith(ovn_const.OVN_MEMBER_STATUS_PREFIX):
+                    external_ids.setdefault(
+                        ovn_const.OVN_MEMBER_STATUS_KEY, {})[
+                            key[len(ovn_const.OVN_MEMBER_STATUS_PREFIX):]] = \
+                        external_ids.pop(key)
             lb_dict = {'name': lb.name, 'protocol': lb.protocol,
                        'vips': lb.vips, 'external_ids': external_ids}
             try:
@@ -45,7 +45,7 @@ class TestOvnOctaviaProviderAgent(ovn_base.TestOvnOctaviaBase):
         events = [ovn_event.LogicalRouterPortEvent(da_helper),
                   ovn_event.LogicalSwitchPortUpdateEvent(da_helper)]
         ovn_nb_idl_for_events = impl_idl_ovn.OvnNbIdlForLb(
-            event_lock_name='func_test')
+            event_lock_name='func_test', lb_ports_only=True)
         ovn_nb_idl_for_events.notify_handler.watch_events(events)
         c = connection.Connection(ovn_nb_idl_for_events,
                                   ovn_config.get_ovn_ovsdb_timeout())
@@ -17,6 +17,8 @@ from neutron.tests import base
 from octavia_lib.api.drivers import driver_lib
 from oslo_utils import uuidutils
 
+from ovn_octavia_provider.common import clients
+
 
 class TestOvnOctaviaBase(base.BaseTestCase):
 
@@ -37,6 +39,7 @@ class TestOvnOctaviaBase(base.BaseTestCase):
         self.vip_port_id = uuidutils.generate_uuid()
         self.vip_subnet_id = uuidutils.generate_uuid()
         self.healthmonitor_id = uuidutils.generate_uuid()
+        mock.patch.object(clients, '_neutron_resource_cache', None).start()
         ovn_nb_idl = mock.patch(
             'ovn_octavia_provider.ovsdb.impl_idl_ovn.OvnNbIdlForLb')
         self.mock_ovn_nb_idl = ovn_nb_idl.start()
@@ -15,6 +15,7 @@ from unittest import mock
 
 from keystoneauth1 import exceptions as ks_exceptions
 from octavia_lib.api.drivers import exceptions as driver_exceptions
+import openstack
 from oslo_config import cfg
 from oslo_config import fixture as oslo_fixture
 from oslotest import base
@@ -195,3 +196,113 @@ class TestOctaviaAuth(base.BaseTestCase):
             driver_exceptions.DriverError,
             clients.get_octavia_client)
         self.assertEqual("An unknown driver error occurred.", str(msg))
+
+
+class TestNeutronResourceCache(base.BaseTestCase):
+    def setUp(self):
+        super().setUp()
+        self.cache = clients.NeutronResourceCache(60, 3)
+        self.neutron_client = mock.Mock()
+        self.neutron_client.get_subnet.side_effect = (
+            lambda subnet_id: mock.Mock(
+                id=subnet_id, network_id='net-' + subnet_id[-1],
+                cidr='10.0.0.0/24', gateway_ip='10.0.0.1', ip_version=4))
+        self.neutron_client.get_network.side_effect = (
+            lambda network_id: mock.Mock(
+                id=network_id, provider_physical_network=None))
+
+    def test_get_subnet(self):
+        subnet = self.cache.get_subnet(self.neutron_client, 'subnet-1')
+        self.assertEqual(
+            clients.CachedSubnet('subnet-1', 'net-1', '10.0.0.0/24',
+                                 '10.0.0.1', 4), subnet)
+        self.assertIs(subnet,
+                      self.cache.get_subnet(self.neutron_client, 'subnet-1'))
+        self.neutron_client.get_subnet.assert_called_once_with('subnet-1')
+
+    def test_get_network(self):
+        network = self.cache.get_network(self.neutron_client, 'net-1')
+        self.assertEqual(clients.CachedNetwork('net-1', None), network)
+        self.assertIs(network,
+                      self.cache.get_network(self.neutron_client, 'net-1'))
+        self.neutron_client.get_network.assert_called_once_with('net-1')
+
+    def test_errors_not_cached(self):
+        self.neutron_client.get_subnet.side_effect = [
+            openstack.exceptions.ResourceNotFound, mock.DEFAULT]
+        self.neutron_client.get_subnet.return_value = mock.Mock(
+            id='subnet-1', network_id='net-1')
+        self.assertRaises(openstack.exceptions.ResourceNotFound,
+                          self.cache.get_subnet, self.neutron_client,
+                          'subnet-1')
+        self.assertEqual('net-1', self.cache.get_subnet(
+            self.neutron_client, 'subnet-1').network_id)
+        self.assertEqual(2, self.neutron_client.get_subnet.call_count)
+
+    @mock.patch('time.monotonic')
+    def test_ttl(self, mock_time):
+        mock_time.return_value = 100
+        self.cache.get_subnet(self.neutron_client, 'subnet-1')
+        mock_time.return_value = 159
+        self.cache.get_subnet(self.neutron_client, 'subnet-1')
+        self.assertEqual(1, self.neutron_client.get_subnet.call_count)
+        mock_time.return_value = 160
+        self.cache.get_subnet(self.neutron_client, 'subnet-1')
+        self.assertEqual(2, self.neutron_client.get_subnet.call_count)
+
+    def test_ttl_disabled(self):
+        self.cache = clients.NeutronResourceCache(0, 3)
+        self.cache.get_subnet(self.neutron_client, 'subnet-1')
+        self.cache.get_subnet(self.neutron_client, 'subnet-1')
+        self.assertEqual(2, self.neutron_client.get_subnet.call_count)
+
+    def test_max_size(self):
+        for subnet_id in ('subnet-1', 'subnet-2', 'subnet-3'):
+            self.cache.get_subnet(self.neutron_client, subnet_id)
+        # subnet-1 is now the most recently used one.
+        self.cache.get_subnet(self.neutron_client, 'subnet-1')
+        self.cache.get_subnet(self.neutron_client, 'subnet-4')
+        self.neutron_client.get_subnet.reset_mock()
+        self.cache.get_subnet(self.neutron_client, 'subnet-1')
+        self.neutron_client.get_subnet.assert_not_called()
+        self.cache.get_subnet(self.neutron_client, 'subnet-2')
+        self.neutron_client.get_subnet.assert_called_once_with('subnet-2')
+
+    def test_invalidate_network(self):
+        self.cache.get_subnet(self.neutron_client, 'subnet-1')
+        self.cache.get_subnet(self.neutron_client, 'subnet-2')
+        self.cache.get_network(self.neutron_client, 'net-1')
+        self.cache.invalidate_network('net-1')
+        self.neutron_client.get_subnet.reset_mock()
+        self.neutron_client.get_network.reset_mock()
+        self.cache.get_subnet(self.neutron_client, 'subnet-1')
+        self.cache.get_subnet(self.neutron_client, 'subnet-2')
+        self.cache.get_network(self.neutron_client, 'net-1')
+        self.neutron_client.get_subnet.assert_called_once_with('subnet-1')
+        self.neutron_client.get_network.assert_called_once_with('net-1')
+
+    def test_invalidate_while_fetching(self):
+        def _get_subnet(subnet_id):
+            self.cache.invalidate_network('net-1')
+            return mock.Mock(id=subnet_id, network_id='net-1')
+
+        self.neutron_client.get_subnet.side_effect = _get_subnet
+        self.cache.get_subnet(self.neutron_client, 'subnet-1')
+        self.cache.get_subnet(self.neutron_client, 'subnet-1')
+        self.assertEqual(2, self.neutron_client.get_subnet.call_count)
+
+    def test_clear(self):
+        self.cache.get_subnet(self.neutron_client, 'subnet-1')
+        self.cache.clear()
+        self.cache.get_subnet(self.neutron_client, 'subnet-1')
+        self.assertEqual(2, self.neutron_client.get_subnet.call_count)
+
+    @mock.patch.object(clients, '_neutron_resource_cache', None)
+    def test_get_neutron_resource_cache(self):
+        config.register_opts()
+        conf = self.useFixture(oslo_fixture.Config(cfg.CONF))
+        conf.config(neutron_cache_ttl=30, neutron_cache_size=10, group='ovn')
+        cache = clients.get_neutron_resource_cache()
+        self.assertEqual(30, cache.ttl)
+        self.assertEqual(10, cache.max_size)
+        self.assertIs(cache, clients.get_neutron_resource_cache())
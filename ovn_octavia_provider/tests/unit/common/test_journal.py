@@ -0,0 +1,148 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+from concurrent import futures
+import os
+from unittest import mock
+
+from neutron.tests import base
+
+from ovn_octavia_provider.common import constants as ovn_const
+from ovn_octavia_provider.common import exceptions
+from ovn_octavia_provider.common import journal
+
+
+class TestRequestJournal(base.BaseTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.path = os.path.join(self.get_new_temp_dir().path,
+                                 'journal.sqlite')
+        self.journal = self._start_journal()
+
+    def _start_journal(self):
+        request_journal = journal.RequestJournal(self.path)
+        request_journal.start()
+        self.addCleanup(request_journal.stop)
+        return request_journal
+
+    def _request(self, request_id):
+        return {'type': ovn_const.REQ_TYPE_MEMBER_DELETE,
+                'info': {'id': request_id, 'pool_id': 'pool'}}
+
+    def _set_other_process(self, request_journal):
+        request_journal._owner = '%s:%d:1:owner' % (request_journal._host,
+                                                    os.getpid() + 1)
+
+    def _count(self, request_journal):
+        return request_journal._conn.execute(
+            'SELECT COUNT(*) FROM requests').fetchone()[0]
+
+    def test_record_and_complete(self):
+        journal_id = self.journal.record(self._request('foo'))
+        self.assertEqual(1, self._count(self.journal))
+        self.journal.complete([journal_id])
+        # Any later record is committed after the queued completion.
+        self.journal.record(self._request('bar'))
+        self.assertEqual(1, self._count(self.journal))
+
+    def test_claim_incomplete_dead_owner(self):
+        self._set_other_process(self.journal)
+        self.journal.record(self._request('foo'))
+        self.journal.record(self._request('bar'))
+        journal_id = self.journal.record(self._request('baz'))
+        self.journal.complete([journal_id])
+        self.journal.stop()
+        self.journal._thread.join()
+
+        new_journal = journal.RequestJournal(self.path)
+        with mock.patch.object(journal.RequestJournal, '_is_process_alive',
+                               return_value=False):
+            requests = new_journal.claim_incomplete()
+        self.assertEqual(['foo', 'bar'],
+                         [req['info']['id'] for req in requests])
+        for req in requests:
+            self.assertEqual(1, len(req[ovn_const.REQ_JOURNAL_IDS]))
+            del req[ovn_const.REQ_JOURNAL_IDS]
+        self.assertEqual([self._request('foo'), self._request('bar')],
+                         requests)
+
+    def test_claim_incomplete_alive_owner(self):
+        self._set_other_process(self.journal)
+        self.journal.record(self._request('foo'))
+        new_journal = journal.RequestJournal(self.path)
+        with mock.patch.object(journal.RequestJournal, '_is_process_alive',
+                               return_value=True), mock.patch.object(
+                journal, '_get_process_start_time', return_value='1'):
+            self.assertEqual([], new_journal.claim_incomplete())
+
+    def test_claim_incomplete_pid_reused(self):
+        self._set_other_process(self.journal)
+        self.journal.record(self._request('foo'))
+        new_journal = journal.RequestJournal(self.path)
+        with mock.patch.object(journal.RequestJournal, '_is_process_alive',
+                               return_value=True), mock.patch.object(
+                journal, '_get_process_start_time', return_value='2'):
+            requests = new_journal.claim_incomplete()
+        self.assertEqual(['foo'], [req['info']['id'] for req in requests])
+
+    def test_claim_incomplete_same_process(self):
+        # The requests of another journal of the process are not taken
+        # over while it is running.
+        self.journal.record(self._request('foo'))
+        new_journal = self._start_journal()
+        self.assertEqual([], journal.RequestJournal(
+            self.path).claim_incomplete())
+        new_journal.record(self._request('bar'))
+        self.assertEqual([], journal.RequestJournal(
+            self.path).claim_incomplete())
+        self.journal.stop()
+        requests = journal.RequestJournal(self.path).claim_incomplete()
+        self.assertEqual(['foo'], [req['info']['id'] for req in requests])
+
+    def test_stop(self):
+        journal_id = self.journal.record(self._request('foo'))
+        self.journal.stop()
+        self.assertFalse(self.journal._thread.is_alive())
+        self.journal.stop()
+        # The requests completed once stopped are replayed.
+        self.journal.complete([journal_id])
+        self.assertEqual(1, self._count(self.journal))
+        self.assertRaises(exceptions.JournalStopped, self.journal.record,
+                          self._request('bar'))
+
+    def test_claim_incomplete_other_host(self):
+        self.journal.record(self._request('foo'))
+        new_journal = journal.RequestJournal(self.path)
+        new_journal._host = 'other_host'
+        new_journal._owner = 'other_host:1:1'
+        with mock.patch.object(journal.RequestJournal, '_is_process_alive',
+                               return_value=False):
+            self.assertEqual([], new_journal.claim_incomplete())
+
+    def test_group_commit(self):
+        request_journal = journal.RequestJournal(self.path)
+        request_journal._conn = mock.Mock(wraps=request_journal._conn)
+        requests_done = []
+        for request_id in ('foo', 'bar', 'baz'):
+            done = futures.Future()
+            request_journal._ops.put(
+                (journal._OP_RECORD, (request_id, 'owner', 0, '{}'), done))
+            requests_done.append(done)
+        request_journal.start()
+        self.addCleanup(request_journal.stop)
+        for done in requests_done:
+            done.result()
+        self.assertEqual(3, self._count(request_journal))
+        self.assertEqual(
+            1, request_journal._conn.execute.mock_calls.count(
+                mock.call('COMMIT')))
@@ -0,0 +1,132 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+from neutron.tests import base
+
+from ovn_octavia_provider.common import constants as ovn_const
+from ovn_octavia_provider.common import lb_external_ids
+
+
+class TestLbExternalIds(base.BaseTestCase):
+
+    def test_parse(self):
+        external_ids = {
+            ovn_const.LB_EXT_IDS_VIP_KEY: '10.0.0.10',
+            ovn_const.LB_EXT_IDS_ADDIT_VIP_KEY: '10.0.1.10,fd00::10',
+            ovn_const.LB_EXT_IDS_VIP_FIP_KEY: '172.24.4.10',
+            ovn_const.LB_EXT_IDS_ADDIT_VIP_FIP_KEY: '172.24.4.11',
+            ovn_const.LB_EXT_IDS_LS_REFS_KEY: '{"neutron-foo": 1}',
+            ovn_const.LB_EXT_IDS_HMS_KEY: '["hm1"]',
+            ovn_const.OVN_MEMBER_STATUS_KEY: '{"m1": "ONLINE"}',
+            'enabled': 'True',
+            'listener_l1': '80:pool_p1',
+            'listener_l2:D': '81:pool_p1',
+            'listener_l3': '82:',
+            'pool_p1': 'member_m1_10.0.0.20:8080_s1,'
+                       'member_m2_fd00::20:8080_s2',
+            'pool_p2:D': ''}
+        lb_ext_ids = lb_external_ids.LbExternalIds(external_ids)
+        self.assertTrue(lb_ext_ids.enabled)
+        self.assertEqual(['10.0.0.10', '10.0.1.10', 'fd00::10'],
+                         lb_ext_ids.vips)
+        self.assertEqual('172.24.4.10', lb_ext_ids.vip_fip)
+        self.assertEqual(['172.24.4.11'], lb_ext_ids.additional_vip_fips)
+        self.assertEqual({'neutron-foo': 1}, lb_ext_ids.ls_refs)
+        self.assertEqual(['hm1'], lb_ext_ids.hm_ids)
+        self.assertEqual({'m1': 'ONLINE'}, lb_ext_ids.member_statuses)
+
+        self.assertEqual(['l1', 'l2:D'],
+                         lb_ext_ids.get_pool_listeners('pool_p1'))
+        self.assertEqual('80', lb_ext_ids.get_pool_listener_port('pool_p1'))
+        self.assertIsNone(lb_ext_ids.get_pool_listener_port('pool_p2'))
+        self.assertFalse(lb_ext_ids.listeners['listener_l2:D'].enabled)
+        self.assertEqual([], lb_ext_ids.listeners['listener_l3'].pool_ids)
+
+        self.assertEqual([('10.0.0.20', '8080', 's1', 'm1'),
+                          ('fd00::20', '8080', 's2', 'm2')],
+                         [member.as_tuple() for member in
+                          lb_ext_ids.get_members('pool_p1')])
+        pool = lb_ext_ids.pools['pool_p2:D']
+        self.assertEqual('p2:D', pool.id)
+        self.assertFalse(pool.enabled)
+        self.assertEqual((), pool.members)
+        self.assertEqual((), lb_ext_ids.get_members('pool_p3'))
+
+    def test_parse_member_status_keys(self):
+        lb_ext_ids = lb_external_ids.LbExternalIds({
+            ovn_const.OVN_MEMBER_STATUS_KEY:
+                '{"m1": "ONLINE", "m2": "ONLINE"}',
+            ovn_const.OVN_MEMBER_STATUS_PREFIX + 'm2': 'OFFLINE',
+            ovn_const.OVN_MEMBER_STATUS_PREFIX + 'm3': 'ERROR'})
+        self.assertTrue(lb_ext_ids.has_legacy_member_status)
+        # The keys of the members take precedence over the legacy key.
+        self.assertEqual({'m1': 'ONLINE', 'm2': 'OFFLINE', 'm3': 'ERROR'},
+                         lb_ext_ids.member_statuses)
+        self.assertEqual(frozenset(['m2']), lb_ext_ids.offline_member_ids)
+
+        lb_ext_ids = lb_external_ids.LbExternalIds({
+            ovn_const.OVN_MEMBER_STATUS_PREFIX + 'm1': 'ONLINE'})
+        self.assertFalse(lb_ext_ids.has_legacy_member_status)
+        self.assertEqual({'m1': 'ONLINE'}, lb_ext_ids.member_statuses)
+
+    def test_get_member_status_keys(self):
+        self.assertEqual(
+            {ovn_const.OVN_MEMBER_STATUS_PREFIX + 'm1': 'ONLINE',
+             ovn_const.OVN_MEMBER_STATUS_PREFIX + 'm2': 'ERROR'},
+            lb_external_ids.get_member_status_keys(
+                {'m1': 'ONLINE', 'm2': 'ERROR'}))
+
+    def test_parse_empty(self):
+        lb_ext_ids = lb_external_ids.LbExternalIds({
+            'enabled': 'False',
+            ovn_const.LB_EXT_IDS_LS_REFS_KEY: 'malformed'})
+        self.assertFalse(lb_ext_ids.enabled)
+        self.assertEqual([], lb_ext_ids.vips)
+        self.assertEqual([], lb_ext_ids.additional_vip_fips)
+        self.assertEqual({}, lb_ext_ids.ls_refs)
+        self.assertEqual([], lb_ext_ids.hm_ids)
+        self.assertEqual({}, lb_ext_ids.member_statuses)
+        self.assertFalse(lb_ext_ids.has_legacy_member_status)
+        self.assertEqual({}, lb_ext_ids.listeners)
+        self.assertEqual({}, lb_ext_ids.pools)
+
+    def test_get_backends(self):
+        lb_ext_ids = lb_external_ids.LbExternalIds({
+            ovn_const.OVN_MEMBER_STATUS_KEY:
+                '{"m1": "ONLINE", "m2": "OFFLINE", "m4": "OFFLINE"}',
+            'pool_p1': 'member_m1_10.0.0.20:8080_s1,'
+                       'member_m2_10.0.0.21:8080_s1,'
+                       'member_m3_fd00::20:8080_s2'})
+        self.assertEqual(frozenset(['m2', 'm4']),
+                         lb_ext_ids.offline_member_ids)
+        pool = lb_ext_ids.pools['pool_p1']
+        backends = pool.get_backends(lb_ext_ids.offline_member_ids)
+        self.assertEqual(('10.0.0.20:8080', '[fd00::20]:8080'), backends)
+        # The offline members of other pools do not invalidate the result.
+        self.assertIs(backends, pool.get_backends(frozenset(['m2', 'm5'])))
+        self.assertEqual(('10.0.0.20:8080,10.0.0.21:8080', '[fd00::20]:8080'),
+                         pool.get_backends(frozenset()))
+
+    def test_previous_pools(self):
+        previous = lb_external_ids.LbExternalIds({
+            'pool_p1': 'member_m1_10.0.0.20:8080_s1',
+            'pool_p2': 'member_m2_10.0.0.21:8080_s1'})
+        lb_ext_ids = lb_external_ids.LbExternalIds({
+            'pool_p1': 'member_m1_10.0.0.20:8080_s1',
+            'pool_p2': 'member_m3_10.0.0.22:8080_s1'}, previous=previous)
+        self.assertIs(previous.pools['pool_p1'], lb_ext_ids.pools['pool_p1'])
+        self.assertEqual(['m3'], [member.id for member in
+                                  lb_ext_ids.pools['pool_p2'].members])
+
+    def test_parse_members_malformed(self):
+        self.assertRaises(IndexError, lb_external_ids.parse_members,
+                          'member_m1')
@@ -0,0 +1,150 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import os
+from unittest import mock
+
+from neutron.tests import base
+
+from ovn_octavia_provider.common import metrics
+
+
+class TestHistogram(base.BaseTestCase):
+
+    def test_observe(self):
+        histogram = metrics.Histogram(buckets=(0.1, 1.0))
+        histogram.observe(0.05)
+        histogram.observe(0.5)
+        histogram.observe(5)
+        self.assertEqual([1, 2], histogram.counts)
+        self.assertEqual(3, histogram.count)
+        self.assertEqual(5.55, histogram.sum)
+
+
+class TestRequestMetrics(base.BaseTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.metrics = metrics.RequestMetrics()
+
+    def test_render(self):
+        self.metrics.request_queued('member_update')
+        self.metrics.request_queued('member_update')
+        self.metrics.request_folded('member_update')
+        self.metrics.request_started('member_update', 0.02)
+        self.metrics.request_processed('member_update', 0.3)
+        self.metrics.request_queued('lb_create')
+        self.metrics.request_started('lb_create', 1)
+        self.metrics.request_processed(
+            'lb_create', 7, result=metrics.REQUEST_RESULT_ERROR)
+        lines = self.metrics.render(
+            queue_depth={'crud': 3, 'hm_event': 0}).splitlines()
+
+        prefix = metrics.METRICS_PREFIX
+        self.assertIn(
+            f'{prefix}_requests_queued_total{{type="member_update"}} 2',
+            lines)
+        self.assertIn(
+            f'{prefix}_requests_folded_total{{type="member_update"}} 1',
+            lines)
+        self.assertIn(
+            f'{prefix}_requests_processed_total{{type="lb_create",'
+            f'result="error"}} 1', lines)
+        self.assertIn(
+            f'{prefix}_request_wait_seconds_bucket{{type="member_update",'
+            f'le="0.025"}} 1', lines)
+        self.assertIn(
+            f'{prefix}_request_wait_seconds_bucket{{type="member_update",'
+            f'le="0.01"}} 0', lines)
+        self.assertIn(
+            f'{prefix}_request_duration_seconds_bucket{{type="lb_create",'
+            f'le="+Inf"}} 1', lines)
+        self.assertIn(
+            f'{prefix}_request_duration_seconds_sum{{type="lb_create"}} 7.0',
+            lines)
+        self.assertIn(f'{prefix}_requests_queue_depth{{lane="crud"}} 3',
+                      lines)
+        self.assertIn(f'# TYPE {prefix}_request_wait_seconds histogram',
+                      lines)
+
+    def test_render_no_queue_depth(self):
+        self.assertNotIn('queue_depth', self.metrics.render())
+
+
+class TestMetricsFileReporter(base.BaseTestCase):
+
+    def test_report(self):
+        path = os.path.join(self.get_new_temp_dir().path,
+                            'metrics-{pid}.prom')
+        reporter = metrics.MetricsFileReporter(
+            path, 30, lambda: 'foo_metric 1\n')
+        reporter.report()
+        with open(path.replace('{pid}', str(os.getpid())),
+                  encoding='utf-8') as f:
+            self.assertEqual('foo_metric 1\n', f.read())
+
+    def test_report_error(self):
+        temp_dir = self.get_new_temp_dir().path
+        path = os.path.join(temp_dir, 'metrics.prom')
+        reporter = metrics.MetricsFileReporter(
+            path, 30, mock.Mock(side_effect=Exception))
+        reporter.report()
+        self.assertEqual([], os.listdir(temp_dir))
+
+    def test_stop(self):
+        path = os.path.join(self.get_new_temp_dir().path, 'metrics.prom')
+        render = mock.Mock(return_value='foo_metric 1\n')
+        reporter = metrics.MetricsFileReporter(path, 30, render)
+        reporter.start()
+        self.assertFalse(os.path.exists(path))
+        reporter.stop()
+        reporter.stop()
+        render.assert_called_once_with()
+        with open(path, encoding='utf-8') as f:
+            self.assertEqual('foo_metric 1\n', f.read())
+
+
+class TestProcessMetrics(base.BaseTestCase):
+
+    def setUp(self):
+        super().setUp()
+        mock.patch.object(metrics, '_request_metrics',
+                          metrics.RequestMetrics()).start()
+        mock.patch.object(metrics, '_file_reporter', None).start()
+
+    def test_render(self):
+        class FakeRequestsQueue():
+            def lanes_qsize(self):
+                return {'crud': 2, 'hm_event': 1}
+
+        requests = FakeRequestsQueue()
+        metrics.get_request_metrics().add_queue(requests)
+        metrics.get_request_metrics().request_queued('lb_create')
+        rendered = metrics.render()
+        self.assertIn('ovn_octavia_provider_requests_queued_total'
+                      '{type="lb_create"} 1', rendered)
+        self.assertIn('ovn_octavia_provider_requests_queue_depth'
+                      '{lane="crud"} 2', rendered)
+        del requests
+        self.assertNotIn('ovn_octavia_provider_requests_queue_depth'
+                         '{lane="crud"}', metrics.render())
+
+    @mock.patch.object(metrics, 'MetricsFileReporter')
+    def test_file_reporter(self, mock_reporter):
+        metrics.start_file_reporter('/tmp/metrics.prom', 30)
+        metrics.start_file_reporter('/tmp/metrics.prom', 30)
+        mock_reporter.assert_called_once_with(
+            '/tmp/metrics.prom', 30, metrics.render)
+        mock_reporter.return_value.start.assert_called_once_with()
+        metrics.stop_file_reporter()
+        metrics.stop_file_reporter()
+        mock_reporter.return_value.stop.assert_called_once_with()
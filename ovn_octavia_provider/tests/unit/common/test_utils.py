@@ -66,3 +66,10 @@ class TestRetryDecorator(base.BaseTestCase):
 
         # number of exceptions + one successful call
         self.assertEqual(number_of_exceptions + 1, method.call_count)
+
+
+class TestGetIpVersion(base.BaseTestCase):
+
+    def test_get_ip_version(self):
+        self.assertEqual(4, utils.get_ip_version('10.0.0.1'))
+        self.assertEqual(6, utils.get_ip_version('fd00::1'))
@@ -12,16 +12,24 @@
 #    under the License.
 #
 
+import contextlib
 import os
+import threading
 from unittest import mock
+import uuid
 
 from neutron.tests import base
+from ovs.db import data as ovs_data
 from ovs.db import idl as ovs_idl
 from ovsdbapp.backend import ovs_idl as real_ovs_idl
 from ovsdbapp.backend.ovs_idl import idlutils
+from ovsdbapp.backend.ovs_idl import rowview
 
 from ovn_octavia_provider.common import config as ovn_config
+from ovn_octavia_provider.common import constants as ovn_const
 from ovn_octavia_provider.ovsdb import impl_idl_ovn
+from ovn_octavia_provider.ovsdb import ovsdb_monitor
+from ovn_octavia_provider.tests.unit import fakes
 
 basedir = os.path.dirname(os.path.abspath(__file__))
 schema_files = {
@@ -53,6 +61,435 @@ class TestOvnNbIdlForLb(base.BaseTestCase):
             self.idl = impl_idl_ovn.OvnNbIdlForLb(event_lock_name='foo')
         set_lock.assert_called_once_with('foo')
 
+    def test_registered_columns(self):
+        schema_helper = ovs_idl.SchemaHelper(
+            location=schema_files['OVN_Northbound'])
+        schema_helper.register_all()
+        schema_tables = schema_helper.get_idl_schema().tables
+        for table, columns in impl_idl_ovn.OvnNbIdlForLb.TABLES.items():
+            if columns is None:
+                columns = schema_tables[table].columns
+            self.assertEqual(set(columns),
+                             set(self.idl.tables[table].columns))
+        self.assertEqual(set(impl_idl_ovn.OvnNbIdlForLb.TABLES),
+                         set(self.idl.tables))
+
+    def _add_row(self, table, row):
+        self.idl.tables[table].rows[row.uuid] = row
+        return row
+
+    def _datum(self, table, column, value):
+        return ovs_data.Datum.from_python(
+            self.idl.tables[table].columns[column].type, value,
+            lambda value: getattr(value, 'uuid', value))
+
+    def _create_row(self, table, **values):
+        # Create a real IDL row, for the indexes using the raw row data
+        idl_table = self.idl.tables[table]
+        data = {
+            name: (self._datum(table, name, values[name]) if name in values
+                   else ovs_data.Datum.default(column.type))
+            for name, column in idl_table.columns.items()}
+        return ovs_idl.Row(self.idl, idl_table, uuid.uuid4(), data)
+
+    def _update_row(self, table, row, **values):
+        # The IDL removes the row with its old values and adds it back once
+        # the update has been applied.
+        rows = self.idl.tables[table].rows
+        del rows[row.uuid]
+        for column, value in values.items():
+            if isinstance(row, ovs_idl.Row):
+                row._data[column] = self._datum(table, column, value)
+            else:
+                setattr(row, column, value)
+        rows[row.uuid] = row
+
+    def _lookup(self, index, key):
+        cmd = impl_idl_ovn.LookupByIndexCommand(
+            mock.Mock(tables=self.idl.tables), index, key)
+        cmd.run_idl(None)
+        return sorted(row.uuid for row in cmd.result)
+
+    def test_lb_by_name_index(self):
+        lb1 = self._add_row('Load_Balancer', fakes.FakeOvsdbRow.
+                            create_one_ovsdb_row(attrs={'name': 'foo'}))
+        lb2 = self._add_row('Load_Balancer', fakes.FakeOvsdbRow.
+                            create_one_ovsdb_row(attrs={'name': 'foo'}))
+        self.assertEqual(sorted([lb1.uuid, lb2.uuid]),
+                         self._lookup(impl_idl_ovn.LB_BY_NAME_INDEX, 'foo'))
+
+        self._update_row('Load_Balancer', lb2, name='bar')
+        self.assertEqual([lb1.uuid],
+                         self._lookup(impl_idl_ovn.LB_BY_NAME_INDEX, 'foo'))
+        self.assertEqual([lb2.uuid],
+                         self._lookup(impl_idl_ovn.LB_BY_NAME_INDEX, 'bar'))
+
+        del self.idl.tables['Load_Balancer'].rows[lb1.uuid]
+        self.assertEqual([],
+                         self._lookup(impl_idl_ovn.LB_BY_NAME_INDEX, 'foo'))
+
+        self.idl.tables['Load_Balancer'].rows.clear()
+        self.assertEqual([],
+                         self._lookup(impl_idl_ovn.LB_BY_NAME_INDEX, 'bar'))
+
+    def test_lb_by_pool_key_index(self):
+        lb = self._add_row('Load_Balancer', fakes.FakeOvsdbRow.
+                           create_one_ovsdb_row(attrs={'external_ids': {
+                               'pool_foo': 'member_1', 'pool_bar:D': '',
+                               'listener_baz': '80:pool_foo'}}))
+        self._add_row('Load_Balancer', fakes.FakeOvsdbRow.
+                      create_one_ovsdb_row(attrs={'external_ids': {
+                          ovn_const.OVN_DEVICE_OWNER_EXT_ID_KEY:
+                              ovn_const.PORT_FORWARDING_PLUGIN,
+                          'pool_foo': ''}}))
+        index = impl_idl_ovn.LB_BY_POOL_KEY_INDEX
+        self.assertEqual([lb.uuid], self._lookup(index, 'pool_foo'))
+        self.assertEqual([lb.uuid], self._lookup(index, 'pool_bar:D'))
+        self.assertEqual([], self._lookup(index, 'listener_baz'))
+
+        # The pool is disabled
+        self._update_row('Load_Balancer', lb, external_ids={
+            'pool_foo:D': 'member_1', 'pool_bar:D': ''})
+        self.assertEqual([], self._lookup(index, 'pool_foo'))
+        self.assertEqual([lb.uuid], self._lookup(index, 'pool_foo:D'))
+
+    def test_lb_by_hm_id_index(self):
+        lb = self._add_row('Load_Balancer', fakes.FakeOvsdbRow.
+                           create_one_ovsdb_row(attrs={'external_ids': {
+                               ovn_const.LB_EXT_IDS_HMS_KEY:
+                                   '["foobar", "baz"]'}}))
+        self._add_row('Load_Balancer', fakes.FakeOvsdbRow.
+                      create_one_ovsdb_row(attrs={'external_ids': {
+                          ovn_const.LB_EXT_IDS_HMS_KEY: 'malformed'}}))
+        index = impl_idl_ovn.LB_BY_HM_ID_INDEX
+        self.assertEqual([lb.uuid], self._lookup(index, 'foobar'))
+        self.assertEqual([lb.uuid], self._lookup(index, 'baz'))
+        # No substring matches
+        self.assertEqual([], self._lookup(index, 'foo'))
+
+        self._update_row('Load_Balancer', lb, external_ids={})
+        self.assertEqual([], self._lookup(index, 'foobar'))
+
+    def test_lb_by_ip_port_mapping_index(self):
+        lb = self._add_row('Load_Balancer', fakes.FakeOvsdbRow.
+                           create_one_ovsdb_row(attrs={
+                               'protocol': ['tcp'],
+                               'ip_port_mappings': {
+                                   '10.0.0.10': 'lsp1:10.0.0.2',
+                                   '[fd00::10]': 'lsp2:[fd00::2]'}}))
+        self._add_row('Load_Balancer', fakes.FakeOvsdbRow.
+                      create_one_ovsdb_row(attrs={
+                          'protocol': [],
+                          'ip_port_mappings': {
+                              '10.0.0.10': 'lsp1:10.0.0.2'}}))
+        index = impl_idl_ovn.LB_BY_IP_PORT_MAPPING_INDEX
+        self.assertEqual([lb.uuid], self._lookup(
+            index, ('10.0.0.10', 'lsp1', '10.0.0.2', 'tcp')))
+        self.assertEqual([lb.uuid], self._lookup(
+            index, ('fd00::10', 'lsp2', 'fd00::2', 'tcp')))
+        self.assertEqual([], self._lookup(
+            index, ('10.0.0.10', 'lsp1', '10.0.0.2', 'udp')))
+        self.assertEqual([], self._lookup(
+            index, ('10.0.0.10', 'lsp1', '10.0.0.3', 'tcp')))
+
+        self._update_row('Load_Balancer', lb, ip_port_mappings={})
+        self.assertEqual([], self._lookup(
+            index, ('10.0.0.10', 'lsp1', '10.0.0.2', 'tcp')))
+
+    def test_lb_by_vip_port_index(self):
+        lb = self._add_row('Load_Balancer', fakes.FakeOvsdbRow.
+                           create_one_ovsdb_row(attrs={'external_ids': {
+                               ovn_const.LB_EXT_IDS_VIP_PORT_ID_KEY: 'foo',
+                               ovn_const.LB_EXT_IDS_ADDIT_VIP_PORT_ID_KEY:
+                                   'bar,baz'}}))
+        index = impl_idl_ovn.LB_BY_VIP_PORT_INDEX
+        for port in ('foo', 'bar', 'baz'):
+            self.assertEqual([lb.uuid], self._lookup(index, port))
+
+        self._update_row('Load_Balancer', lb, external_ids={
+            ovn_const.LB_EXT_IDS_VIP_PORT_ID_KEY: 'foo'})
+        self.assertEqual([lb.uuid], self._lookup(index, 'foo'))
+        self.assertEqual([], self._lookup(index, 'bar'))
+
+    def test_get_lb_external_ids(self):
+        lb = self._add_row('Load_Balancer', self._create_row(
+            'Load_Balancer', external_ids={
+                'listener_foo': '80:pool_bar', 'pool_bar': ''}))
+        lb_ext_ids = impl_idl_ovn.get_lb_external_ids(lb)
+        self.assertEqual(['foo'], lb_ext_ids.get_pool_listeners('pool_bar'))
+        # Cached until the row is updated, also when got from a RowView.
+        self.assertIs(lb_ext_ids, impl_idl_ovn.get_lb_external_ids(
+            rowview.RowView(lb)))
+        self.assertIs(lb_ext_ids, impl_idl_ovn.get_lb_external_ids(
+            lb, dict(lb.external_ids)))
+        # Other external_ids are parsed without caching them.
+        self.assertEqual([], impl_idl_ovn.get_lb_external_ids(
+            lb, {'pool_bar': ''}).get_pool_listeners('pool_bar'))
+        self.assertIs(lb_ext_ids, impl_idl_ovn.get_lb_external_ids(lb))
+
+        # The view of an updated row is not returned, the pools not updated
+        # are reused.
+        pool = lb_ext_ids.pools['pool_bar']
+        self._update_row('Load_Balancer', lb, external_ids={
+            'listener_foo': '80:pool_baz', 'pool_bar': '', 'pool_baz': ''})
+        lb_ext_ids = impl_idl_ovn.get_lb_external_ids(lb)
+        self.assertEqual(['foo'], lb_ext_ids.get_pool_listeners('pool_baz'))
+        self.assertIs(pool, lb_ext_ids.pools['pool_bar'])
+        self.assertIs(lb_ext_ids, impl_idl_ovn.get_lb_external_ids(lb))
+        cache = self.idl.lb_external_ids_cache
+        with mock.patch.object(ovsdb_monitor.OvnIdl, 'notify'):
+            self.idl.notify('update', lb, mock.Mock(spec=['external_ids']))
+            self.assertEqual([lb.uuid], list(cache._views))
+            del self.idl.tables['Load_Balancer'].rows[lb.uuid]
+            self.idl.notify('delete', lb)
+            self.assertEqual({}, cache._views)
+
+    def test_get_lb_external_ids_prune(self):
+        lbs = [self._add_row('Load_Balancer', self._create_row(
+            'Load_Balancer', external_ids={'pool_bar': ''}))
+            for _ in range(2)]
+        for lb in lbs:
+            impl_idl_ovn.get_lb_external_ids(lb)
+        cache = self.idl.lb_external_ids_cache
+        with mock.patch.object(ovs_idl.Idl, 'run'):
+            self.idl.run()
+            self.assertEqual(2, len(cache._views))
+            # The rows are deleted without notifying them on reconnections.
+            del self.idl.tables['Load_Balancer'].rows[lbs[0].uuid]
+            self.idl.run()
+            self.assertEqual([lbs[1].uuid], list(cache._views))
+
+    def test_get_lb_external_ids_transaction(self):
+        lb = self._add_row('Load_Balancer', self._create_row(
+            'Load_Balancer', name='foo', external_ids={
+                'listener_foo': '80:pool_bar', 'pool_bar': ''}))
+        lb_ext_ids = impl_idl_ovn.get_lb_external_ids(lb)
+
+        def txn_fn(txn):
+            new_lb = txn.insert(self.idl.tables['Load_Balancer'])
+            new_lb.name = 'bar'
+            new_lb.external_ids = {'pool_baz': ''}
+            lb.external_ids = {'pool_baz': ''}
+            # The rows with pending changes are not cached.
+            for row in (new_lb, lb):
+                self.assertEqual({'pool_baz': ''},
+                                 impl_idl_ovn.get_lb_external_ids(row).raw)
+
+        self._commit(txn_fn)
+        self.assertIs(lb_ext_ids, impl_idl_ovn.get_lb_external_ids(lb))
+        self.assertEqual([lb.uuid], self._lookup(
+            impl_idl_ovn.LB_BY_NAME_INDEX, 'foo'))
+        self.assertEqual([], self._lookup(
+            impl_idl_ovn.LB_BY_NAME_INDEX, 'bar'))
+
+    def test_get_lb_external_ids_not_cached(self):
+        lb = fakes.FakeOvsdbRow.create_one_ovsdb_row(
+            attrs={'external_ids': {'pool_bar': ''}})
+        self.assertIsNot(impl_idl_ovn.get_lb_external_ids(lb),
+                         impl_idl_ovn.get_lb_external_ids(lb))
+
+    def test_lb_ports_only(self):
+        self.assertEqual([True], self.idl.tables[
+            'Logical_Switch_Port'].condition_state.latest)
+        self.idl = impl_idl_ovn.OvnNbIdlForLb(lb_ports_only=True)
+        condition = self.idl.tables['Logical_Switch_Port'].condition_state
+        self.assertEqual(impl_idl_ovn.LSP_LB_CONDITION, condition.latest)
+
+        lb = self._add_row('Load_Balancer', self._create_row(
+            'Load_Balancer', external_ids={
+                ovn_const.LB_EXT_IDS_VIP_PORT_ID_KEY: 'foo'}))
+        with mock.patch.object(ovs_idl.Idl, 'run'), mock.patch.object(
+                ovsdb_monitor.OvnIdl, 'notify') as mock_notify:
+            self.idl.notify('create', lb)
+            mock_notify.assert_called_once_with('create', lb, None)
+            # The condition is updated once the updates are processed.
+            self.assertEqual(impl_idl_ovn.LSP_LB_CONDITION, condition.latest)
+            self.idl.run()
+            self.assertEqual(
+                impl_idl_ovn.LSP_LB_CONDITION + [['name', '==', 'foo']],
+                condition.latest)
+
+            # Updates not changing the external_ids are ignored.
+            with mock.patch.object(self.idl, '_update_lsp_condition') as m:
+                self.idl.notify('update', lb, mock.Mock(spec=['vips']))
+                self.idl.run()
+                m.assert_not_called()
+
+            del self.idl.tables['Load_Balancer'].rows[lb.uuid]
+            self.idl.notify('delete', lb)
+            self.idl.run()
+            self.assertEqual(impl_idl_ovn.LSP_LB_CONDITION, condition.latest)
+
+    def test_ls_change_callbacks(self):
+        callback = mock.Mock()
+        self.idl.ls_change_callbacks.append(callback)
+        ls = self._add_row('Logical_Switch', self._create_row(
+            'Logical_Switch', name='neutron-foo'))
+        lb = self._add_row('Load_Balancer', self._create_row(
+            'Load_Balancer'))
+        with mock.patch.object(ovsdb_monitor.OvnIdl, 'notify'):
+            self.idl.notify('create', ls)
+            callback.assert_called_once_with('foo')
+            callback.reset_mock()
+            # Only the changes of the external_ids are relevant.
+            self.idl.notify('update', ls, mock.Mock(spec=['ports']))
+            self.idl.notify('update', lb, mock.Mock(spec=['external_ids']))
+            callback.assert_not_called()
+            self.idl.notify('update', ls, mock.Mock(spec=['external_ids']))
+            callback.assert_called_once_with('foo')
+            callback.reset_mock()
+            self.idl.notify('delete', ls)
+            callback.assert_called_once_with('foo')
+
+    def test_ls_change_callbacks_router_port(self):
+        callback = mock.Mock()
+        self.idl.ls_change_callbacks.append(callback)
+        lrp = self._add_row('Logical_Switch_Port', self._create_row(
+            'Logical_Switch_Port', type='router', external_ids={
+                ovn_const.OVN_NETWORK_NAME_EXT_ID_KEY: 'neutron-foo'}))
+        vm_port = self._add_row('Logical_Switch_Port', self._create_row(
+            'Logical_Switch_Port', type='', external_ids={
+                ovn_const.OVN_NETWORK_NAME_EXT_ID_KEY: 'neutron-foo'}))
+        with mock.patch.object(ovsdb_monitor.OvnIdl, 'notify'):
+            self.idl.notify('create', lrp)
+            callback.assert_called_once_with('foo')
+            callback.reset_mock()
+            self.idl.notify('update', lrp, mock.Mock(spec=['options']))
+            self.idl.notify('create', vm_port)
+            callback.assert_not_called()
+            self.idl.notify('update', lrp, mock.Mock(spec=['external_ids']))
+            callback.assert_called_once_with('foo')
+            callback.reset_mock()
+            self.idl.notify('delete', lrp)
+            callback.assert_called_once_with('foo')
+
+    def test_lbhc_by_hm_id_index(self):
+        lbhc1 = self._add_row('Load_Balancer_Health_Check',
+                              fakes.FakeOvsdbRow.create_one_ovsdb_row(
+                                  attrs={'external_ids': {
+                                      ovn_const.LB_EXT_IDS_HM_KEY: 'foo'}}))
+        lbhc2 = self._add_row('Load_Balancer_Health_Check',
+                              fakes.FakeOvsdbRow.create_one_ovsdb_row(
+                                  attrs={'external_ids': {
+                                      ovn_const.LB_EXT_IDS_HM_KEY: 'foo'}}))
+        self._add_row('Load_Balancer_Health_Check',
+                      fakes.FakeOvsdbRow.create_one_ovsdb_row())
+        index = impl_idl_ovn.LBHC_BY_HM_ID_INDEX
+        self.assertEqual(sorted([lbhc1.uuid, lbhc2.uuid]),
+                         self._lookup(index, 'foo'))
+
+        del self.idl.tables['Load_Balancer_Health_Check'].rows[lbhc1.uuid]
+        self.assertEqual([lbhc2.uuid], self._lookup(index, 'foo'))
+
+    def _get_lrs_by_lrp_name(self, lrp_name):
+        cmd = impl_idl_ovn.GetLrsByLrpNameCommand(
+            mock.Mock(tables=self.idl.tables), lrp_name)
+        cmd.run_idl(None)
+        return [lr.uuid for lr in cmd.result]
+
+    def test_get_lrs_by_lrp_name(self):
+        lrps = [self._create_row('Logical_Router_Port', name=name)
+                for name in ('lrp-foo', 'lrp-bar')]
+        lr = self._create_row('Logical_Router', name='router1', ports=lrps,
+                              external_ids={
+                                  ovn_const.OVN_GW_PORT_EXT_ID_KEY: 'gw'})
+        # The router is added to the IDL before its ports
+        self._add_row('Logical_Router', lr)
+        for lrp in lrps:
+            self._add_row('Logical_Router_Port', lrp)
+        self.assertEqual([lr.uuid], self._get_lrs_by_lrp_name('lrp-foo'))
+        self.assertEqual([lr.uuid], self._get_lrs_by_lrp_name('lrp-bar'))
+        self.assertEqual([lr.uuid], self._get_lrs_by_lrp_name('lrp-gw'))
+        self.assertEqual([], self._get_lrs_by_lrp_name('lrp-baz'))
+
+        del self.idl.tables['Logical_Router'].rows[lr.uuid]
+        self.assertEqual([], self._get_lrs_by_lrp_name('lrp-foo'))
+
+    def _get_lsps_by_ip(self, ls_name, ip):
+        cmd = impl_idl_ovn.GetLspsByIpCommand(
+            mock.Mock(tables=self.idl.tables), ls_name, ip)
+        cmd.run_idl(None)
+        return [lsp.uuid for lsp in cmd.result]
+
+    def test_get_lsps_by_ip(self):
+        lsp1 = self._create_row(
+            'Logical_Switch_Port', name='lsp1',
+            addresses=['fa:16:3e:00:00:01 10.0.0.10 fd00::10'])
+        lsp2 = self._create_row(
+            'Logical_Switch_Port', name='lsp2',
+            addresses=['fa:16:3e:00:00:02 10.0.0.10'])
+        ls1 = self._create_row('Logical_Switch', name='ls1', ports=[lsp1])
+        ls2 = self._create_row('Logical_Switch', name='ls2', ports=[lsp2])
+        for ls in (ls1, ls2):
+            self._add_row('Logical_Switch', ls)
+        for lsp in (lsp1, lsp2):
+            self._add_row('Logical_Switch_Port', lsp)
+        self.assertEqual([lsp1.uuid], self._get_lsps_by_ip('ls1', '10.0.0.10'))
+        self.assertEqual([lsp1.uuid], self._get_lsps_by_ip('ls1', 'fd00::10'))
+        self.assertEqual([lsp2.uuid], self._get_lsps_by_ip('ls2', '10.0.0.10'))
+        self.assertEqual([], self._get_lsps_by_ip('ls2', 'fd00::10'))
+        self.assertEqual([], self._get_lsps_by_ip('ls1', 'fa:16:3e:00:00:01'))
+
+        self._update_row('Logical_Switch_Port', lsp1,
+                         addresses=['fa:16:3e:00:00:01 10.0.0.11'])
+        self.assertEqual([], self._get_lsps_by_ip('ls1', '10.0.0.10'))
+        self.assertEqual([lsp1.uuid], self._get_lsps_by_ip('ls1', '10.0.0.11'))
+
+    def _commit(self, txn_fn):
+        # Commit a real IDL transaction. There is no connection to the
+        # server, so it is aborted once the rows have been written.
+        txn = ovs_idl.Transaction(self.idl)
+        self.idl.txn = txn
+        try:
+            txn_fn(txn)
+            self.assertEqual(ovs_idl.Transaction.TRY_AGAIN, txn.commit())
+        finally:
+            self.idl.txn = None
+
+    def test_indexes_transaction(self):
+        lsp = self._add_row('Logical_Switch_Port', self._create_row(
+            'Logical_Switch_Port', name='lsp1',
+            addresses=['fa:16:3e:00:00:01 10.0.0.10']))
+        ls = self._add_row('Logical_Switch', self._create_row(
+            'Logical_Switch', name='ls1', ports=[lsp]))
+
+        def txn_fn(txn):
+            nat = txn.insert(self.idl.tables['NAT'])
+            nat.external_ids = {ovn_const.OVN_FIP_PORT_EXT_ID_KEY: 'port1'}
+            lsp.addresses = ['fa:16:3e:00:00:01 10.0.0.11']
+            ls.name = 'ls2'
+
+        self._commit(txn_fn)
+        # The indexes keep the values received from the server.
+        self.assertEqual([lsp.uuid], self._get_lsps_by_ip('ls1', '10.0.0.10'))
+        self.assertEqual([], self._get_lsps_by_ip('ls1', '10.0.0.11'))
+        self.assertEqual([], self._lookup(
+            impl_idl_ovn.NAT_BY_FIP_PORT_INDEX, 'port1'))
+        self.assertEqual({}, self.idl.tables['NAT'].rows)
+
+    def test_lookup_by_index_keys(self):
+        nats = [self._add_row('NAT', fakes.FakeOvsdbRow.create_one_ovsdb_row(
+            attrs={'external_ids': {ovn_const.OVN_FIP_PORT_EXT_ID_KEY: port}}))
+            for port in ('port1', 'port2', 'port2')]
+        self._add_row('NAT', fakes.FakeOvsdbRow.create_one_ovsdb_row())
+        cmd = impl_idl_ovn.LookupByIndexKeysCommand(
+            mock.Mock(tables=self.idl.tables),
+            impl_idl_ovn.NAT_BY_FIP_PORT_INDEX, ['port1', 'port2', 'port3'])
+        cmd.run_idl(None)
+        self.assertEqual({'port1', 'port2'}, set(cmd.result))
+        self.assertEqual([nats[0].uuid],
+                         [nat.uuid for nat in cmd.result['port1']])
+        self.assertEqual(sorted([nats[1].uuid, nats[2].uuid]),
+                         sorted(nat.uuid for nat in cmd.result['port2']))
+
+    def test_lookup_by_index_no_index(self):
+        lb = self._add_row('Load_Balancer', fakes.FakeOvsdbRow.
+                           create_one_ovsdb_row(attrs={'name': 'foo'}))
+        del self.idl.tables['Load_Balancer'].rows.indexes[
+            impl_idl_ovn.LB_BY_NAME_INDEX]
+        self.assertEqual([lb.uuid],
+                         self._lookup(impl_idl_ovn.LB_BY_NAME_INDEX, 'foo'))
+
 
 class TestOvnSbIdlForLb(base.BaseTestCase):
 
@@ -65,6 +502,12 @@ class TestOvnSbIdlForLb(base.BaseTestCase):
                 location=schema_files['OVN_Southbound'])).start()
         self.idl = impl_idl_ovn.OvnSbIdlForLb()
 
+    def test_registered_columns(self):
+        self.assertEqual(['Service_Monitor'], list(self.idl.tables))
+        self.assertEqual(
+            {'ip', 'port', 'protocol', 'logical_port', 'src_ip', 'status'},
+            set(self.idl.tables['Service_Monitor'].columns))
+
     @mock.patch.object(real_ovs_idl.Backend, 'autocreate_indices', mock.Mock(),
                        create=True)
     def test_start_reuses_connection(self):
@@ -106,3 +549,115 @@ class TestOvnSbIdlForLb(base.BaseTestCase):
                                'set_lock') as set_lock:
             self.idl = impl_idl_ovn.OvnSbIdlForLb(event_lock_name='foo')
         set_lock.assert_called_once_with('foo')
+
+
+class TestUpdateLbVipsCommand(base.BaseTestCase):
+
+    def test_run_idl(self):
+        api = mock.Mock()
+        lb = api.lookup.return_value
+        cmd = impl_idl_ovn.UpdateLbVipsCommand(
+            api, 'lb-uuid', {'10.0.0.10:80': '10.0.0.20:8080'},
+            ['10.0.0.10:81'])
+        cmd.run_idl(mock.Mock())
+        api.lookup.assert_called_once_with('Load_Balancer', 'lb-uuid')
+        lb.delkey.assert_called_once_with('vips', '10.0.0.10:81')
+        lb.setkey.assert_called_once_with(
+            'vips', '10.0.0.10:80', '10.0.0.20:8080')
+        # The column is never written as a whole.
+        lb.verify.assert_not_called()
+
+
+class TestUpdateLbExternalIdsCommand(base.BaseTestCase):
+
+    def test_run_idl(self):
+        api = mock.Mock()
+        lb = api.lookup.return_value
+        cmd = impl_idl_ovn.UpdateLbExternalIdsCommand(
+            api, 'lb-uuid', {'neutron:member_status:foo': 'ONLINE'},
+            ['neutron:member_status'])
+        cmd.run_idl(mock.Mock())
+        api.lookup.assert_called_once_with('Load_Balancer', 'lb-uuid')
+        lb.delkey.assert_called_once_with('external_ids',
+                                          'neutron:member_status')
+        lb.setkey.assert_called_once_with(
+            'external_ids', 'neutron:member_status:foo', 'ONLINE')
+        # The column is never written as a whole.
+        lb.verify.assert_not_called()
+
+
+class TestNbGroupCommitter(base.BaseTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.api = mock.Mock()
+        self.api.transaction.side_effect = self._transaction
+        self.committed = []
+        self.committer = impl_idl_ovn.NbGroupCommitter(self.api, 0.01)
+
+    @contextlib.contextmanager
+    def _transaction(self, check_error=False):
+        txn = mock.Mock()
+        commands = []
+        txn.add.side_effect = commands.append
+        yield txn
+        for command in commands:
+            if command.fail:
+                raise RuntimeError(command.name)
+        self.committed.append([command.name for command in commands])
+
+    def _command(self, name, fail=False):
+        command = mock.Mock(fail=fail)
+        command.name = name
+        return command
+
+    def _execute_group(self, commands1, commands2):
+        # The second set of commands is given while the first thread waits
+        # for the latency budget.
+        results = {}
+
+        def execute(name, commands):
+            try:
+                self.committer.execute(commands)
+                results[name] = None
+            except RuntimeError as e:
+                results[name] = str(e)
+
+        def sleep(seconds):
+            thread = threading.Thread(target=execute,
+                                      args=('second', commands2))
+            thread.start()
+            while len(self.committer._group) < 2:
+                # time.sleep is mocked.
+                threading.Event().wait(0.001)
+            sleep.thread = thread
+
+        with mock.patch.object(impl_idl_ovn.time, 'sleep',
+                               side_effect=sleep):
+            execute('first', commands1)
+        sleep.thread.join()
+        return results
+
+    def test_execute(self):
+        self.committer.execute([self._command('a'), self._command('b')])
+        self.assertEqual([['a', 'b']], self.committed)
+        self.assertIsNone(self.committer._group)
+
+    def test_execute_error(self):
+        self.assertRaises(RuntimeError, self.committer.execute,
+                          [self._command('a', fail=True)])
+        self.assertEqual([], self.committed)
+
+    def test_execute_group(self):
+        results = self._execute_group([self._command('a')],
+                                      [self._command('b')])
+        self.assertEqual({'first': None, 'second': None}, results)
+        self.assertEqual([['a', 'b']], self.committed)
+        self.assertIsNone(self.committer._group)
+
+    def test_execute_group_fallback(self):
+        results = self._execute_group([self._command('a')],
+                                      [self._command('b', fail=True)])
+        # Only the request whose commands failed gets the error.
+        self.assertEqual({'first': None, 'second': 'b'}, results)
+        self.assertEqual([['a']], self.committed)
@@ -14,15 +14,19 @@
 from unittest import mock
 
 from ovn_octavia_provider import agent as ovn_agent
+from ovn_octavia_provider import helper as ovn_helper
 from ovn_octavia_provider.tests.unit import base as ovn_base
 
 
 class TestOvnProviderAgent(ovn_base.TestOvnOctaviaBase):
 
-    def test_exit(self):
+    @mock.patch.object(ovn_helper.OvnProviderHelper, 'stop')
+    def test_exit(self, mock_stop):
         mock_exit_event = mock.MagicMock()
         mock_exit_event.is_set.side_effect = [False, False, False, False, True]
         ovn_agent.OvnProviderAgent(mock_exit_event)
         self.assertEqual(1, mock_exit_event.wait.call_count)
+        # The requests queued are processed before exiting.
+        mock_stop.assert_called_once_with()
         self.assertEqual(3, self.mock_ovn_nb_idl.call_count)
         self.assertEqual(1, self.mock_ovn_sb_idl.call_count)
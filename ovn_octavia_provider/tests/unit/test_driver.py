@@ -23,6 +23,7 @@ from oslo_utils import uuidutils
 from ovsdbapp.backend.ovs_idl import idlutils
 
 from ovn_octavia_provider.common import clients
+from ovn_octavia_provider.common import config as ovn_conf
 from ovn_octavia_provider.common import constants as ovn_const
 from ovn_octavia_provider.common import exceptions as ovn_exc
 from ovn_octavia_provider import driver as ovn_driver
@@ -35,6 +36,10 @@ class TestOvnProviderDriver(ovn_base.TestOvnOctaviaBase):
 
     def setUp(self):
         super().setUp()
+        ovn_conf.register_opts()
+        # NOTE: the load balancer of the pool requests is only looked up
+        # when the requests are distributed among several workers.
+        self.config(request_workers=2, group='ovn')
         self.driver = ovn_driver.OvnProviderDriver()
         add_req_thread = mock.patch.object(ovn_helper.OvnProviderHelper,
                                            'add_request')
@@ -62,6 +67,10 @@ class TestOvnProviderDriver(ovn_base.TestOvnOctaviaBase):
                 self.member_line, self.member_line_additional_vips]),
             'listener_%s' % self.listener_id: '80:pool_%s' % self.pool_id}
         self.mock_add_request = add_req_thread.start()
+        self.mock_get_pool = mock.patch.object(
+            o_driver_lib.DriverLibrary, 'get_pool',
+            return_value=mock.Mock(
+                loadbalancer_id=self.loadbalancer_id)).start()
         self.project_id = uuidutils.generate_uuid()
 
         self.fail_member = data_models.Member(
@@ -353,6 +362,7 @@ class TestOvnProviderDriver(ovn_base.TestOvnOctaviaBase):
                 'address': self.ref_member.address,
                 'protocol_port': self.ref_member.protocol_port,
                 'pool_id': self.ref_member.pool_id,
+                'loadbalancer_id': self.loadbalancer_id,
                 'subnet_id': self.ref_member.subnet_id,
                 'admin_state_up': self.ref_member.admin_state_up}
         expected_dict = {'type': ovn_const.REQ_TYPE_MEMBER_CREATE,
@@ -361,6 +371,7 @@ class TestOvnProviderDriver(ovn_base.TestOvnOctaviaBase):
             'id': self.ref_member.member_id,
             'address': self.ref_member.address,
             'pool_id': self.ref_member.pool_id,
+            'loadbalancer_id': self.loadbalancer_id,
             'subnet_id': self.ref_member.subnet_id,
             'action': ovn_const.REQ_INFO_MEMBER_ADDED}
         expected_dict_dvr = {
@@ -375,6 +386,50 @@ class TestOvnProviderDriver(ovn_base.TestOvnOctaviaBase):
     def test_member_create(self):
         self._test_member_create(self.ref_member)
 
+    def test_member_create_new_lb_same_queue(self):
+        # The pool of a new load balancer is not in the OVN NB until its
+        # creation request is processed, the requests of its members must be
+        # processed after it, by the same worker thread.
+        self.mock_find_lb_pool_key.return_value = None
+        mock.patch.object(self.driver._ovn_helper, 'requests',
+                          [mock.Mock() for _ in range(8)]).start()
+        self.driver.loadbalancer_create(self.ref_lb_fully_populated)
+        self.driver.member_create(self.ref_member)
+        requests = [call[0][0] for call in
+                    self.mock_add_request.call_args_list]
+        self.assertEqual(
+            [ovn_const.REQ_TYPE_LB_CREATE,
+             ovn_const.REQ_TYPE_LISTENER_CREATE,
+             ovn_const.REQ_TYPE_POOL_CREATE,
+             ovn_const.REQ_TYPE_MEMBER_CREATE,
+             ovn_const.REQ_TYPE_HANDLE_MEMBER_DVR,
+             ovn_const.REQ_TYPE_MEMBER_CREATE,
+             ovn_const.REQ_TYPE_HANDLE_MEMBER_DVR],
+            [request['type'] for request in requests])
+        queues = {id(self.driver._ovn_helper._get_request_queue(request))
+                  for request in requests}
+        self.assertEqual(1, len(queues))
+        self.mock_get_pool.assert_not_called()
+
+    def test__get_pool_loadbalancer_id(self):
+        self.assertEqual(self.loadbalancer_id,
+                         self.driver._get_pool_loadbalancer_id(self.pool_id))
+        self.assertEqual(self.loadbalancer_id,
+                         self.driver._get_pool_loadbalancer_id(self.pool_id))
+        self.mock_get_pool.assert_called_once_with(self.pool_id)
+
+    def test__get_pool_loadbalancer_id_single_worker(self):
+        helper = self.driver._ovn_helper
+        with mock.patch.object(helper, 'requests', helper.requests[:1]):
+            self.assertIsNone(
+                self.driver._get_pool_loadbalancer_id(self.pool_id))
+            self.mock_get_pool.assert_not_called()
+            self.driver._pool_loadbalancer_ids[self.pool_id] = (
+                self.loadbalancer_id)
+            self.assertEqual(
+                self.loadbalancer_id,
+                self.driver._get_pool_loadbalancer_id(self.pool_id))
+
     def test_member_create_failure(self):
         self.assertRaises(exceptions.UnsupportedOptionError,
                           self.driver.member_create, self.fail_member)
@@ -440,6 +495,7 @@ class TestOvnProviderDriver(ovn_base.TestOvnOctaviaBase):
                 'address': self.ref_member.address,
                 'protocol_port': self.ref_member.protocol_port,
                 'pool_id': self.ref_member.pool_id,
+                'loadbalancer_id': self.loadbalancer_id,
                 'subnet_id': self.ref_member.subnet_id,
                 'admin_state_up': True}
         expected_dict = {'type': ovn_const.REQ_TYPE_MEMBER_CREATE,
@@ -457,6 +513,7 @@ class TestOvnProviderDriver(ovn_base.TestOvnOctaviaBase):
                 'address': self.ref_member.address,
                 'protocol_port': self.ref_member.protocol_port,
                 'pool_id': self.ref_member.pool_id,
+                'loadbalancer_id': self.loadbalancer_id,
                 'admin_state_up': self.update_member.admin_state_up,
                 'old_admin_state_up': self.ref_member.admin_state_up}
         expected_dict = {'type': ovn_const.REQ_TYPE_MEMBER_UPDATE,
@@ -471,6 +528,7 @@ class TestOvnProviderDriver(ovn_base.TestOvnOctaviaBase):
                 'address': self.ref_member.address,
                 'protocol_port': self.ref_member.protocol_port,
                 'pool_id': self.ref_member.pool_id,
+                'loadbalancer_id': self.loadbalancer_id,
                 'admin_state_up': self.update_member.admin_state_up,
                 'old_admin_state_up': self.ref_member.admin_state_up}
         expected_dict = {'type': ovn_const.REQ_TYPE_MEMBER_UPDATE,
@@ -488,6 +546,7 @@ class TestOvnProviderDriver(ovn_base.TestOvnOctaviaBase):
                 'address': self.ref_member.address,
                 'protocol_port': self.ref_member.protocol_port,
                 'pool_id': self.ref_member.pool_id,
+                'loadbalancer_id': self.loadbalancer_id,
                 'old_admin_state_up': self.ref_member.admin_state_up}
         expected_dict = {'type': ovn_const.REQ_TYPE_MEMBER_UPDATE,
                          'info': info}
@@ -505,20 +564,34 @@ class TestOvnProviderDriver(ovn_base.TestOvnOctaviaBase):
     def test_member_batch_update(self):
         self.driver.member_batch_update(self.pool_id,
                                         [self.ref_member, self.update_member])
-        self.assertEqual(self.mock_add_request.call_count, 4)
+        self.assertEqual(self.mock_add_request.call_count, 2)
+        request = self.mock_add_request.call_args_list[0][0][0]
+        self.assertEqual(ovn_const.REQ_TYPE_MEMBER_BATCH_UPDATE,
+                         request['type'])
+        self.assertEqual(self.pool_id, request['info']['pool_id'])
+        self.assertEqual(
+            [self.ref_member.member_id, self.update_member.member_id],
+            [member['id'] for member in request['info']['members']])
 
     def test_member_batch_update_member_delete(self):
-        info_md = {
+        expected_dict = {
+            'type': ovn_const.REQ_TYPE_MEMBER_BATCH_UPDATE,
+            'info': {'pool_id': self.pool_id,
+                     'loadbalancer_id': self.ovn_lb.name,
+                     'members': []}}
+        info_dvr = {
             'id': self.ref_member.member_id,
             'address': mock.ANY,
-            'protocol_port': mock.ANY,
             'pool_id': self.ref_member.pool_id,
-            'subnet_id': self.ref_member.subnet_id}
-        expected_dict_md = {
-            'type': ovn_const.REQ_TYPE_MEMBER_DELETE,
-            'info': info_md}
+            'loadbalancer_id': self.ovn_lb.name,
+            'subnet_id': self.ref_member.subnet_id,
+            'action': ovn_const.REQ_INFO_MEMBER_DELETED}
+        expected_dict_dvr = {
+            'type': ovn_const.REQ_TYPE_HANDLE_MEMBER_DVR,
+            'info': info_dvr}
         expected = [
-            mock.call(expected_dict_md)]
+            mock.call(expected_dict),
+            mock.call(expected_dict_dvr)]
         self.driver.member_batch_update(self.pool_id, [])
         self.assertEqual(self.mock_add_request.call_count, 2)
         self.mock_add_request.assert_has_calls(expected)
@@ -530,7 +603,7 @@ class TestOvnProviderDriver(ovn_base.TestOvnOctaviaBase):
         self.mock_find_lb_pool_key.return_value = ovn_lb
         self.driver.member_batch_update(self.pool_id,
                                         [self.ref_member, self.update_member])
-        self.assertEqual(self.mock_add_request.call_count, 2)
+        self.assertEqual(self.mock_add_request.call_count, 1)
 
     def test_member_batch_update_skipped_monitor(self):
         self.ref_member.monitor_address = '10.11.1.1'
@@ -549,7 +622,9 @@ class TestOvnProviderDriver(ovn_base.TestOvnOctaviaBase):
     def test_member_batch_update_unset_admin_state_up(self):
         self.ref_member.admin_state_up = data_models.UnsetType()
         self.driver.member_batch_update(self.pool_id, [self.ref_member])
-        self.assertEqual(self.mock_add_request.call_count, 3)
+        self.assertEqual(self.mock_add_request.call_count, 2)
+        request = self.mock_add_request.call_args_list[0][0][0]
+        self.assertTrue(request['info']['members'][0]['admin_state_up'])
 
     def test_member_batch_update_toggle_admin_state_up(self):
         info_mu = {
@@ -559,17 +634,16 @@ class TestOvnProviderDriver(ovn_base.TestOvnOctaviaBase):
             'pool_id': self.ref_member.pool_id,
             'subnet_id': self.ref_member.subnet_id,
             'admin_state_up': False}
-        expected_dict_mu = {
-            'type': ovn_const.REQ_TYPE_MEMBER_UPDATE,
-            'info': info_mu}
-        expected = [
-            mock.call(expected_dict_mu)]
+        expected_dict = {
+            'type': ovn_const.REQ_TYPE_MEMBER_BATCH_UPDATE,
+            'info': {'pool_id': self.pool_id,
+                     'loadbalancer_id': self.ovn_lb.name,
+                     'members': [info_mu]}}
         self.ref_member.admin_state_up = False
         self.ref_member.address = self.member_address
         self.ref_member.protocol_port = self.member_port
         self.driver.member_batch_update(self.pool_id, [self.ref_member])
-        self.assertEqual(self.mock_add_request.call_count, 1)
-        self.mock_add_request.assert_has_calls(expected)
+        self.mock_add_request.assert_called_once_with(expected_dict)
 
     def test_member_batch_update_missing_subnet_id(self):
         self.ref_member.subnet_id = None
@@ -608,6 +682,7 @@ class TestOvnProviderDriver(ovn_base.TestOvnOctaviaBase):
                 'address': self.ref_member.address,
                 'protocol_port': self.ref_member.protocol_port,
                 'pool_id': self.ref_member.pool_id,
+                'loadbalancer_id': self.loadbalancer_id,
                 'subnet_id': self.ref_member.subnet_id}
         expected_dict = {'type': ovn_const.REQ_TYPE_MEMBER_DELETE,
                          'info': info}
@@ -615,6 +690,7 @@ class TestOvnProviderDriver(ovn_base.TestOvnOctaviaBase):
             'id': self.ref_member.member_id,
             'address': self.ref_member.address,
             'pool_id': self.ref_member.pool_id,
+            'loadbalancer_id': self.loadbalancer_id,
             'subnet_id': self.ref_member.subnet_id,
             'action': ovn_const.REQ_INFO_MEMBER_DELETED}
         expected_dict_dvr = {
@@ -633,6 +709,7 @@ class TestOvnProviderDriver(ovn_base.TestOvnOctaviaBase):
                 'address': self.ref_member.address,
                 'protocol_port': self.ref_member.protocol_port,
                 'pool_id': self.ref_member.pool_id,
+                'loadbalancer_id': self.loadbalancer_id,
                 'subnet_id': self.ref_member.subnet_id}
         expected_dict = {'type': ovn_const.REQ_TYPE_MEMBER_DELETE,
                          'info': info}
@@ -640,6 +717,7 @@ class TestOvnProviderDriver(ovn_base.TestOvnOctaviaBase):
             'id': self.ref_member.member_id,
             'address': self.ref_member.address,
             'pool_id': self.ref_member.pool_id,
+            'loadbalancer_id': self.loadbalancer_id,
             'subnet_id': self.ref_member.subnet_id,
             'action': ovn_const.REQ_INFO_MEMBER_DELETED}
         expected_dict_dvr = {
@@ -765,6 +843,7 @@ class TestOvnProviderDriver(ovn_base.TestOvnOctaviaBase):
     def test_loadbalancer_fully_populate_create(self):
         info = {
             'id': self.ref_lb_fully_populated.loadbalancer_id,
+            'loadbalancer_id': self.ref_lb_fully_populated.loadbalancer_id,
             'vip_address': self.ref_lb_fully_populated.vip_address,
             'vip_network_id': self.ref_lb_fully_populated.vip_network_id,
             'admin_state_up': self.ref_lb_fully_populated.admin_state_up}
@@ -788,12 +867,14 @@ class TestOvnProviderDriver(ovn_base.TestOvnOctaviaBase):
             'address': self.ref_member.address,
             'protocol_port': self.ref_member.protocol_port,
             'pool_id': self.ref_member.pool_id,
+            'loadbalancer_id': self.loadbalancer_id,
             'subnet_id': self.ref_member.subnet_id,
             'admin_state_up': self.ref_member.admin_state_up}
         info_dvr = {
             'id': self.ref_member.member_id,
             'address': self.ref_member.address,
             'pool_id': self.ref_member.pool_id,
+            'loadbalancer_id': self.loadbalancer_id,
             'subnet_id': self.ref_member.subnet_id,
             'action': ovn_const.REQ_INFO_MEMBER_ADDED}
         expected_lb_dict = {
@@ -821,6 +902,7 @@ class TestOvnProviderDriver(ovn_base.TestOvnOctaviaBase):
 
     def test_loadbalancer_create(self):
         info = {'id': self.ref_lb0.loadbalancer_id,
+                'loadbalancer_id': self.ref_lb0.loadbalancer_id,
                 'vip_address': self.ref_lb0.vip_address,
                 'vip_network_id': self.ref_lb0.vip_network_id,
                 'admin_state_up': self.ref_lb0.admin_state_up}
@@ -857,6 +939,7 @@ class TestOvnProviderDriver(ovn_base.TestOvnOctaviaBase):
                                'handle_vip_fip') as mock_handle_vip_fip:
             info = {
                 'ovn_lb': self.ovn_lb,
+                'loadbalancer_id': self.ovn_lb.name,
                 'vip_fip': self.fake_fip,
                 'vip_related': [self.fake_vip],
                 'additional_vip_fip': False,
@@ -892,6 +975,7 @@ class TestOvnProviderDriver(ovn_base.TestOvnOctaviaBase):
                                'handle_vip_fip') as mock_handle_vip_fip:
             info = {
                 'ovn_lb': self.ovn_lb,
+                'loadbalancer_id': self.ovn_lb.name,
                 'vip_fip': self.fake_fip,
                 'vip_related': [self.fake_vip],
                 'additional_vip_fip': True,
@@ -994,6 +1078,7 @@ class TestOvnProviderDriver(ovn_base.TestOvnOctaviaBase):
 
     def test_loadbalancer_create_additional_vips(self):
         info = {'id': self.ref_lb2.loadbalancer_id,
+                'loadbalancer_id': self.ref_lb2.loadbalancer_id,
                 'vip_address': self.ref_lb2.vip_address,
                 'vip_network_id': self.ref_lb2.vip_network_id,
                 'additional_vips': self.ref_lb2.additional_vips,
@@ -1009,6 +1094,7 @@ class TestOvnProviderDriver(ovn_base.TestOvnOctaviaBase):
         self.ref_member.subnet_id = data_models.UnsetType()
         info = {
             'id': self.ref_lb_fully_populated.loadbalancer_id,
+            'loadbalancer_id': self.ref_lb_fully_populated.loadbalancer_id,
             'vip_address': self.ref_lb_fully_populated.vip_address,
             'vip_network_id': self.ref_lb_fully_populated.vip_network_id,
             'admin_state_up': self.ref_lb_fully_populated.admin_state_up}
@@ -1032,12 +1118,14 @@ class TestOvnProviderDriver(ovn_base.TestOvnOctaviaBase):
             'address': self.ref_member.address,
             'protocol_port': self.ref_member.protocol_port,
             'pool_id': self.ref_member.pool_id,
+            'loadbalancer_id': self.loadbalancer_id,
             'subnet_id': self.ref_lb_fully_populated.vip_subnet_id,
             'admin_state_up': self.ref_member.admin_state_up}
         info_dvr = {
             'id': self.ref_member.member_id,
             'address': self.ref_member.address,
             'pool_id': self.ref_member.pool_id,
+            'loadbalancer_id': self.loadbalancer_id,
             'subnet_id': self.ref_lb_fully_populated.vip_subnet_id,
             'action': ovn_const.REQ_INFO_MEMBER_ADDED}
         expected_lb_dict = {
@@ -1066,6 +1154,7 @@ class TestOvnProviderDriver(ovn_base.TestOvnOctaviaBase):
     def test_loadbalancer_create_unset_listeners(self):
         self.ref_lb0.listeners = data_models.UnsetType()
         info = {'id': self.ref_lb0.loadbalancer_id,
+                'loadbalancer_id': self.ref_lb0.loadbalancer_id,
                 'vip_address': self.ref_lb0.vip_address,
                 'vip_network_id': self.ref_lb0.vip_network_id,
                 'admin_state_up': False}
@@ -1079,6 +1168,7 @@ class TestOvnProviderDriver(ovn_base.TestOvnOctaviaBase):
     def test_loadbalancer_create_unset_admin_state_up(self):
         self.ref_lb0.admin_state_up = data_models.UnsetType()
         info = {'id': self.ref_lb0.loadbalancer_id,
+                'loadbalancer_id': self.ref_lb0.loadbalancer_id,
                 'vip_address': self.ref_lb0.vip_address,
                 'vip_network_id': self.ref_lb0.vip_network_id,
                 'admin_state_up': True}
@@ -1091,6 +1181,7 @@ class TestOvnProviderDriver(ovn_base.TestOvnOctaviaBase):
 
     def test_loadbalancer_update(self):
         info = {'id': self.ref_lb1.loadbalancer_id,
+                'loadbalancer_id': self.ref_lb1.loadbalancer_id,
                 'admin_state_up': self.ref_lb1.admin_state_up}
         expected_dict = {'type': ovn_const.REQ_TYPE_LB_UPDATE,
                          'info': info}
@@ -1099,7 +1190,8 @@ class TestOvnProviderDriver(ovn_base.TestOvnOctaviaBase):
 
     def test_loadbalancer_update_unset_admin_state_up(self):
         self.ref_lb1.admin_state_up = data_models.UnsetType()
-        info = {'id': self.ref_lb1.loadbalancer_id}
+        info = {'id': self.ref_lb1.loadbalancer_id,
+                'loadbalancer_id': self.ref_lb1.loadbalancer_id}
         expected_dict = {'type': ovn_const.REQ_TYPE_LB_UPDATE,
                          'info': info}
         self.driver.loadbalancer_update(self.ref_lb0, self.ref_lb1)
@@ -1107,6 +1199,7 @@ class TestOvnProviderDriver(ovn_base.TestOvnOctaviaBase):
 
     def test_loadbalancer_delete(self):
         info = {'id': self.ref_lb0.loadbalancer_id,
+                'loadbalancer_id': self.ref_lb0.loadbalancer_id,
                 'cascade': False}
         expected_dict = {'type': ovn_const.REQ_TYPE_LB_DELETE,
                          'info': info}
@@ -1152,6 +1245,7 @@ class TestOvnProviderDriver(ovn_base.TestOvnOctaviaBase):
                 'session_persistence': {'type': 'SOURCE_IP'}}
         info_hm = {'id': self.ref_health_monitor.healthmonitor_id,
                    'pool_id': self.ref_health_monitor.pool_id,
+                   'loadbalancer_id': self.loadbalancer_id,
                    'type': self.ref_health_monitor.type,
                    'interval': self.ref_health_monitor.delay,
                    'timeout': self.ref_health_monitor.timeout,
@@ -1214,9 +1308,11 @@ class TestOvnProviderDriver(ovn_base.TestOvnOctaviaBase):
         expected = {'type': ovn_const.REQ_TYPE_POOL_DELETE,
                     'info': info}
         info_hm = {'id': self.ref_pool.healthmonitor.healthmonitor_id,
-                   'pool_id': self.ref_pool.pool_id}
+                   'pool_id': self.ref_pool.pool_id,
+                   'loadbalancer_id': self.loadbalancer_id}
         info_member = {'id': self.ref_member.member_id,
                        'pool_id': self.ref_member.pool_id,
+                       'loadbalancer_id': self.loadbalancer_id,
                        'subnet_id': self.ref_member.subnet_id,
                        'protocol_port': self.ref_member.protocol_port,
                        'address': self.ref_member.address}
@@ -1525,6 +1621,7 @@ class TestOvnProviderDriver(ovn_base.TestOvnOctaviaBase):
     def test_health_monitor_create(self):
         info = {'id': self.ref_health_monitor.healthmonitor_id,
                 'pool_id': self.ref_health_monitor.pool_id,
+                'loadbalancer_id': self.loadbalancer_id,
                 'type': self.ref_health_monitor.type,
                 'interval': self.ref_health_monitor.delay,
                 'timeout': self.ref_health_monitor.timeout,
@@ -1559,6 +1656,7 @@ class TestOvnProviderDriver(ovn_base.TestOvnOctaviaBase):
         self.ref_health_monitor.admin_state_up = data_models.UnsetType()
         info = {'id': self.ref_health_monitor.healthmonitor_id,
                 'pool_id': self.ref_health_monitor.pool_id,
+                'loadbalancer_id': self.loadbalancer_id,
                 'type': self.ref_health_monitor.type,
                 'interval': self.ref_health_monitor.delay,
                 'timeout': self.ref_health_monitor.timeout,
@@ -1573,6 +1671,7 @@ class TestOvnProviderDriver(ovn_base.TestOvnOctaviaBase):
     def test_health_monitor_update(self):
         info = {'id': self.ref_update_health_monitor.healthmonitor_id,
                 'pool_id': self.ref_health_monitor.pool_id,
+                'loadbalancer_id': self.loadbalancer_id,
                 'interval': self.ref_update_health_monitor.delay,
                 'timeout': self.ref_update_health_monitor.timeout,
                 'failure_count':
@@ -1591,6 +1690,7 @@ class TestOvnProviderDriver(ovn_base.TestOvnOctaviaBase):
         self.ref_update_health_monitor.admin_state_up = data_models.UnsetType()
         info = {'id': self.ref_update_health_monitor.healthmonitor_id,
                 'pool_id': self.ref_health_monitor.pool_id,
+                'loadbalancer_id': self.loadbalancer_id,
                 'interval': self.ref_update_health_monitor.delay,
                 'timeout': self.ref_update_health_monitor.timeout,
                 'failure_count':
@@ -1606,7 +1706,8 @@ class TestOvnProviderDriver(ovn_base.TestOvnOctaviaBase):
 
     def test_health_monitor_delete(self):
         info = {'id': self.ref_health_monitor.healthmonitor_id,
-                'pool_id': self.ref_health_monitor.pool_id}
+                'pool_id': self.ref_health_monitor.pool_id,
+                'loadbalancer_id': self.loadbalancer_id}
         expected_dict = {'type': ovn_const.REQ_TYPE_HM_DELETE,
                          'info': info}
         self.driver.health_monitor_delete(self.ref_health_monitor)
@@ -1775,6 +1876,8 @@ class TestOvnProviderDriver(ovn_base.TestOvnOctaviaBase):
 
     @mock.patch.object(ovn_helper.OvnProviderHelper,
                        '_update_status_to_octavia')
+    @mock.patch.object(ovn_helper.OvnProviderHelper, '_find_ovn_lb_from_hm_id',
+                       return_value=([], None))
     @mock.patch.object(ovn_helper.OvnProviderHelper, 'hm_create')
     @mock.patch.object(ovn_helper.OvnProviderHelper, 'member_create')
     @mock.patch.object(ovn_helper.OvnProviderHelper, 'pool_create')
@@ -1782,7 +1885,8 @@ class TestOvnProviderDriver(ovn_base.TestOvnOctaviaBase):
     @mock.patch.object(ovn_helper.OvnProviderHelper, 'lb_create')
     def test_ensure_loadbalancer_lb_not_found_with_hm(
             self, mock_lb_create, mock_listener_create, mock_pool_create,
-            mock_member_create, mock_hm_create, mock_update_status):
+            mock_member_create, mock_hm_create, mock_find_ovn_lb_from_hm_id,
+            mock_update_status):
         self.mock_find_ovn_lbs_with_retry.side_effect = [
             idlutils.RowNotFound]
         self.ref_lb_fully_populated.pools[0].members = []
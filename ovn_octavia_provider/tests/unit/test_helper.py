@@ -13,6 +13,7 @@
 #
 import collections
 import copy
+import threading
 from unittest import mock
 
 from neutron_lib import constants as n_const
@@ -28,6 +29,7 @@ from ovsdbapp.backend.ovs_idl import idlutils
 from ovn_octavia_provider.common import clients
 from ovn_octavia_provider.common import config as ovn_conf
 from ovn_octavia_provider.common import constants as ovn_const
+from ovn_octavia_provider.common import metrics
 from ovn_octavia_provider import event as ovn_event
 from ovn_octavia_provider import helper as ovn_helper
 from ovn_octavia_provider.tests.unit import base as ovn_base
@@ -103,6 +105,9 @@ class TestOvnProviderHelper(ovn_base.TestOvnOctaviaBase):
         self.ovn_lb.uuid = uuidutils.generate_uuid()
         self.ovn_lb.health_check = []
         self.ovn_lb.selection_fields = ['ip_dst', 'ip_src', 'tp_dst', 'tp_src']
+        self.ovn_lb.vips = {
+            '10.22.33.4:80': '192.168.2.149:1010',
+            '123.123.123.123:80': '192.168.2.149:1010'}
         self.ovn_hm_lb = mock.MagicMock()
         self.ovn_hm_lb.protocol = ['tcp']
         self.ovn_hm_lb.uuid = uuidutils.generate_uuid()
@@ -139,6 +144,10 @@ class TestOvnProviderHelper(ovn_base.TestOvnOctaviaBase):
             execute.return_value = [self.ovn_lb]
         self.helper.ovn_nbdb_api.db_list_rows.return_value.\
             execute.return_value = [self.ovn_lb]
+        self.helper.ovn_nbdb_api.get_lbs_by_hm_id.return_value.\
+            execute.return_value = []
+        self.helper.ovn_nbdb_api.get_lbhcs_by_hm_id.return_value.\
+            execute.return_value = []
         self.mock_find_lb_pool_key = mock.patch.object(
             self.helper,
             '_find_ovn_lb_with_pool_key',
@@ -277,6 +286,29 @@ class TestOvnProviderHelper(ovn_base.TestOvnOctaviaBase):
                                               pool_key,
                                               self.member_address))
 
+    @mock.patch('ovn_octavia_provider.common.clients.get_neutron_client')
+    def test__get_member_lsp(self, net_cli):
+        member_subnet = fakes.FakeSubnet.create_one_subnet(
+            attrs={'network_id': 'foo'})
+        net_cli.return_value.get_subnet.return_value = member_subnet
+        fake_ls = fakes.FakeOvsdbRow.create_one_ovsdb_row(
+            attrs={'name': 'neutron-foo'})
+        fake_lsp = fakes.FakeOvsdbRow.create_one_ovsdb_row()
+        self.helper.ovn_nbdb_api.lookup.return_value = fake_ls
+        self.helper.ovn_nbdb_api.get_lsps_by_ip.return_value.\
+            execute.return_value = [fake_lsp]
+        self.assertEqual(fake_lsp, self.helper._get_member_lsp(
+            self.member_address, self.member_subnet_id))
+        self.helper.ovn_nbdb_api.lookup.assert_called_once_with(
+            'Logical_Switch', 'neutron-foo')
+        self.helper.ovn_nbdb_api.get_lsps_by_ip.assert_called_once_with(
+            'neutron-foo', self.member_address)
+
+        self.helper.ovn_nbdb_api.get_lsps_by_ip.return_value.\
+            execute.return_value = []
+        self.assertIsNone(self.helper._get_member_lsp(
+            self.member_address, self.member_subnet_id))
+
     def test__clean_ip_port_mappings(self):
         self.helper._clean_ip_port_mappings(self.ovn_hm_lb)
         self.helper.ovn_nbdb_api.db_clear.assert_called_once_with(
@@ -369,28 +401,66 @@ class TestOvnProviderHelper(ovn_base.TestOvnOctaviaBase):
 
     def test__update_external_ids_member_status(self):
         self.helper._update_external_ids_member_status(
-            self.ovn_lb, self.member_id, constants.NO_MONITOR)
+            self.ovn_lb, self.member_id, constants.OFFLINE)
+        # The legacy neutron:member_status key is migrated.
         member_status = {
-            ovn_const.OVN_MEMBER_STATUS_KEY: '{"%s": "%s"}'
-            % (self.member_id, constants.NO_MONITOR)}
-        self.helper.ovn_nbdb_api.db_set.assert_called_once_with(
-            'Load_Balancer', self.ovn_lb.uuid, ('external_ids', member_status))
+            ovn_const.OVN_MEMBER_STATUS_PREFIX + self.member_id:
+                constants.OFFLINE}
+        self.helper.ovn_nbdb_api.lb_update_external_ids.\
+            assert_called_once_with(self.ovn_lb.uuid, member_status,
+                                    [ovn_const.OVN_MEMBER_STATUS_KEY])
+        self.helper.ovn_nbdb_api.db_set.assert_not_called()
+
+    def test__update_external_ids_member_status_member_keys(self):
+        del self.ovn_lb.external_ids[ovn_const.OVN_MEMBER_STATUS_KEY]
+        self.ovn_lb.external_ids.update({
+            ovn_const.OVN_MEMBER_STATUS_PREFIX + self.member_id:
+                constants.NO_MONITOR,
+            ovn_const.OVN_MEMBER_STATUS_PREFIX + 'foo': constants.ONLINE})
+        self.helper._update_external_ids_member_status(
+            self.ovn_lb, self.member_id, constants.OFFLINE)
+        # Only the key of the member is written.
+        self.helper.ovn_nbdb_api.lb_update_external_ids.\
+            assert_called_once_with(
+                self.ovn_lb.uuid,
+                {ovn_const.OVN_MEMBER_STATUS_PREFIX + self.member_id:
+                    constants.OFFLINE},
+                [])
+        self.helper.ovn_nbdb_api.db_set.assert_not_called()
 
     def test__update_external_ids_member_status_delete(self):
         self.helper._update_external_ids_member_status(
             self.ovn_lb, self.member_id, None, True)
-        self.helper.ovn_nbdb_api.db_remove.assert_called_once_with(
-            'Load_Balancer', self.ovn_lb.uuid, 'external_ids',
-            ovn_const.OVN_MEMBER_STATUS_KEY)
+        self.helper.ovn_nbdb_api.lb_update_external_ids.\
+            assert_called_once_with(
+                self.ovn_lb.uuid, {},
+                [ovn_const.OVN_MEMBER_STATUS_KEY,
+                 ovn_const.OVN_MEMBER_STATUS_PREFIX + self.member_id])
+        self.helper.ovn_nbdb_api.db_remove.assert_not_called()
+
+    def test__update_external_ids_member_status_delete_member_keys(self):
+        del self.ovn_lb.external_ids[ovn_const.OVN_MEMBER_STATUS_KEY]
+        self.ovn_lb.external_ids[
+            ovn_const.OVN_MEMBER_STATUS_PREFIX + self.member_id] = \
+            constants.NO_MONITOR
+        self.helper._update_external_ids_member_status(
+            self.ovn_lb, self.member_id, None, True)
+        self.helper.ovn_nbdb_api.lb_update_external_ids.\
+            assert_called_once_with(
+                self.ovn_lb.uuid, {},
+                [ovn_const.OVN_MEMBER_STATUS_PREFIX + self.member_id])
 
     def test__update_external_ids_member_status_delete_not_found(self):
         self.helper._update_external_ids_member_status(
             self.ovn_lb, 'fool', None, True)
         member_status = {
-            ovn_const.OVN_MEMBER_STATUS_KEY: '{"%s": "%s"}'
-            % (self.member_id, constants.NO_MONITOR)}
-        self.helper.ovn_nbdb_api.db_set.assert_called_once_with(
-            'Load_Balancer', self.ovn_lb.uuid, ('external_ids', member_status))
+            ovn_const.OVN_MEMBER_STATUS_PREFIX + self.member_id:
+                constants.NO_MONITOR}
+        self.helper.ovn_nbdb_api.lb_update_external_ids.\
+            assert_called_once_with(
+                self.ovn_lb.uuid, member_status,
+                [ovn_const.OVN_MEMBER_STATUS_KEY,
+                 ovn_const.OVN_MEMBER_STATUS_PREFIX + 'fool'])
 
     def test__find_member_status(self):
         status = self.helper._find_member_status(self.ovn_lb, self.member_id)
@@ -399,6 +469,14 @@ class TestOvnProviderHelper(ovn_base.TestOvnOctaviaBase):
             self.ovn_hm_lb, self.member_id)
         self.assertEqual(status, constants.NO_MONITOR)
 
+    def test__find_member_status_member_keys(self):
+        # The key of the member takes precedence over the legacy one.
+        self.ovn_lb.external_ids[
+            ovn_const.OVN_MEMBER_STATUS_PREFIX + self.member_id] = \
+            constants.ERROR
+        status = self.helper._find_member_status(self.ovn_lb, self.member_id)
+        self.assertEqual(status, constants.ERROR)
+
     def test__find_member_status_exception(self):
         status = self.helper._find_member_status(self.ovn_hm_lb, 'foo')
         self.assertEqual(status, constants.NO_MONITOR)
@@ -446,49 +524,41 @@ class TestOvnProviderHelper(ovn_base.TestOvnOctaviaBase):
     def test__find_ovn_lb_with_pool_key(self):
         pool_key = self.helper._get_pool_key(uuidutils.generate_uuid())
         test_lb = mock.MagicMock()
-        test_lb.external_ids = {
-            ovn_const.OVN_DEVICE_OWNER_EXT_ID_KEY:
-                ovn_const.PORT_FORWARDING_PLUGIN,
-            pool_key: 'it_is_a_pool_party',
-        }
-        self.helper.ovn_nbdb_api.db_list_rows.return_value.\
+        self.helper.ovn_nbdb_api.get_lbs_by_pool_key.return_value.\
             execute.return_value = [test_lb]
         f = self.real_helper_find_ovn_lb_with_pool_key
 
-        # Ensure lb is not found, due to its device owner
-        found = f(pool_key)
-        self.assertIsNone(found)
-
-        # Remove device owner from test_lb.external_ids and make sure test_lb
-        # is found as expected
-        test_lb.external_ids.pop(ovn_const.OVN_DEVICE_OWNER_EXT_ID_KEY)
         found = f(pool_key)
         self.assertEqual(found, test_lb)
+        self.helper.ovn_nbdb_api.get_lbs_by_pool_key.assert_called_once_with(
+            pool_key)
 
         # Ensure lb is not found, due to its pool_key not found
+        self.helper.ovn_nbdb_api.get_lbs_by_pool_key.return_value.\
+            execute.return_value = []
         found = f(self.helper._get_pool_key(uuidutils.generate_uuid()))
         self.assertIsNone(found)
 
     def test__find_ovn_lbs(self):
         self.mock_find_ovn_lbs.stop()
         f = self.helper._find_ovn_lbs
-        self.helper.ovn_nbdb_api.db_find_rows.return_value.\
+        self.helper.ovn_nbdb_api.get_lbs_by_name.return_value.\
             execute.return_value = [self.ovn_lb]
 
         # Without protocol specified return a list
         found = f(self.ovn_lb.id)
         self.assertListEqual(found, [self.ovn_lb])
-        self.helper.ovn_nbdb_api.db_find_rows.assert_called_once_with(
-            'Load_Balancer', ('name', '=', self.ovn_lb.id))
-        self.helper.ovn_nbdb_api.db_find_rows.reset_mock()
+        self.helper.ovn_nbdb_api.get_lbs_by_name.assert_called_once_with(
+            self.ovn_lb.id)
+        self.helper.ovn_nbdb_api.get_lbs_by_name.reset_mock()
 
         # With protocol specified return an instance
         found = f(self.ovn_lb.id, protocol='tcp')
         self.assertEqual(found, self.ovn_lb)
-        self.helper.ovn_nbdb_api.db_find_rows.reset_mock()
+        self.helper.ovn_nbdb_api.get_lbs_by_name.reset_mock()
 
         # LB with given protocol not found
-        self.helper.ovn_nbdb_api.db_find_rows.return_value.\
+        self.helper.ovn_nbdb_api.get_lbs_by_name.return_value.\
             execute.return_value = []
         self.assertRaises(
             idlutils.RowNotFound,
@@ -497,7 +567,7 @@ class TestOvnProviderHelper(ovn_base.TestOvnOctaviaBase):
             protocol='UDP')
 
         # LB with given protocol not found
-        self.helper.ovn_nbdb_api.db_find_rows.return_value.\
+        self.helper.ovn_nbdb_api.get_lbs_by_name.return_value.\
             execute.return_value = []
         self.assertRaises(
             idlutils.RowNotFound,
@@ -510,7 +580,7 @@ class TestOvnProviderHelper(ovn_base.TestOvnOctaviaBase):
         udp_lb.protocol = ['udp']
         sctp_lb = copy.copy(self.ovn_lb)
         sctp_lb.protocol = ['sctp']
-        self.helper.ovn_nbdb_api.db_find_rows.return_value.\
+        self.helper.ovn_nbdb_api.get_lbs_by_name.return_value.\
             execute.return_value = [self.ovn_lb, udp_lb, sctp_lb]
         found = f(self.ovn_lb.id)
         self.assertListEqual(found, [self.ovn_lb, udp_lb, sctp_lb])
@@ -518,7 +588,7 @@ class TestOvnProviderHelper(ovn_base.TestOvnOctaviaBase):
         # Multiple protocols, just one with correct protocol
         udp_lb = copy.copy(self.ovn_lb)
         udp_lb.protocol = ['udp']
-        self.helper.ovn_nbdb_api.db_find_rows.return_value.\
+        self.helper.ovn_nbdb_api.get_lbs_by_name.return_value.\
             execute.return_value = [udp_lb, self.ovn_lb]
         found = f(self.ovn_lb.id, protocol='tcp')
         self.assertEqual(found, self.ovn_lb)
@@ -604,7 +674,7 @@ class TestOvnProviderHelper(ovn_base.TestOvnOctaviaBase):
 
     def test__get_or_create_ovn_lb_no_lb_found(self):
         self.mock_find_ovn_lbs.stop()
-        self.helper.ovn_nbdb_api.db_find_rows.return_value.\
+        self.helper.ovn_nbdb_api.get_lbs_by_name.return_value.\
             execute.return_value = []
         self.assertRaises(
             idlutils.RowNotFound,
@@ -619,7 +689,7 @@ class TestOvnProviderHelper(ovn_base.TestOvnOctaviaBase):
         udp_lb.protocol = ['udp']
         udp_lb.external_ids[ovn_const.LB_EXT_IDS_ADDIT_VIP_FIP_KEY] = 'foo'
         self.mock_find_ovn_lbs.stop()
-        self.helper.ovn_nbdb_api.db_find_rows.return_value.\
+        self.helper.ovn_nbdb_api.get_lbs_by_name.return_value.\
             execute.side_effect = [[udp_lb], [self.ovn_lb]]
         self.helper._get_or_create_ovn_lb(
             self.ovn_lb.name,
@@ -652,7 +722,7 @@ class TestOvnProviderHelper(ovn_base.TestOvnOctaviaBase):
 
     def test__get_or_create_ovn_lb_found(self):
         self.mock_find_ovn_lbs.stop()
-        self.helper.ovn_nbdb_api.db_find_rows.return_value.\
+        self.helper.ovn_nbdb_api.get_lbs_by_name.return_value.\
             execute.return_value = [self.ovn_lb]
         found = self.helper._get_or_create_ovn_lb(
             self.ovn_lb.name,
@@ -663,7 +733,7 @@ class TestOvnProviderHelper(ovn_base.TestOvnOctaviaBase):
     def test__get_or_create_ovn_lb_lb_without_protocol(self):
         self.mock_find_ovn_lbs.stop()
         self.ovn_lb.protocol = []
-        self.helper.ovn_nbdb_api.db_find_rows.return_value.\
+        self.helper.ovn_nbdb_api.get_lbs_by_name.return_value.\
             execute.return_value = [self.ovn_lb]
         found = self.helper._get_or_create_ovn_lb(
             self.ovn_lb.name,
@@ -679,7 +749,7 @@ class TestOvnProviderHelper(ovn_base.TestOvnOctaviaBase):
         udp_lb = copy.copy(self.ovn_lb)
         udp_lb.external_ids.pop(ovn_const.LB_EXT_IDS_VIP_FIP_KEY)
         udp_lb.protocol = ['udp']
-        self.helper.ovn_nbdb_api.db_find_rows.return_value.\
+        self.helper.ovn_nbdb_api.get_lbs_by_name.return_value.\
             execute.side_effect = [[udp_lb], [self.ovn_lb]]
         self.helper._get_or_create_ovn_lb(
             self.ovn_lb.name,
@@ -831,7 +901,7 @@ class TestOvnProviderHelper(ovn_base.TestOvnOctaviaBase):
     def test_lb_create_assoc_lb_to_lr_by_step(self, net_cli, f_lr):
         self.mock_find_ovn_lbs.stop()
         self.helper._find_ovn_lbs
-        self.helper.ovn_nbdb_api.db_find_rows.return_value.\
+        self.helper.ovn_nbdb_api.get_lbs_by_name.return_value.\
             execute.return_value = [self.ovn_lb]
         self._update_lb_to_ls_association.stop()
         self.lb['admin_state_up'] = True
@@ -1482,7 +1552,7 @@ class TestOvnProviderHelper(ovn_base.TestOvnOctaviaBase):
         udp_lb = copy.copy(self.ovn_lb)
         udp_lb.protocol = ['udp']
         udp_lb.uuid = 'foo_uuid'
-        self.helper.ovn_nbdb_api.db_find_rows.return_value.\
+        self.helper.ovn_nbdb_api.get_lbs_by_name.return_value.\
             execute.return_value = [self.ovn_lb, udp_lb]
         self.helper.lb_delete(self.lb)
         self.helper.ovn_nbdb_api.lb_del.assert_has_calls([
@@ -1539,7 +1609,7 @@ class TestOvnProviderHelper(ovn_base.TestOvnOctaviaBase):
         udp_lb = copy.deepcopy(self.ovn_lb)
         udp_lb.protocol = ['udp']
         udp_lb.uuid = 'foo_uuid'
-        self.helper.ovn_nbdb_api.db_find_rows.return_value.\
+        self.helper.ovn_nbdb_api.get_lbs_by_name.return_value.\
             execute.return_value = [self.ovn_lb, udp_lb]
         self.lb['admin_state_up'] = True
         status = self.helper.lb_update(self.lb)
@@ -1627,17 +1697,13 @@ class TestOvnProviderHelper(ovn_base.TestOvnOctaviaBase):
     def test_listener_create_no_default_pool(self):
         self.listener['admin_state_up'] = True
         self.listener.pop('default_pool_id')
+        self.ovn_lb.vips = {}
         self.helper.listener_create(self.listener)
-        expected_calls = [
-            mock.call('Load_Balancer', self.ovn_lb.uuid, ('external_ids', {
-                'listener_%s' % self.listener_id: '80:'})),
-            mock.call('Load_Balancer', self.ovn_lb.uuid,
-                      ('vips', {}))]
-        self.helper.ovn_nbdb_api.db_set.assert_has_calls(
-            expected_calls)
-        self.assertEqual(
-            len(expected_calls),
-            self.helper.ovn_nbdb_api.db_set.call_count)
+        self.helper.ovn_nbdb_api.db_set.assert_called_once_with(
+            'Load_Balancer', self.ovn_lb.uuid, ('external_ids', {
+                'listener_%s' % self.listener_id: '80:'}))
+        # The listener has no pool, so no VIP is added
+        self.helper.ovn_nbdb_api.lb_update_vips.assert_not_called()
 
     def test_listener_create_exception(self):
         self.helper.ovn_nbdb_api.db_set.side_effect = [RuntimeError]
@@ -1849,7 +1915,7 @@ class TestOvnProviderHelper(ovn_base.TestOvnOctaviaBase):
         ovn_lb_udp = copy.copy(self.ovn_lb)
         ovn_lb_udp.protocol = ['udp']
         self.mock_find_ovn_lbs.stop()
-        self.helper.ovn_nbdb_api.db_find_rows.return_value.\
+        self.helper.ovn_nbdb_api.get_lbs_by_name.return_value.\
             execute.side_effect = [[self.ovn_lb], [self.ovn_lb, ovn_lb_udp]]
         lb_empty.return_value = True
         self.helper.listener_delete(self.listener)
@@ -1879,12 +1945,8 @@ class TestOvnProviderHelper(ovn_base.TestOvnOctaviaBase):
             'external_ids', 'listener_%s' % self.listener_id)
         self.helper.ovn_nbdb_api.lb_del.assert_not_called()
         # vip refresh will have been called
-        self.helper.ovn_nbdb_api.db_clear.assert_has_calls([
-            mock.call('Load_Balancer', self.ovn_lb.uuid,
-                      ('vips'))])
-        self.helper.ovn_nbdb_api.db_set.assert_has_calls([
-            mock.call('Load_Balancer', self.ovn_lb.uuid,
-                      ('vips', {}))])
+        self.helper.ovn_nbdb_api.lb_update_vips.assert_called_once_with(
+            self.ovn_lb.uuid, {}, ['10.22.33.4:80', '123.123.123.123:80'])
 
     @mock.patch.object(ovn_helper.OvnProviderHelper, '_refresh_lb_vips')
     def test_listener_sync_listener_same_in_externals_ids(self, refresh_vips):
@@ -1893,7 +1955,7 @@ class TestOvnProviderHelper(ovn_base.TestOvnOctaviaBase):
         self.ovn_lb.external_ids[listener_key] = f"80:pool_{self.pool_id}"
         self.helper.listener_sync(self.listener, self.ovn_lb)
         refresh_vips.assert_called_once_with(
-            self.ovn_lb, self.ovn_lb.external_ids, is_sync=True)
+            self.ovn_lb, self.ovn_lb.external_ids)
         self.helper.ovn_nbdb_api.db_set.assert_not_called()
 
     @mock.patch.object(ovn_helper.OvnProviderHelper, '_refresh_lb_vips')
@@ -1904,7 +1966,7 @@ class TestOvnProviderHelper(ovn_base.TestOvnOctaviaBase):
         self.ovn_lb.external_ids[listener_key] = ''
         self.helper.listener_sync(self.listener, self.ovn_lb)
         refresh_vips.assert_called_once_with(
-            self.ovn_lb, external_ids, is_sync=True)
+            self.ovn_lb, external_ids)
         expected_calls = [
             mock.call('Load_Balancer', self.ovn_lb.uuid, ('external_ids', {
                 f"listener_{self.listener_id}": f"80:pool_{self.pool_id}"}))
@@ -2034,6 +2096,7 @@ class TestOvnProviderHelper(ovn_base.TestOvnOctaviaBase):
         self.ovn_lb.external_ids.update({
             disabled_p_key: self.member_line})
         self.ovn_lb.external_ids.pop(p_key)
+        self.ovn_lb.vips = {}
         status = self.helper.pool_update(self.pool)
         self.assertEqual(status['loadbalancers'][0]['provisioning_status'],
                          constants.ACTIVE)
@@ -2041,15 +2104,13 @@ class TestOvnProviderHelper(ovn_base.TestOvnOctaviaBase):
                          constants.ACTIVE)
         self.assertEqual(status['pools'][0]['operating_status'],
                          constants.ONLINE)
-        expected_calls = [
-            mock.call('Load_Balancer', self.ovn_lb.uuid,
-                      ('external_ids',
-                          {'pool_%s' % self.pool_id: self.member_line})),
-            mock.call('Load_Balancer', self.ovn_lb.uuid,
-                      ('vips', {'10.22.33.4:80': '192.168.2.149:1010',
-                                '123.123.123.123:80': '192.168.2.149:1010'}))]
-        self.helper.ovn_nbdb_api.db_set.assert_has_calls(
-            expected_calls)
+        self.helper.ovn_nbdb_api.db_set.assert_called_once_with(
+            'Load_Balancer', self.ovn_lb.uuid,
+            ('external_ids', {'pool_%s' % self.pool_id: self.member_line}))
+        self.helper.ovn_nbdb_api.lb_update_vips.assert_called_once_with(
+            self.ovn_lb.uuid,
+            {'10.22.33.4:80': '192.168.2.149:1010',
+             '123.123.123.123:80': '192.168.2.149:1010'}, [])
 
     def test_pool_update_pool_disabled_change_to_down(self):
         self.pool.update({'admin_state_up': False})
@@ -2077,13 +2138,11 @@ class TestOvnProviderHelper(ovn_base.TestOvnOctaviaBase):
                          constants.ACTIVE)
         self.assertEqual(status['pools'][0]['operating_status'],
                          constants.OFFLINE)
-        expected_calls = [
-            mock.call('Load_Balancer', self.ovn_lb.uuid,
-                      ('external_ids',
-                          {'pool_%s:D' % self.pool_id: self.member_line})),
-            mock.call('Load_Balancer', self.ovn_lb.uuid, ('vips', {}))]
-        self.helper.ovn_nbdb_api.db_set.assert_has_calls(
-            expected_calls)
+        self.helper.ovn_nbdb_api.db_set.assert_called_once_with(
+            'Load_Balancer', self.ovn_lb.uuid,
+            ('external_ids', {'pool_%s:D' % self.pool_id: self.member_line}))
+        self.helper.ovn_nbdb_api.lb_update_vips.assert_called_once_with(
+            self.ovn_lb.uuid, {}, ['10.22.33.4:80', '123.123.123.123:80'])
 
     def test_pool_update_listeners(self):
         self.helper._get_pool_listeners.return_value = ['listener1']
@@ -2101,13 +2160,12 @@ class TestOvnProviderHelper(ovn_base.TestOvnOctaviaBase):
                          constants.ACTIVE)
         self.assertEqual(status['pools'][0]['provisioning_status'],
                          constants.DELETED)
-        self.helper.ovn_nbdb_api.db_clear.assert_called_once_with(
-            'Load_Balancer', self.ovn_lb.uuid, 'vips')
+        self.helper.ovn_nbdb_api.lb_update_vips.assert_called_once_with(
+            self.ovn_lb.uuid, {}, ['10.22.33.4:80', '123.123.123.123:80'])
         self.helper.ovn_nbdb_api.db_remove.assert_called_once_with(
             'Load_Balancer', self.ovn_lb.uuid,
             'external_ids', 'pool_%s' % self.pool_id)
         expected_calls = [
-            mock.call('Load_Balancer', self.ovn_lb.uuid, ('vips', {})),
             mock.call(
                 'Load_Balancer', self.ovn_lb.uuid,
                 ('external_ids', {
@@ -2199,7 +2257,7 @@ class TestOvnProviderHelper(ovn_base.TestOvnOctaviaBase):
     def test_pool_delete_ovn_lb_empty_lb_not_empty(self, lb_empty):
         ovn_lb_udp = copy.copy(self.ovn_lb)
         self.mock_find_ovn_lbs.stop()
-        self.helper.ovn_nbdb_api.db_find_rows.return_value.\
+        self.helper.ovn_nbdb_api.get_lbs_by_name.return_value.\
             execute.side_effect = [[self.ovn_lb], [self.ovn_lb, ovn_lb_udp]]
         lb_empty.return_value = True
         self.helper.pool_delete(self.pool)
@@ -2385,12 +2443,11 @@ class TestOvnProviderHelper(ovn_base.TestOvnOctaviaBase):
     def test_member_create_already_exists(self):
         status = self.helper.member_create(self.member)
         member_status = {
-            ovn_const.OVN_MEMBER_STATUS_KEY: '{"%s": "%s"}'
-            % (self.member_id, constants.NO_MONITOR)}
-        self.helper.ovn_nbdb_api.db_set.assert_called_once_with(
-            'Load_Balancer',
-            self.ovn_lb.uuid,
-            ('external_ids', member_status))
+            ovn_const.OVN_MEMBER_STATUS_PREFIX + self.member_id:
+                constants.NO_MONITOR}
+        self.helper.ovn_nbdb_api.lb_update_external_ids.\
+            assert_called_once_with(self.ovn_lb.uuid, member_status,
+                                    [ovn_const.OVN_MEMBER_STATUS_KEY])
         self.assertEqual(status['loadbalancers'][0]['provisioning_status'],
                          constants.ACTIVE)
         self.assertEqual(status['pools'][0]['provisioning_status'],
@@ -2403,17 +2460,16 @@ class TestOvnProviderHelper(ovn_base.TestOvnOctaviaBase):
     def test_member_create_first_member_in_pool(self):
         self.ovn_lb.external_ids.update({
             'pool_' + self.pool_id: ''})
+        self.ovn_lb.vips = {}
         self.helper.member_create(self.member)
-        expected_calls = [
+        self.helper.ovn_nbdb_api.db_set.assert_has_calls([
             mock.call('Load_Balancer', self.ovn_lb.uuid,
                       ('external_ids',
-                       {'pool_%s' % self.pool_id: self.member_line})),
-            mock.call('Load_Balancer', self.ovn_lb.uuid,
-                      ('vips', {
-                          '10.22.33.4:80': '192.168.2.149:1010',
-                          '123.123.123.123:80': '192.168.2.149:1010'}))]
-        self.helper.ovn_nbdb_api.db_set.assert_has_calls(
-            expected_calls)
+                       {'pool_%s' % self.pool_id: self.member_line}))])
+        self.helper.ovn_nbdb_api.lb_update_vips.assert_called_once_with(
+            self.ovn_lb.uuid,
+            {'10.22.33.4:80': '192.168.2.149:1010',
+             '123.123.123.123:80': '192.168.2.149:1010'}, [])
 
     def test_member_create_second_member_in_pool(self):
         member2_id = uuidutils.generate_uuid()
@@ -2425,6 +2481,8 @@ class TestOvnProviderHelper(ovn_base.TestOvnOctaviaBase):
                          member2_port, member2_subnet_id))
         self.ovn_lb.external_ids.update(
             {'pool_%s' % self.pool_id: member2_line})
+        self.ovn_lb.vips = {'10.22.33.4:80': '192.168.2.150:1010',
+                            '123.123.123.123:80': '192.168.2.150:1010'}
         self.helper.member_create(self.member)
         all_member_line = (
             '%s,member_%s_%s:%s_%s' %
@@ -2432,19 +2490,15 @@ class TestOvnProviderHelper(ovn_base.TestOvnOctaviaBase):
              self.member_address, self.member_port,
              self.member_subnet_id))
         # We have two members now.
-        expected_calls = [
+        self.helper.ovn_nbdb_api.db_set.assert_has_calls([
             mock.call('Load_Balancer', self.ovn_lb.uuid,
                       ('external_ids', {
-                          'pool_%s' % self.pool_id: all_member_line})),
-            mock.call(
-                'Load_Balancer', self.ovn_lb.uuid,
-                ('vips', {
-                    '10.22.33.4:80':
-                        '192.168.2.150:1010,192.168.2.149:1010',
-                    '123.123.123.123:80':
-                        '192.168.2.150:1010,192.168.2.149:1010'}))]
-        self.helper.ovn_nbdb_api.db_set.assert_has_calls(
-            expected_calls)
+                          'pool_%s' % self.pool_id: all_member_line}))])
+        self.helper.ovn_nbdb_api.lb_update_vips.assert_called_once_with(
+            self.ovn_lb.uuid,
+            {'10.22.33.4:80': '192.168.2.150:1010,192.168.2.149:1010',
+             '123.123.123.123:80': '192.168.2.150:1010,192.168.2.149:1010'},
+            [])
 
     def test_member_update(self):
         status = self.helper.member_update(self.member)
@@ -2506,6 +2560,29 @@ class TestOvnProviderHelper(ovn_base.TestOvnOctaviaBase):
         self.assertEqual(status['members'][0]['operating_status'],
                          constants.NO_MONITOR)
 
+    @mock.patch.object(ovn_helper.OvnProviderHelper, '_execute_commands')
+    @mock.patch.object(ovn_helper.OvnProviderHelper, '_refresh_lb_vips')
+    def test_member_update_status_with_vips(self, refresh_vips,
+                                            execute_commands):
+        refresh_vips.return_value = ['vips']
+        self.member['admin_state_up'] = False
+        self.helper.member_update(self.member)
+        # The new status and the vips framed with it are committed together.
+        refresh_vips.assert_called_once_with(
+            self.ovn_lb, self.ovn_lb.external_ids,
+            offline_member_ids={self.member_id})
+        self.helper.ovn_nbdb_api.lb_update_external_ids.\
+            assert_called_once_with(
+                self.ovn_lb.uuid,
+                {ovn_const.OVN_MEMBER_STATUS_PREFIX + self.member_id:
+                    constants.OFFLINE},
+                [ovn_const.OVN_MEMBER_STATUS_KEY])
+        execute_commands.assert_called_once_with(
+            [self.helper.ovn_nbdb_api.lb_update_external_ids.return_value,
+             'vips'])
+        self.helper.ovn_nbdb_api.lb_update_external_ids.return_value.\
+            execute.assert_not_called()
+
     def test_member_update_disabled_lb(self):
         self.helper._find_ovn_lb_with_pool_key.side_effect = [
             None, self.ovn_lb]
@@ -2521,10 +2598,150 @@ class TestOvnProviderHelper(ovn_base.TestOvnOctaviaBase):
         self.assertEqual(status['pools'][0]['provisioning_status'],
                          constants.ACTIVE)
 
+    @mock.patch.object(ovn_helper.OvnProviderHelper, '_find_lr_of_ls')
+    @mock.patch('ovn_octavia_provider.common.clients.get_neutron_client')
+    def test_member_batch_update(self, net_cli, f_lr):
+        fake_subnet = fakes.FakeSubnet.create_one_subnet()
+        net_cli.return_value.get_subnet.return_value = fake_subnet
+        f_lr.return_value = None
+        pool_key = 'pool_%s' % self.pool_id
+        member2_id = uuidutils.generate_uuid()
+        member2_subnet_id = uuidutils.generate_uuid()
+        member2 = {'id': member2_id,
+                   'address': '192.168.2.150',
+                   'protocol_port': '1010',
+                   'subnet_id': member2_subnet_id,
+                   'pool_id': self.pool_id,
+                   'admin_state_up': True}
+        member2_line = 'member_%s_192.168.2.150:1010_%s' % (
+            member2_id, member2_subnet_id)
+        member3_id = uuidutils.generate_uuid()
+        member3_subnet_id = uuidutils.generate_uuid()
+        member3_line = 'member_%s_192.168.2.151:1010_%s' % (
+            member3_id, member3_subnet_id)
+        del self.ovn_lb.external_ids[ovn_const.OVN_MEMBER_STATUS_KEY]
+        self.ovn_lb.external_ids.update({
+            pool_key: '%s,%s' % (self.member_line, member3_line),
+            ovn_const.OVN_MEMBER_STATUS_PREFIX + self.member_id:
+                constants.NO_MONITOR,
+            ovn_const.OVN_MEMBER_STATUS_PREFIX + member3_id:
+                constants.ONLINE})
+        self.ovn_lb.vips = {
+            '10.22.33.4:80': '192.168.2.149:1010,192.168.2.151:1010',
+            '123.123.123.123:80': '192.168.2.149:1010,192.168.2.151:1010'}
+
+        status = self.helper.member_batch_update(
+            {'pool_id': self.pool_id, 'members': [self.member, member2]})
+
+        # Everything is committed in a single transaction, writing only the
+        # status keys of the new and removed members.
+        self.helper.ovn_nbdb_api.transaction.assert_called_once_with(
+            check_error=True)
+        self.helper.ovn_nbdb_api.lb_update_external_ids.\
+            assert_called_once_with(
+                self.ovn_lb.uuid,
+                {pool_key: '%s,%s' % (self.member_line, member2_line),
+                 ovn_const.OVN_MEMBER_STATUS_PREFIX + member2_id:
+                    constants.NO_MONITOR},
+                [ovn_const.OVN_MEMBER_STATUS_PREFIX + member3_id])
+        self.helper.ovn_nbdb_api.db_set.assert_not_called()
+        self.helper.ovn_nbdb_api.lb_update_vips.assert_called_once_with(
+            self.ovn_lb.uuid,
+            {'10.22.33.4:80': '192.168.2.149:1010,192.168.2.150:1010',
+             '123.123.123.123:80': '192.168.2.149:1010,192.168.2.150:1010'},
+            [])
+        self.helper._get_lb_to_ls_association_commands.assert_has_calls([
+            mock.call(self.ovn_lb, network_id=fake_subnet.network_id,
+                      associate=False, update_ls_ref=False,
+                      additional_vips=False, ls_refs={}),
+            mock.call(self.ovn_lb, network_id=fake_subnet.network_id,
+                      associate=True, update_ls_ref=False,
+                      additional_vips=False, ls_refs={})])
+        self.helper._update_lb_to_ls_association.assert_not_called()
+        self.assertEqual(
+            [{'id': self.member_id,
+              'provisioning_status': constants.ACTIVE,
+              'operating_status': constants.NO_MONITOR},
+             {'id': member2_id,
+              'provisioning_status': constants.ACTIVE,
+              'operating_status': constants.NO_MONITOR},
+             {'id': member3_id,
+              'provisioning_status': constants.DELETED}],
+            status['members'])
+        self.assertEqual(constants.ACTIVE,
+                         status['loadbalancers'][0]['provisioning_status'])
+
+    @mock.patch.object(ovn_helper.OvnProviderHelper, '_members_in_subnet')
+    @mock.patch.object(ovn_helper.OvnProviderHelper, '_clean_up_hm_port')
+    @mock.patch.object(ovn_helper.OvnProviderHelper, '_update_hm_member')
+    @mock.patch('ovn_octavia_provider.common.clients.get_neutron_client')
+    def test_member_batch_update_hm(self, net_cli, uhm, clean_hm_port,
+                                    members_in_subnet):
+        net_cli.return_value.get_subnet.side_effect = [
+            openstack.exceptions.ResourceNotFound]
+        uhm.return_value = constants.ONLINE
+        members_in_subnet.return_value = False
+        pool_key = 'pool_%s' % self.pool_id
+        self.ovn_lb.health_check = [self.ovn_hm]
+        member2 = dict(self.member, id=uuidutils.generate_uuid(),
+                       address='192.168.2.150')
+        member2['admin_state_up'] = False
+        self.ovn_lb.external_ids[pool_key] = 'member_%s_%s:%s_%s' % (
+            member2['id'], member2['address'], self.member_port,
+            self.member_subnet_id)
+
+        status = self.helper.member_batch_update(
+            {'pool_id': self.pool_id, 'members': [self.member]})
+
+        uhm.assert_has_calls([
+            mock.call(self.ovn_lb, pool_key, member2['address'],
+                      delete=True),
+            mock.call(self.ovn_lb, pool_key, self.member_address,
+                      pool_members=self.member_line)])
+        # The legacy neutron:member_status key is migrated, and the status
+        # of the new member is written along with the pool.
+        self.helper.ovn_nbdb_api.lb_update_external_ids.\
+            assert_called_once_with(
+                self.ovn_lb.uuid,
+                {pool_key: self.member_line,
+                 ovn_const.OVN_MEMBER_STATUS_PREFIX + self.member_id:
+                    constants.ONLINE},
+                [ovn_const.OVN_MEMBER_STATUS_KEY,
+                 ovn_const.OVN_MEMBER_STATUS_PREFIX + member2['id']])
+        clean_hm_port.assert_called_once_with(self.member_subnet_id)
+        self.assertEqual(
+            [{'id': self.member_id,
+              'provisioning_status': constants.ACTIVE,
+              'operating_status': constants.ONLINE},
+             {'id': member2['id'],
+              'provisioning_status': constants.DELETED}],
+            status['members'])
+
+    def test_member_batch_update_exception(self):
+        self.helper._find_ovn_lb_with_pool_key.side_effect = [RuntimeError]
+        status = self.helper.member_batch_update(
+            {'pool_id': self.pool_id, 'members': [self.member]})
+        self.assertEqual(
+            {'members': [{'id': self.member_id,
+                          'provisioning_status': constants.ERROR}]},
+            status)
+
     @mock.patch('ovn_octavia_provider.helper.OvnProviderHelper.'
                 '_refresh_lb_vips')
     def test_member_delete(self, mock_vip_command):
+        mock_vip_command.return_value = []
         status = self.helper.member_delete(self.member)
+        # The member status is removed in the same transaction.
+        self.helper.ovn_nbdb_api.lb_update_external_ids.\
+            assert_called_once_with(
+                self.ovn_lb.uuid, {},
+                [ovn_const.OVN_MEMBER_STATUS_KEY,
+                 ovn_const.OVN_MEMBER_STATUS_PREFIX + self.member_id])
+        txn = self.helper.ovn_nbdb_api.transaction.return_value.__enter__()
+        txn.add.assert_called_with(
+            self.helper.ovn_nbdb_api.lb_update_external_ids.return_value)
+        self.helper.ovn_nbdb_api.lb_update_external_ids.return_value.\
+            execute.assert_not_called()
         self.assertEqual(status['loadbalancers'][0]['provisioning_status'],
                          constants.ACTIVE)
         self.assertEqual(status['pools'][0]['provisioning_status'],
@@ -2548,11 +2765,12 @@ class TestOvnProviderHelper(ovn_base.TestOvnOctaviaBase):
              member2_id, member2_address, member2_port, member2_subnet_id))
         self.ovn_lb.external_ids.update({
             'pool_' + self.pool_id: member_line})
+        rmmember.return_value = constants.ONLINE
         status = self.helper.member_delete(self.member)
         rmmember.assert_called_once_with(
             self.member, self.ovn_lb, 'pool_' + self.pool_id)
-        update_external_ids_members.assert_called_once_with(
-            self.ovn_lb, self.member_id, None, delete=True)
+        # The member status is removed along with the member.
+        update_external_ids_members.assert_not_called()
         self.assertEqual(status['members'][0]['provisioning_status'],
                          constants.DELETED)
         self.assertEqual(status['pools'][0]['provisioning_status'],
@@ -2600,6 +2818,11 @@ class TestOvnProviderHelper(ovn_base.TestOvnOctaviaBase):
         self.ovn_lb.external_ids.update({'pool_' + self.pool_id: ''})
         self.ovn_lb.external_ids[ovn_const.OVN_MEMBER_STATUS_KEY] = '{}'
         status = self.helper.member_delete(self.member)
+        self.helper.ovn_nbdb_api.lb_update_external_ids.\
+            assert_called_once_with(
+                self.ovn_lb.uuid, {},
+                [ovn_const.OVN_MEMBER_STATUS_KEY,
+                 ovn_const.OVN_MEMBER_STATUS_PREFIX + self.member_id])
         self.assertEqual(status['loadbalancers'][0]['provisioning_status'],
                          constants.ACTIVE)
         self.assertEqual(status['listeners'][0]['provisioning_status'],
@@ -2635,14 +2858,13 @@ class TestOvnProviderHelper(ovn_base.TestOvnOctaviaBase):
         self.ovn_lb.external_ids.update(
             {pool_key: self.member_line})
         folbpi.return_value = (pool_key, self.ovn_lb)
+        # The VIPs are missing in the OVN LB
+        self.ovn_lb.vips = {}
         self.helper.member_sync(self.member, self.ovn_lb, pool_key)
-        expected_calls = [
-            mock.call('Load_Balancer', self.ovn_lb.uuid,
-                      ('vips', {
-                          '10.22.33.4:80': '192.168.2.149:1010',
-                          '123.123.123.123:80': '192.168.2.149:1010'}))]
-        self.helper.ovn_nbdb_api.db_set.assert_has_calls(
-            expected_calls)
+        self.helper.ovn_nbdb_api.lb_update_vips.assert_called_once_with(
+            self.ovn_lb.uuid,
+            {'10.22.33.4:80': '192.168.2.149:1010',
+             '123.123.123.123:80': '192.168.2.149:1010'}, [])
         self.assertEqual(
             self.helper._update_lb_to_lr_association.call_count, 1)
         self.assertEqual(
@@ -2661,14 +2883,13 @@ class TestOvnProviderHelper(ovn_base.TestOvnOctaviaBase):
         self.ovn_lb.external_ids.update(
             {pool_key: self.member_line})
         folbpi.return_value = (pool_key, self.ovn_lb)
+        # The VIPs are missing in the OVN LB
+        self.ovn_lb.vips = {}
         self.helper.member_sync(self.member, self.ovn_lb, pool_key)
-        expected_calls = [
-            mock.call('Load_Balancer', self.ovn_lb.uuid,
-                      ('vips', {
-                          '10.22.33.4:80': '192.168.2.149:1010',
-                          '123.123.123.123:80': '192.168.2.149:1010'}))]
-        self.helper.ovn_nbdb_api.db_set.assert_has_calls(
-            expected_calls)
+        self.helper.ovn_nbdb_api.lb_update_vips.assert_called_once_with(
+            self.ovn_lb.uuid,
+            {'10.22.33.4:80': '192.168.2.149:1010',
+             '123.123.123.123:80': '192.168.2.149:1010'}, [])
         self.assertEqual(
             self.helper._update_lb_to_lr_association.call_count, 1)
         self.assertEqual(
@@ -2686,14 +2907,13 @@ class TestOvnProviderHelper(ovn_base.TestOvnOctaviaBase):
         self.ovn_lb.external_ids.update(
             {pool_key: self.member_line})
         folbpi.return_value = (pool_key, self.ovn_lb)
+        # The VIPs are missing in the OVN LB
+        self.ovn_lb.vips = {}
         self.helper.member_sync(self.member, self.ovn_lb, pool_key)
-        expected_calls = [
-            mock.call('Load_Balancer', self.ovn_lb.uuid,
-                      ('vips', {
-                          '10.22.33.4:80': '192.168.2.149:1010',
-                          '123.123.123.123:80': '192.168.2.149:1010'}))]
-        self.helper.ovn_nbdb_api.db_set.assert_has_calls(
-            expected_calls)
+        self.helper.ovn_nbdb_api.lb_update_vips.assert_called_once_with(
+            self.ovn_lb.uuid,
+            {'10.22.33.4:80': '192.168.2.149:1010',
+             '123.123.123.123:80': '192.168.2.149:1010'}, [])
         self.assertEqual(
             self.helper._update_lb_to_lr_association.call_count, 0)
         self.assertEqual(
@@ -2704,17 +2924,16 @@ class TestOvnProviderHelper(ovn_base.TestOvnOctaviaBase):
         pool_key = 'pool_' + self.pool_id
         self.ovn_lb.external_ids.update({
             pool_key: ''})
+        self.ovn_lb.vips = {}
         self.helper.member_sync(self.member, self.ovn_lb, pool_key)
-        expected_calls = [
+        self.helper.ovn_nbdb_api.db_set.assert_has_calls([
             mock.call('Load_Balancer', self.ovn_lb.uuid,
                       ('external_ids',
-                       {'pool_%s' % self.pool_id: self.member_line})),
-            mock.call('Load_Balancer', self.ovn_lb.uuid,
-                      ('vips', {
-                          '10.22.33.4:80': '192.168.2.149:1010',
-                          '123.123.123.123:80': '192.168.2.149:1010'}))]
-        self.helper.ovn_nbdb_api.db_set.assert_has_calls(
-            expected_calls)
+                       {'pool_%s' % self.pool_id: self.member_line}))])
+        self.helper.ovn_nbdb_api.lb_update_vips.assert_called_once_with(
+            self.ovn_lb.uuid,
+            {'10.22.33.4:80': '192.168.2.149:1010',
+             '123.123.123.123:80': '192.168.2.149:1010'}, [])
 
     @mock.patch('ovn_octavia_provider.common.clients.get_neutron_client')
     def test_logical_router_port_event_create(self, net_cli):
@@ -3361,21 +3580,15 @@ class TestOvnProviderHelper(ovn_base.TestOvnOctaviaBase):
             attrs={
                 'name': 'router1',
                 'ports': [lrp]})
-        lrp2 = fakes.FakeOvsdbRow.create_one_ovsdb_row(
-            attrs={
-                'name': 'lrp-foo-name2',
-            })
-        lr2 = fakes.FakeOVNRouter.create_one_router(
-            attrs={
-                'name': 'router2',
-                'ports': [lrp2]})
         ls = fakes.FakeOvsdbRow.create_one_ovsdb_row(
             attrs={'ports': [lsp2, lsp]})
 
-        (self.helper.ovn_nbdb_api.get_lrs.return_value.
-            execute.return_value) = [lr2, lr]
+        (self.helper.ovn_nbdb_api.get_lrs_by_lrp_name.return_value.
+            execute.return_value) = [lr]
         returned_lr = self.helper._find_lr_of_ls(ls, '10.10.10.1')
         self.assertEqual(lr, returned_lr)
+        self.helper.ovn_nbdb_api.get_lrs_by_lrp_name.assert_called_once_with(
+            'lrp-foo-name')
 
     def test__find_lr_of_ls_multiple_address_ipv4(self):
         lsp = fakes.FakeOvsdbRow.create_one_ovsdb_row(
@@ -3403,7 +3616,7 @@ class TestOvnProviderHelper(ovn_base.TestOvnOctaviaBase):
         ls = fakes.FakeOvsdbRow.create_one_ovsdb_row(
             attrs={'ports': [lsp]})
 
-        (self.helper.ovn_nbdb_api.get_lrs.return_value.
+        (self.helper.ovn_nbdb_api.get_lrs_by_lrp_name.return_value.
             execute.return_value) = [lr]
         returned_lr = self.helper._find_lr_of_ls(ls, '10.10.20.1')
         self.assertEqual(lr, returned_lr)
@@ -3435,7 +3648,7 @@ class TestOvnProviderHelper(ovn_base.TestOvnOctaviaBase):
         ls = fakes.FakeOvsdbRow.create_one_ovsdb_row(
             attrs={'ports': [lsp]})
 
-        (self.helper.ovn_nbdb_api.get_lrs.return_value.
+        (self.helper.ovn_nbdb_api.get_lrs_by_lrp_name.return_value.
             execute.return_value) = [lr]
         returned_lr = self.helper._find_lr_of_ls(
             ls, 'fd61:5fe4:978c:a334:0:3eff:24ab:f816')
@@ -3466,7 +3679,7 @@ class TestOvnProviderHelper(ovn_base.TestOvnOctaviaBase):
             })
         ls = fakes.FakeOvsdbRow.create_one_ovsdb_row(
             attrs={'ports': [lsp2, lsp]})
-        (self.helper.ovn_nbdb_api.get_lrs.return_value.
+        (self.helper.ovn_nbdb_api.get_lrs_by_lrp_name.return_value.
             execute.return_value) = []
         returned_lr = self.helper._find_lr_of_ls(ls, '10.10.10.1')
         self.assertIsNone(returned_lr)
@@ -3491,10 +3704,12 @@ class TestOvnProviderHelper(ovn_base.TestOvnOctaviaBase):
         ls = fakes.FakeOvsdbRow.create_one_ovsdb_row(
             attrs={'ports': [lsp]})
 
-        (self.helper.ovn_nbdb_api.get_lrs.return_value.
+        (self.helper.ovn_nbdb_api.get_lrs_by_lrp_name.return_value.
             execute.return_value) = [lr]
         returned_lr = self.helper._find_lr_of_ls(ls)
         self.assertEqual(lr, returned_lr)
+        self.helper.ovn_nbdb_api.get_lrs_by_lrp_name.assert_called_once_with(
+            'lrp-lrp-foo-name')
 
     def test__find_lr_of_ls_no_lrp_name(self):
         lsp = fakes.FakeOvsdbRow.create_one_ovsdb_row(
@@ -3894,6 +4109,7 @@ class TestOvnProviderHelper(ovn_base.TestOvnOctaviaBase):
                  'vip_related': [fake_port.fixed_ips[0]['ip_address']],
                  'additional_vip_fip': False,
                  'vip_fip': fip,
+                 'loadbalancer_id': self.ovn_lb.name,
                  'ovn_lb': self.ovn_lb},
             'type': 'handle_vip_fip'}
         self.mock_add_request.assert_called_once_with(expected_call)
@@ -3933,6 +4149,7 @@ class TestOvnProviderHelper(ovn_base.TestOvnOctaviaBase):
                  'vip_fip': fip,
                  'additional_vip_fip': False,
                  'vip_related': [fake_port.fixed_ips[0]['ip_address']],
+                 'loadbalancer_id': self.ovn_lb.name,
                  'ovn_lb': self.ovn_lb},
             'type': 'handle_vip_fip'}
         self.mock_add_request.assert_called_once_with(expected_call)
@@ -4036,6 +4253,7 @@ class TestOvnProviderHelper(ovn_base.TestOvnOctaviaBase):
                 'vip_fip': '172.24.4.40',
                 'vip_related': [],
                 'additional_vip_fip': False,
+                'loadbalancer_id': lb1.name,
                 'ovn_lb': lb1
             }
         }
@@ -4114,6 +4332,7 @@ class TestOvnProviderHelper(ovn_base.TestOvnOctaviaBase):
                          'vip_fip': '172.24.4.40',
                          'vip_related': [fake_port.fixed_ips[0]['ip_address']],
                          'additional_vip_fip': False,
+                         'loadbalancer_id': lb.name,
                          'ovn_lb': lb}}
 
         self.mock_add_request.assert_has_calls([
@@ -4153,6 +4372,7 @@ class TestOvnProviderHelper(ovn_base.TestOvnOctaviaBase):
                 'vip_fip': fip,
                 'vip_related': [fake_port.fixed_ips[0]['ip_address']],
                 'additional_vip_fip': True,
+                'loadbalancer_id': lb1.name,
                 'ovn_lb': lb1}}
 
         self.mock_add_request.assert_has_calls([mock.call(expected)])
@@ -4189,6 +4409,7 @@ class TestOvnProviderHelper(ovn_base.TestOvnOctaviaBase):
                 'vip_fip': '10.0.0.99',
                 'vip_related': [fake_port.fixed_ips[0]['ip_address']],
                 'additional_vip_fip': True,
+                'loadbalancer_id': lb1.name,
                 'ovn_lb': lb1}}
 
         self.mock_add_request.assert_has_calls([mock.call(expected)])
@@ -4218,6 +4439,7 @@ class TestOvnProviderHelper(ovn_base.TestOvnOctaviaBase):
             'neutron:vip_fip': vip_fip}
 
         lb.external_ids = external_ids
+        lb.vips = {'10.0.0.123:80': '192.168.2.149:1010'}
         lb_hc = mock.MagicMock()
         lb_hc.uuid = "fake_lb_hc_vip"
         lb_hc.vip = "{}:80".format('172.26.21.20')
@@ -4247,8 +4469,7 @@ class TestOvnProviderHelper(ovn_base.TestOvnOctaviaBase):
             mock.call.db_remove(
                 'Load_Balancer', lb.uuid, 'health_check', lb_hc_fip.uuid),
             mock.call.db_destroy('Load_Balancer_Health_Check', lb_hc_fip.uuid),
-            mock.call.db_clear('Load_Balancer', lb.uuid, 'vips'),
-            mock.call.db_set('Load_Balancer', lb.uuid, ('vips', {}))]
+            mock.call.lb_update_vips(lb.uuid, {}, ['10.0.0.123:80'])]
         self.helper.ovn_nbdb_api.assert_has_calls(calls)
 
     @mock.patch('ovn_octavia_provider.helper.OvnProviderHelper.'
@@ -4261,6 +4482,7 @@ class TestOvnProviderHelper(ovn_base.TestOvnOctaviaBase):
             'neutron:vip_fip': vip_fip}
 
         lb.external_ids = external_ids
+        lb.vips = {'10.0.0.123:80': '192.168.2.149:1010'}
         lb.health_check = []
 
         fip_info = {
@@ -4272,8 +4494,7 @@ class TestOvnProviderHelper(ovn_base.TestOvnOctaviaBase):
         calls = [
             mock.call.db_remove(
                 'Load_Balancer', lb.uuid, 'external_ids', 'neutron:vip_fip'),
-            mock.call.db_clear('Load_Balancer', lb.uuid, 'vips'),
-            mock.call.db_set('Load_Balancer', lb.uuid, ('vips', {}))]
+            mock.call.lb_update_vips(lb.uuid, {}, ['10.0.0.123:80'])]
         self.helper.ovn_nbdb_api.assert_has_calls(calls)
 
     @mock.patch('ovn_octavia_provider.helper.OvnProviderHelper.'
@@ -4289,6 +4510,7 @@ class TestOvnProviderHelper(ovn_base.TestOvnOctaviaBase):
         lb_hc = mock.MagicMock()
         lb_hc.uuid = "fake_lb_hc"
         lb_hc.vip = "10.0.0.222:80"
+        lb.vips = {'10.0.0.123:80': '192.168.2.149:1010'}
         lb.health_check = [lb_hc]
         lb.health_check = []
 
@@ -4301,8 +4523,7 @@ class TestOvnProviderHelper(ovn_base.TestOvnOctaviaBase):
         calls = [
             mock.call.db_remove(
                 'Load_Balancer', lb.uuid, 'external_ids', 'neutron:vip_fip'),
-            mock.call.db_clear('Load_Balancer', lb.uuid, 'vips'),
-            mock.call.db_set('Load_Balancer', lb.uuid, ('vips', {}))]
+            mock.call.lb_update_vips(lb.uuid, {}, ['10.0.0.123:80'])]
         self.helper.ovn_nbdb_api.assert_has_calls(calls)
 
     @mock.patch('ovn_octavia_provider.helper.OvnProviderHelper.'
@@ -4323,20 +4544,16 @@ class TestOvnProviderHelper(ovn_base.TestOvnOctaviaBase):
             'neutron:vip': '172.26.21.20'}
 
         lb.external_ids = external_ids
+        lb.vips = {'172.26.21.20:80': '192.168.2.149:1010'}
         fb.return_value = lb
 
         self.helper.handle_vip_fip(fip_info)
 
-        expected_db_set_calls = [
-            mock.call('Load_Balancer', lb.uuid,
-                      ('external_ids', {'neutron:vip_fip': '10.0.0.123'})),
-            mock.call('Load_Balancer', lb.uuid,
-                      ('vips', {'10.0.0.123:80': '192.168.2.149:1010',
-                                '172.26.21.20:80': '192.168.2.149:1010'}))
-        ]
-        self.helper.ovn_nbdb_api.db_set.assert_has_calls(expected_db_set_calls)
-        self.helper.ovn_nbdb_api.db_clear.assert_called_once_with(
-            'Load_Balancer', lb.uuid, 'vips')
+        self.helper.ovn_nbdb_api.db_set.assert_called_once_with(
+            'Load_Balancer', lb.uuid,
+            ('external_ids', {'neutron:vip_fip': '10.0.0.123'}))
+        self.helper.ovn_nbdb_api.lb_update_vips.assert_called_once_with(
+            lb.uuid, {'10.0.0.123:80': '192.168.2.149:1010'}, [])
 
     @mock.patch('ovn_octavia_provider.helper.OvnProviderHelper.'
                 '_find_ovn_lbs')
@@ -4358,18 +4575,14 @@ class TestOvnProviderHelper(ovn_base.TestOvnOctaviaBase):
         }
 
         lb.external_ids = external_ids
+        lb.vips = {'172.26.21.20:80': '192.168.2.149:1010'}
         fb.return_value = lb
 
         self.helper.handle_vip_fip(fip_info)
 
-        expected_db_set_calls = [
-            mock.call('Load_Balancer', lb.uuid,
-                      ('vips', {'10.0.0.123:80': '192.168.2.149:1010',
-                                '172.26.21.20:80': '192.168.2.149:1010'}))
-        ]
-        self.helper.ovn_nbdb_api.db_set.assert_has_calls(expected_db_set_calls)
-        self.helper.ovn_nbdb_api.db_clear.assert_called_once_with(
-            'Load_Balancer', lb.uuid, 'vips')
+        self.helper.ovn_nbdb_api.db_set.assert_not_called()
+        self.helper.ovn_nbdb_api.lb_update_vips.assert_called_once_with(
+            lb.uuid, {'10.0.0.123:80': '192.168.2.149:1010'}, [])
 
     @mock.patch('ovn_octavia_provider.helper.OvnProviderHelper.'
                 '_find_ovn_lbs')
@@ -4407,7 +4620,7 @@ class TestOvnProviderHelper(ovn_base.TestOvnOctaviaBase):
 
         self.helper.handle_vip_fip(fip_info)
         self.helper.ovn_nbdb_api.db_set.assert_not_called()
-        self.helper.ovn_nbdb_api.db_clear.assert_not_called()
+        self.helper.ovn_nbdb_api.lb_update_vips.assert_not_called()
 
     def test_get_lsp(self):
         self.helper.ovn_nbdb_api.lookup.side_effect = [idlutils.RowNotFound]
@@ -4466,20 +4679,16 @@ class TestOvnProviderHelper(ovn_base.TestOvnOctaviaBase):
             'neutron:vip': '172.26.21.20'}
 
         lb.external_ids = external_ids
+        lb.vips = {'172.26.21.20:80': '192.168.2.149:1010'}
         fb.return_value = lb
 
         self.helper.handle_vip_fip(fip_info)
 
-        expected_db_set_calls = [
-            mock.call('Load_Balancer', lb.uuid,
-                      ('external_ids', {'neutron:vip_fip': '10.0.0.123'})),
-            mock.call('Load_Balancer', lb.uuid,
-                      ('vips', {'10.0.0.123:80': '192.168.2.149:1010',
-                                '172.26.21.20:80': '192.168.2.149:1010'}))
-        ]
-        self.helper.ovn_nbdb_api.db_set.assert_has_calls(expected_db_set_calls)
-        self.helper.ovn_nbdb_api.db_clear.assert_called_once_with(
-            'Load_Balancer', lb.uuid, 'vips')
+        self.helper.ovn_nbdb_api.db_set.assert_called_once_with(
+            'Load_Balancer', lb.uuid,
+            ('external_ids', {'neutron:vip_fip': '10.0.0.123'}))
+        self.helper.ovn_nbdb_api.lb_update_vips.assert_called_once_with(
+            lb.uuid, {'10.0.0.123:80': '192.168.2.149:1010'}, [])
 
     @mock.patch('ovn_octavia_provider.helper.OvnProviderHelper.'
                 '_find_ovn_lbs')
@@ -4491,6 +4700,7 @@ class TestOvnProviderHelper(ovn_base.TestOvnOctaviaBase):
             ovn_const.LB_EXT_IDS_ADDIT_VIP_FIP_KEY: vip_fip}
 
         lb.external_ids = external_ids
+        lb.vips = {'10.0.0.123:80': '192.168.2.149:1010'}
         lb_hc = mock.MagicMock()
         lb_hc.uuid = "fake_lb_hc_vip"
         lb_hc.vip = "{}:80".format('172.26.21.20')
@@ -4522,8 +4732,7 @@ class TestOvnProviderHelper(ovn_base.TestOvnOctaviaBase):
             mock.call.db_remove(
                 'Load_Balancer', lb.uuid, 'health_check', lb_hc_fip.uuid),
             mock.call.db_destroy('Load_Balancer_Health_Check', lb_hc_fip.uuid),
-            mock.call.db_clear('Load_Balancer', lb.uuid, 'vips'),
-            mock.call.db_set('Load_Balancer', lb.uuid, ('vips', {}))]
+            mock.call.lb_update_vips(lb.uuid, {}, ['10.0.0.123:80'])]
         self.helper.ovn_nbdb_api.assert_has_calls(calls)
 
     @mock.patch('ovn_octavia_provider.helper.OvnProviderHelper.'
@@ -4564,6 +4773,8 @@ class TestOvnProviderHelper(ovn_base.TestOvnOctaviaBase):
 
         lb.health_check = [ovn_hm, ovn_hm_addi]
         lb.external_ids = external_ids
+        lb.vips = {'172.26.21.20:80': '192.168.2.149:1010',
+                   '172.25.21.20:80': '192.168.2.149:1010'}
         fb.return_value = lb
 
         self.helper.handle_vip_fip(fip_info)
@@ -4587,20 +4798,12 @@ class TestOvnProviderHelper(ovn_base.TestOvnOctaviaBase):
             expected_db_create_calls)
         self.helper.ovn_nbdb_api.db_add.assert_called_once_with(
             'Load_Balancer', lb.uuid, 'health_check', mock.ANY)
-        expected_db_set_calls = [
-            mock.call('Load_Balancer', lb.uuid,
-                      ('external_ids', {
-                          ovn_const.LB_EXT_IDS_ADDIT_VIP_FIP_KEY: '10.0.0.123'}
-                       )),
-            mock.call('Load_Balancer', lb.uuid,
-                      ('vips', {'10.0.0.123:80': '192.168.2.149:1010',
-                                '172.26.21.20:80': '192.168.2.149:1010',
-                                '172.25.21.20:80': '192.168.2.149:1010'}))
-        ]
-        self.helper.ovn_nbdb_api.db_set.assert_has_calls(expected_db_set_calls)
-
-        self.helper.ovn_nbdb_api.db_clear.assert_called_once_with(
-            'Load_Balancer', lb.uuid, 'vips')
+        self.helper.ovn_nbdb_api.db_set.assert_called_once_with(
+            'Load_Balancer', lb.uuid,
+            ('external_ids', {
+                ovn_const.LB_EXT_IDS_ADDIT_VIP_FIP_KEY: '10.0.0.123'}))
+        self.helper.ovn_nbdb_api.lb_update_vips.assert_called_once_with(
+            lb.uuid, {'10.0.0.123:80': '192.168.2.149:1010'}, [])
 
     @mock.patch('ovn_octavia_provider.helper.OvnProviderHelper.'
                 '_find_ovn_lbs')
@@ -4620,6 +4823,7 @@ class TestOvnProviderHelper(ovn_base.TestOvnOctaviaBase):
             'neutron:vip': '172.26.21.20'}
 
         lb.external_ids = external_ids
+        lb.vips = {'172.26.21.20:80': '192.168.2.149:1010'}
         lb.health_check = []
         fb.return_value = lb
 
@@ -4627,16 +4831,11 @@ class TestOvnProviderHelper(ovn_base.TestOvnOctaviaBase):
 
         self.helper.ovn_nbdb_api.db_create.assert_not_called()
         self.helper.ovn_nbdb_api.db_add.assert_not_called()
-        expected_db_set_calls = [
-            mock.call('Load_Balancer', lb.uuid,
-                      ('external_ids', {'neutron:vip_fip': '10.0.0.123'})),
-            mock.call('Load_Balancer', lb.uuid,
-                      ('vips', {'10.0.0.123:80': '192.168.2.149:1010',
-                                '172.26.21.20:80': '192.168.2.149:1010'}))
-        ]
-        self.helper.ovn_nbdb_api.db_set.assert_has_calls(expected_db_set_calls)
-        self.helper.ovn_nbdb_api.db_clear.assert_called_once_with(
-            'Load_Balancer', lb.uuid, 'vips')
+        self.helper.ovn_nbdb_api.db_set.assert_called_once_with(
+            'Load_Balancer', lb.uuid,
+            ('external_ids', {'neutron:vip_fip': '10.0.0.123'}))
+        self.helper.ovn_nbdb_api.lb_update_vips.assert_called_once_with(
+            lb.uuid, {'10.0.0.123:80': '192.168.2.149:1010'}, [])
 
     @mock.patch('ovn_octavia_provider.common.clients.get_neutron_client')
     def test_handle_member_dvr_lb_has_no_fip(self, net_cli):
@@ -4658,6 +4857,7 @@ class TestOvnProviderHelper(ovn_base.TestOvnOctaviaBase):
         lb = mock.MagicMock()
         info = {
             'id': self.member_id,
+            'address': self.member_address,
             'subnet_id': self.member_subnet_id,
             'pool_id': self.pool_id,
             'action': ovn_const.REQ_INFO_MEMBER_ADDED}
@@ -4670,6 +4870,8 @@ class TestOvnProviderHelper(ovn_base.TestOvnOctaviaBase):
                 'external_ids': {},
                 'ports': {}})
         self.helper.ovn_nbdb_api.lookup.return_value = fake_ls
+        self.helper.ovn_nbdb_api.get_lsps_by_ip.return_value.\
+            execute.return_value = []
         self.helper.handle_member_dvr(info)
         self.helper.ovn_nbdb_api.db_clear.assert_not_called()
 
@@ -4729,6 +4931,8 @@ class TestOvnProviderHelper(ovn_base.TestOvnOctaviaBase):
                 'name': 'foo',
                 'ports': [fake_lsp]})
         self.helper.ovn_nbdb_api.lookup.return_value = fake_ls
+        self.helper.ovn_nbdb_api.get_lsps_by_ip.return_value.\
+            execute.return_value = [fake_lsp]
         fake_nat = fakes.FakeOvsdbRow.create_one_ovsdb_row(
             attrs={
                 'external_ip': '22.22.22.22',
@@ -4736,8 +4940,8 @@ class TestOvnProviderHelper(ovn_base.TestOvnOctaviaBase):
                     ovn_const.OVN_FIP_EXT_ID_KEY: 'fip_id'}})
         fip_info = {'description': 'bar'}
         net_cli.return_value.get_ip.return_value = fip_info
-        self.helper.ovn_nbdb_api.db_find_rows.return_value. \
-            execute.return_value = [fake_nat]
+        self.helper.ovn_nbdb_api.get_nats_by_fip_port_ids.return_value. \
+            execute.return_value = {fake_lsp.name: [fake_nat]}
         external_ids = {
             ovn_const.LB_EXT_IDS_VIP_FIP_KEY: '11.11.11.11'}
         lb.external_ids = external_ids
@@ -4747,8 +4951,9 @@ class TestOvnProviderHelper(ovn_base.TestOvnOctaviaBase):
         if action == ovn_const.REQ_INFO_MEMBER_ADDED:
             calls = [
                 mock.call.lookup('Logical_Switch', 'neutron-foo'),
-                mock.call.db_find_rows('NAT', ('external_ids', '=', {
-                    ovn_const.OVN_FIP_PORT_EXT_ID_KEY: fake_lsp.name})),
+                mock.call.get_lsps_by_ip('foo', info['address']),
+                mock.ANY,
+                mock.call.get_nats_by_fip_port_ids([fake_lsp.name]),
                 mock.ANY,
                 mock.call.db_clear('NAT', fake_nat.uuid, 'external_mac'),
                 mock.ANY,
@@ -4762,6 +4967,54 @@ class TestOvnProviderHelper(ovn_base.TestOvnOctaviaBase):
              assert_called_once_with('fip_id', description='bar'))
             self.helper.ovn_nbdb_api.db_clear.assert_not_called()
 
+    @mock.patch('ovn_octavia_provider.common.clients.get_neutron_client')
+    def test_handle_members_dvr(self, net_cli):
+        lb = mock.MagicMock()
+        lb.external_ids = {ovn_const.LB_EXT_IDS_VIP_FIP_KEY: '11.11.11.11'}
+        self.mock_find_lb_pool_key.return_value = lb
+        member_subnet = fakes.FakeSubnet.create_one_subnet(
+            attrs={'network_id': 'foo'})
+        net_cli.return_value.get_subnet.return_value = member_subnet
+        fake_ls = fakes.FakeOvsdbRow.create_one_ovsdb_row(
+            attrs={'name': 'neutron-foo'})
+        self.helper.ovn_nbdb_api.lookup.return_value = fake_ls
+        fake_lsps = {
+            '10.0.0.10': fakes.FakeOvsdbRow.create_one_ovsdb_row(),
+            '10.0.0.11': fakes.FakeOvsdbRow.create_one_ovsdb_row(),
+            '10.0.0.12': fakes.FakeOvsdbRow.create_one_ovsdb_row()}
+        self.helper.ovn_nbdb_api.get_lsps_by_ip.side_effect = (
+            lambda ls_name, ip: mock.Mock(**{
+                'execute.return_value': [fake_lsps[ip]]}))
+        fake_nat = fakes.FakeOvsdbRow.create_one_ovsdb_row(
+            attrs={
+                'external_ip': '22.22.22.22',
+                'external_ids': {
+                    ovn_const.OVN_FIP_EXT_ID_KEY: 'fip_id'}})
+        self.helper.ovn_nbdb_api.get_nats_by_fip_port_ids.return_value. \
+            execute.return_value = {fake_lsps['10.0.0.11'].name: [fake_nat]}
+        members_info = [
+            {'id': 'member%d' % i,
+             'address': '10.0.0.1%d' % i,
+             'pool_id': self.pool_id,
+             'subnet_id': self.member_subnet_id,
+             'action': ovn_const.REQ_INFO_MEMBER_ADDED}
+            for i in range(3)]
+        self.helper.handle_members_dvr(self.pool_id, members_info)
+
+        # The subnet and the logical switch are fetched just once
+        net_cli.return_value.get_subnet.assert_called_once_with(
+            self.member_subnet_id)
+        self.helper.ovn_nbdb_api.lookup.assert_called_once_with(
+            'Logical_Switch', 'neutron-foo')
+        self.helper.ovn_nbdb_api.get_nats_by_fip_port_ids.\
+            assert_called_once_with([lsp.name for lsp in fake_lsps.values()])
+        self.helper.ovn_nbdb_api.db_clear.assert_has_calls([
+            mock.call('NAT', fake_nat.uuid, 'external_mac'),
+            mock.call().execute(check_error=True),
+            mock.call('NAT', fake_nat.uuid, 'logical_port'),
+            mock.call().execute(check_error=True)])
+        self.assertEqual(2, self.helper.ovn_nbdb_api.db_clear.call_count)
+
     @mock.patch('ovn_octavia_provider.common.clients.get_neutron_client')
     def test_handle_member_dvr_lb_fip_member_added(self, net_cli):
         self._test_handle_member_dvr_lb_fip(net_cli)
@@ -4785,6 +5038,141 @@ class TestOvnProviderHelper(ovn_base.TestOvnOctaviaBase):
         prov_helper2.shutdown()
         prov_helper1.shutdown()
 
+    def test_request_workers(self):
+        self.config(request_workers=3, group='ovn')
+        prov_helper = ovn_helper.OvnProviderHelper()
+        self.assertEqual(3, len(prov_helper.requests))
+        self.assertEqual(3, len(prov_helper.helper_threads))
+        prov_helper.shutdown()
+        for helper_thread in prov_helper.helper_threads:
+            helper_thread.join(timeout=ovn_const.MAX_TIMEOUT_REQUEST)
+            self.assertFalse(helper_thread.is_alive())
+
+    @mock.patch.object(metrics, '_request_metrics', metrics.RequestMetrics())
+    def test_request_handler_metrics(self):
+        prov_helper = ovn_helper.OvnProviderHelper()
+        prov_helper._lb_request_func_maps = {
+            ovn_const.REQ_TYPE_LB_CREATE: mock.Mock(return_value=None),
+            ovn_const.REQ_TYPE_LB_DELETE: mock.Mock(side_effect=Exception)}
+        requests = prov_helper.requests[0]
+        requests.put({'type': ovn_const.REQ_TYPE_LB_CREATE, 'info': self.lb})
+        requests.put({'type': ovn_const.REQ_TYPE_LB_DELETE, 'info': self.lb})
+        prov_helper.shutdown()
+        prov_helper.helper_threads[0].join(
+            timeout=ovn_const.MAX_TIMEOUT_REQUEST)
+        rendered = metrics.render()
+        self.assertIn('ovn_octavia_provider_requests_processed_total'
+                      '{type="lb_create",result="success"} 1', rendered)
+        self.assertIn('ovn_octavia_provider_requests_processed_total'
+                      '{type="lb_delete",result="error"} 1', rendered)
+        self.assertIn('ovn_octavia_provider_request_wait_seconds_count'
+                      '{type="lb_create"} 1', rendered)
+        self.assertIn('ovn_octavia_provider_requests_queue_depth'
+                      '{lane="crud"} 0', rendered)
+
+    def test_metrics_shared_by_helpers(self):
+        prov_helper1 = ovn_helper.OvnProviderHelper()
+        prov_helper2 = ovn_helper.OvnProviderHelper()
+        self.assertIs(metrics.get_request_metrics(), prov_helper1.metrics)
+        self.assertIs(metrics.get_request_metrics(), prov_helper2.metrics)
+        prov_helper2.shutdown()
+        prov_helper1.shutdown()
+
+    @mock.patch.object(metrics, '_file_reporter', None)
+    @mock.patch('ovn_octavia_provider.common.metrics.MetricsFileReporter')
+    def test_metrics_file_reporter(self, mock_reporter):
+        self.config(metrics_file='/tmp/metrics-{pid}.prom', group='ovn')
+        prov_helper1 = ovn_helper.OvnProviderHelper()
+        prov_helper2 = ovn_helper.OvnProviderHelper()
+        mock_reporter.assert_called_once_with(
+            '/tmp/metrics-{pid}.prom', 30, metrics.render)
+        mock_reporter.return_value.start.assert_called_once_with()
+        prov_helper2.shutdown()
+        for helper_thread in prov_helper2.helper_threads:
+            helper_thread.join(timeout=ovn_const.MAX_TIMEOUT_REQUEST)
+        mock_reporter.return_value.stop.assert_not_called()
+        prov_helper1.stop()
+        mock_reporter.return_value.stop.assert_called_once_with()
+
+    @mock.patch.object(ovn_helper.impl_idl_ovn, 'NbGroupCommitter')
+    def test_nb_group_commit(self, mock_committer):
+        self.config(nb_group_commit_latency=0.005, request_workers=2,
+                    group='ovn')
+        prov_helper = ovn_helper.OvnProviderHelper()
+        mock_committer.assert_called_once_with(
+            prov_helper.ovn_nbdb_api, 0.005)
+        commands = [mock.Mock(), mock.Mock()]
+        prov_helper._execute_commands(commands)
+        mock_committer.return_value.execute.assert_called_once_with(
+            commands)
+        prov_helper._execute_commands([])
+        mock_committer.return_value.execute.assert_called_once_with(
+            commands)
+        prov_helper.shutdown()
+
+    @mock.patch.object(ovn_helper.impl_idl_ovn, 'NbGroupCommitter')
+    @mock.patch.object(ovn_helper, 'LOG')
+    def test_nb_group_commit_single_worker(self, mock_log, mock_committer):
+        self.config(nb_group_commit_latency=0.005, request_workers=1,
+                    group='ovn')
+        prov_helper = ovn_helper.OvnProviderHelper()
+        mock_committer.assert_not_called()
+        self.assertIsNone(prov_helper._nb_group_committer)
+        mock_log.warning.assert_called_once_with(mock.ANY)
+        prov_helper.shutdown()
+
+    def test__execute_commands_no_group_commit(self):
+        self.assertIsNone(self.helper._nb_group_committer)
+        command = mock.Mock()
+        self.helper._execute_commands([command])
+        txn = self.helper.ovn_nbdb_api.transaction.return_value.__enter__()
+        txn.add.assert_called_once_with(command)
+
+    def test__get_request_queue_single_worker(self):
+        req = {'type': ovn_const.REQ_TYPE_LB_CREATE, 'info': self.lb}
+        self.assertIs(self.helper.requests[0],
+                      self.helper._get_request_queue(req))
+
+    def test__get_request_queue_same_lb(self):
+        self.helper.requests = [mock.Mock() for _ in range(8)]
+        self.ovn_lb.name = self.loadbalancer_id
+        lb_id = {'loadbalancer_id': self.loadbalancer_id}
+        requests = [
+            {'type': ovn_const.REQ_TYPE_LB_CREATE,
+             'info': dict(self.lb, **lb_id)},
+            {'type': ovn_const.REQ_TYPE_LISTENER_CREATE,
+             'info': self.listener},
+            {'type': ovn_const.REQ_TYPE_POOL_CREATE, 'info': self.pool},
+            {'type': ovn_const.REQ_TYPE_MEMBER_CREATE,
+             'info': dict(self.member, **lb_id)},
+            {'type': ovn_const.REQ_TYPE_HM_CREATE,
+             'info': dict(self.health_monitor, **lb_id)},
+            {'type': ovn_const.REQ_TYPE_HANDLE_VIP_FIP,
+             'info': dict({'ovn_lb': self.ovn_lb}, **lb_id)},
+            {'type': ovn_const.REQ_TYPE_HM_UPDATE_EVENT,
+             'info': dict({'ovn_lbs': [self.ovn_lb]}, **lb_id)}]
+        queues = {id(self.helper._get_request_queue(req))
+                  for req in requests}
+        self.assertEqual(1, len(queues))
+
+    def test__get_request_shard_key(self):
+        self.assertEqual(
+            self.loadbalancer_id,
+            self.helper._get_request_shard_key(
+                {'type': ovn_const.REQ_TYPE_POOL_DELETE, 'info': self.pool}))
+        self.assertIsNone(self.helper._get_request_shard_key(
+            {'type': ovn_const.REQ_TYPE_LB_CREATE_LRP_ASSOC,
+             'info': {'network': self.network, 'router': self.router}}))
+        self.assertIsNone(self.helper._get_request_shard_key(
+            {'type': ovn_const.REQ_TYPE_EXIT}))
+
+    def test__get_request_shard_key_no_lookup(self):
+        # The shard key is never looked up in the OVN NB.
+        self.helper._get_request_shard_key(
+            {'type': ovn_const.REQ_TYPE_MEMBER_UPDATE, 'info': self.member})
+        self.mock_find_lb_pool_key.assert_not_called()
+        self.helper.ovn_nbdb_api.assert_not_called()
+
     def test_create_vip_port_vip_selected(self):
         expected_dict = {
             'name': '%s%s' % (ovn_const.LB_VIP_PORT_PREFIX,
@@ -5062,6 +5450,43 @@ class TestOvnProviderHelper(ovn_base.TestOvnOctaviaBase):
         ret = self.helper.check_lb_protocol(self.listener_id, 'TCP')
         self.assertFalse(ret)
 
+    def test__get_subnet_cached(self):
+        self.mock_ovn_nb_idl.return_value.ls_change_callbacks.append.\
+            assert_called_with(self.helper._neutron_cache.invalidate_network)
+        net_cli = mock.Mock()
+        net_cli.get_subnet.return_value = fakes.FakeSubnet.create_one_subnet()
+        subnet = self.helper._get_subnet(net_cli, 'foo')
+        self.assertEqual(net_cli.get_subnet.return_value.network_id,
+                         subnet.network_id)
+        self.assertIs(subnet, self.helper._get_subnet(net_cli, 'foo'))
+        net_cli.get_subnet.assert_called_once_with('foo')
+        # Dropped once the Logical_Switch of its network changes.
+        self.helper._neutron_cache.invalidate_network(subnet.network_id)
+        self.helper._get_subnet(net_cli, 'foo')
+        self.assertEqual(2, net_cli.get_subnet.call_count)
+
+    def test__get_subnet_shared_by_helpers(self):
+        prov_helper = ovn_helper.OvnProviderHelper()
+        self.assertIs(self.helper._neutron_cache, prov_helper._neutron_cache)
+        net_cli = mock.Mock()
+        net_cli.get_subnet.return_value = fakes.FakeSubnet.create_one_subnet()
+        subnet = self.helper._get_subnet(net_cli, 'foo')
+        self.assertEqual(net_cli.get_subnet.return_value.gateway_ip,
+                         subnet.gateway_ip)
+        self.assertIs(subnet, prov_helper._get_subnet(net_cli, 'foo'))
+        net_cli.get_subnet.assert_called_once_with('foo')
+        prov_helper.shutdown()
+
+    @mock.patch.object(clients, '_neutron_resource_cache', None)
+    def test__get_subnet_cache_disabled(self):
+        self.config(neutron_cache_ttl=0, group='ovn')
+        self.helper = ovn_helper.OvnProviderHelper()
+        net_cli = mock.Mock()
+        net_cli.get_subnet.return_value = fakes.FakeSubnet.create_one_subnet()
+        self.helper._get_subnet(net_cli, 'foo')
+        self.helper._get_subnet(net_cli, 'foo')
+        self.assertEqual(2, net_cli.get_subnet.call_count)
+
     @mock.patch('ovn_octavia_provider.common.clients.get_neutron_client')
     def test__get_port_from_info_with_port_id(self, net_cli):
         port_id = self.vip_port_id
@@ -5073,15 +5498,15 @@ class TestOvnProviderHelper(ovn_base.TestOvnOctaviaBase):
             'ip_address': address,
             'subnet_id': subnet_id})
 
-        subnet_data = {'id': subnet_id}
         net_cli.get_port.return_value = fake_port
-        net_cli.get_subnet.return_value = {'id': subnet_id}
+        net_cli.get_subnet.return_value = fakes.FakeSubnet.create_one_subnet(
+            attrs={'id': subnet_id})
 
         result_port, result_subnet = self.helper._get_port_from_info(
             net_cli, port_id, network_id, address)
 
         self.assertEqual(result_port, fake_port)
-        self.assertEqual(result_subnet, subnet_data)
+        self.assertEqual(subnet_id, result_subnet.id)
         net_cli.get_port.assert_called_once_with(port_id)
         net_cli.get_subnet.assert_called_once_with(subnet_id)
 
@@ -5107,18 +5532,20 @@ class TestOvnProviderHelper(ovn_base.TestOvnOctaviaBase):
         fake_port2['fixed_ips'].append({
             'ip_address': '192.148.210.119',
             'subnet_id': uuidutils.generate_uuid()})
-        subnet_data = {'id': self.vip_subnet_id}
         ports_data = [fake_port, fake_port2]
 
-        net_cli.get_subnet.return_value = subnet_data
+        net_cli.get_subnet.return_value = fakes.FakeSubnet.create_one_subnet(
+            attrs={'id': self.vip_subnet_id})
         list_ports.return_value = ports_data
 
         result_port, result_subnet = self.helper._get_port_from_info(
             net_cli, port_id, network_id, address)
 
         self.assertEqual(result_port, fake_port)
-        self.assertEqual(result_subnet, subnet_data)
-        list_ports.assert_called_once_with(net_cli, network_id=network_id)
+        self.assertEqual(self.vip_subnet_id, result_subnet.id)
+        list_ports.assert_called_once_with(
+            net_cli, network_id=network_id,
+            fixed_ips=['ip_address=%s' % address])
         net_cli.get_subnet.assert_called_once_with(self.vip_subnet_id)
         result_port, result_subnet = self.helper._get_port_from_info(
             net_cli, port_id, network_id, address, subnet_required=False)
@@ -5628,8 +6055,10 @@ class TestOvnProviderHelper(ovn_base.TestOvnOctaviaBase):
         self._get_pool_listeners.stop()
         pool_key = 'pool_%s' % self.pool_id
         self.ovn_hm_lb.external_ids[pool_key] = self.member_line
-        self.helper.ovn_nbdb_api.db_list_rows.return_value.\
-            execute.side_effect = [[self.ovn_hm_lb], [self.ovn_hm]]
+        self.helper.ovn_nbdb_api.get_lbs_by_hm_id.return_value.\
+            execute.return_value = [self.ovn_hm_lb]
+        self.helper.ovn_nbdb_api.get_lbhcs_by_hm_id.return_value.\
+            execute.return_value = [self.ovn_hm]
         status = self.helper.hm_delete(self.health_monitor)
         self.assertEqual(status['healthmonitors'][0]['provisioning_status'],
                          constants.DELETED)
@@ -5660,8 +6089,10 @@ class TestOvnProviderHelper(ovn_base.TestOvnOctaviaBase):
         pool_key = 'pool_%s' % self.pool_id
         self.ovn_hm_lb.external_ids[pool_key] = self.member_line
         self.ovn_hm_lb.external_ids['pool_fake'] = self.member_line
-        self.helper.ovn_nbdb_api.db_list_rows.return_value.\
-            execute.side_effect = [[self.ovn_hm_lb], [self.ovn_hm]]
+        self.helper.ovn_nbdb_api.get_lbs_by_hm_id.return_value.\
+            execute.return_value = [self.ovn_hm_lb]
+        self.helper.ovn_nbdb_api.get_lbhcs_by_hm_id.return_value.\
+            execute.return_value = [self.ovn_hm]
         status = self.helper.hm_delete(self.health_monitor)
         self.assertEqual(status['healthmonitors'][0]['provisioning_status'],
                          constants.DELETED)
@@ -5692,8 +6123,10 @@ class TestOvnProviderHelper(ovn_base.TestOvnOctaviaBase):
         self._get_pool_listeners.stop()
         pool_key = 'pool_%s' % self.pool_id
         self.ovn_hm_lb.external_ids[pool_key] = ''
-        self.helper.ovn_nbdb_api.db_list_rows.return_value.\
-            execute.side_effect = [[self.ovn_hm_lb], [self.ovn_hm]]
+        self.helper.ovn_nbdb_api.get_lbs_by_hm_id.return_value.\
+            execute.return_value = [self.ovn_hm_lb]
+        self.helper.ovn_nbdb_api.get_lbhcs_by_hm_id.return_value.\
+            execute.return_value = [self.ovn_hm]
         status = self.helper.hm_delete(self.health_monitor)
         self.assertEqual(status['healthmonitors'][0]['provisioning_status'],
                          constants.DELETED)
@@ -5718,8 +6151,35 @@ class TestOvnProviderHelper(ovn_base.TestOvnOctaviaBase):
         self.helper.ovn_nbdb_api.db_destroy.assert_has_calls(
             expected_destroy_calls)
 
+    def test__find_ovn_lb_from_hm_id(self):
+        lbhc_fip = copy.deepcopy(self.ovn_hm)
+        lbhc_fip.vip = '123.123.123.99:80'
+        self.ovn_hm.vip = '10.22.33.99:80'
+        self.helper.ovn_nbdb_api.get_lbs_by_hm_id.return_value.\
+            execute.return_value = [self.ovn_hm_lb]
+        self.helper.ovn_nbdb_api.get_lbhcs_by_hm_id.return_value.\
+            execute.return_value = [self.ovn_hm, lbhc_fip]
+        lbhcs, ovn_lb = self.helper._find_ovn_lb_from_hm_id(
+            self.healthmonitor_id)
+        self.assertEqual([self.ovn_hm, lbhc_fip], lbhcs)
+        self.assertEqual(self.ovn_hm_lb, ovn_lb)
+        self.helper.ovn_nbdb_api.get_lbs_by_hm_id.assert_called_once_with(
+            self.healthmonitor_id)
+        self.helper.ovn_nbdb_api.get_lbhcs_by_hm_id.assert_called_once_with(
+            self.healthmonitor_id)
+
+        lbhcs, ovn_lb = self.helper._find_ovn_lb_from_hm_id(
+            self.healthmonitor_id, lbhc_vip='10.22.33.99:80')
+        self.assertEqual([self.ovn_hm], lbhcs)
+
+    def test__find_ovn_lb_from_hm_id_not_found(self):
+        lbhcs, ovn_lb = self.helper._find_ovn_lb_from_hm_id(
+            self.healthmonitor_id)
+        self.assertEqual([], lbhcs)
+        self.assertIsNone(ovn_lb)
+
     def test_hm_delete_row_not_found(self):
-        self.helper.ovn_nbdb_api.db_list_rows.return_value.\
+        self.helper.ovn_nbdb_api.get_lbhcs_by_hm_id.return_value.\
             execute.return_value = [self.ovn_hm]
         self.helper.ovn_nbdb_api.db_find_rows.side_effect = (
             [idlutils.RowNotFound])
@@ -5731,8 +6191,6 @@ class TestOvnProviderHelper(ovn_base.TestOvnOctaviaBase):
         self.helper.ovn_nbdb_api.db_clear.assert_not_called()
 
     def test_hm_delete_hm_not_found(self):
-        self.helper.ovn_nbdb_api.db_list_rows.return_value.\
-            execute.return_value = [self.ovn_hm]
         self.helper.ovn_nbdb_api.db_find_rows.return_value.\
             execute.return_value = [self.ovn_hm_lb]
         self.health_monitor['id'] = 'id_not_found'
@@ -6023,7 +6481,7 @@ class TestOvnProviderHelper(ovn_base.TestOvnOctaviaBase):
                 "health check not found for purge.")
 
     def test_hm_update_event_offline(self):
-        self.helper.ovn_nbdb_api.db_find_rows.return_value.\
+        self.helper.ovn_nbdb_api.get_lbs_by_ip_port_mapping.return_value.\
             execute.return_value = [self.ovn_hm_lb]
         self.hm_update_event = ovn_event.ServiceMonitorUpdateEvent(
             self.helper)
@@ -6039,19 +6497,18 @@ class TestOvnProviderHelper(ovn_base.TestOvnOctaviaBase):
         expected = {
             'info':
                 {'ovn_lbs': [self.ovn_hm_lb],
+                 'loadbalancer_id': self.ovn_hm_lb.name,
                  'ip': self.member_address,
                  'port': self.member_port,
                  'status': ovn_const.HM_EVENT_MEMBER_PORT_OFFLINE},
             'type': 'hm_update_event'}
         self.mock_add_request.assert_called_once_with(expected)
-        self.helper.ovn_nbdb_api.db_find_rows.assert_called_once_with(
-            'Load_Balancer',
-            ('ip_port_mappings', '=',
-             {self.member_address: 'a-logical-port:' + src_ip}),
-            ('protocol', '=', self.ovn_hm_lb.protocol[0]))
+        self.helper.ovn_nbdb_api.get_lbs_by_ip_port_mapping.\
+            assert_called_once_with(self.member_address, 'a-logical-port',
+                                    src_ip, self.ovn_hm_lb.protocol[0])
 
     def test_hm_update_event_offline_by_delete(self):
-        self.helper.ovn_nbdb_api.db_find_rows.return_value.\
+        self.helper.ovn_nbdb_api.get_lbs_by_ip_port_mapping.return_value.\
             execute.return_value = [self.ovn_hm_lb]
         self.hm_update_event = ovn_event.ServiceMonitorUpdateEvent(
             self.helper)
@@ -6067,19 +6524,51 @@ class TestOvnProviderHelper(ovn_base.TestOvnOctaviaBase):
         expected = {
             'info':
                 {'ovn_lbs': [self.ovn_hm_lb],
+                 'loadbalancer_id': self.ovn_hm_lb.name,
                  'ip': self.member_address,
                  'port': self.member_port,
                  'status': ovn_const.HM_EVENT_MEMBER_PORT_OFFLINE},
             'type': 'hm_update_event'}
         self.mock_add_request.assert_called_once_with(expected)
-        self.helper.ovn_nbdb_api.db_find_rows.assert_called_once_with(
-            'Load_Balancer',
-            ('ip_port_mappings', '=',
-             {self.member_address: 'a-logical-port:' + src_ip}),
-            ('protocol', '=', self.ovn_hm_lb.protocol[0]))
+        self.helper.ovn_nbdb_api.get_lbs_by_ip_port_mapping.\
+            assert_called_once_with(self.member_address, 'a-logical-port',
+                                    src_ip, self.ovn_hm_lb.protocol[0])
+
+    def test_hm_update_event_several_lbs(self):
+        lb1_tcp = fakes.FakeOvsdbRow.create_one_ovsdb_row(
+            attrs={'name': 'lb1', 'protocol': ['tcp']})
+        lb1_udp = fakes.FakeOvsdbRow.create_one_ovsdb_row(
+            attrs={'name': 'lb1', 'protocol': ['udp']})
+        lb2_tcp = fakes.FakeOvsdbRow.create_one_ovsdb_row(
+            attrs={'name': 'lb2', 'protocol': ['tcp']})
+        self.helper.ovn_nbdb_api.get_lbs_by_ip_port_mapping.return_value.\
+            execute.return_value = [lb1_tcp, lb2_tcp, lb1_udp]
+        self.hm_update_event = ovn_event.ServiceMonitorUpdateEvent(
+            self.helper)
+        row = fakes.FakeOvsdbRow.create_one_ovsdb_row(
+            attrs={'ip': self.member_address,
+                   'logical_port': 'a-logical-port',
+                   'src_ip': '10.22.33.4',
+                   'port': self.member_port,
+                   'protocol': ['tcp'],
+                   'status': ovn_const.HM_EVENT_MEMBER_PORT_OFFLINE})
+        self.hm_update_event.run('update', row, mock.ANY)
+        expected_info = {'ip': self.member_address,
+                         'port': self.member_port,
+                         'status': ovn_const.HM_EVENT_MEMBER_PORT_OFFLINE}
+        self.mock_add_request.assert_has_calls([
+            mock.call({'type': 'hm_update_event',
+                       'info': dict(expected_info,
+                                    ovn_lbs=[lb1_tcp, lb1_udp],
+                                    loadbalancer_id='lb1')}),
+            mock.call({'type': 'hm_update_event',
+                       'info': dict(expected_info,
+                                    ovn_lbs=[lb2_tcp],
+                                    loadbalancer_id='lb2')})])
+        self.assertEqual(2, self.mock_add_request.call_count)
 
     def test_hm_update_event_lb_not_found(self):
-        self.helper.ovn_nbdb_api.db_find_rows.return_value.\
+        self.helper.ovn_nbdb_api.get_lbs_by_ip_port_mapping.return_value.\
             execute.return_value = []
         self.hm_update_event = ovn_event.ServiceMonitorUpdateEvent(
             self.helper)
@@ -6094,7 +6583,7 @@ class TestOvnProviderHelper(ovn_base.TestOvnOctaviaBase):
         self.mock_add_request.assert_not_called()
 
     def test_hm_update_event_lb_row_not_found(self):
-        self.helper.ovn_nbdb_api.db_find_rows.\
+        self.helper.ovn_nbdb_api.get_lbs_by_ip_port_mapping.\
             side_effect = [idlutils.RowNotFound]
         self.hm_update_event = ovn_event.ServiceMonitorUpdateEvent(
             self.helper)
@@ -6652,16 +7141,15 @@ class TestOvnProviderHelper(ovn_base.TestOvnOctaviaBase):
         # for Pool and Loadbalancer
         status = self._test_hm_update_status(
             [self.ovn_hm_lb], member_2['id'], ip_2, '8081', 'offline')
+        # The legacy neutron:member_status key is migrated.
         member_status = {
-            ovn_const.OVN_MEMBER_STATUS_KEY: '{"%s": "%s", "%s": "%s"}'
-            % (member_1['id'],
-               constants.ONLINE,
-               member_2['id'],
-               constants.ERROR,)}
-        self.helper.ovn_nbdb_api.db_set.assert_called_once_with(
-            'Load_Balancer',
-            self.ovn_hm_lb.uuid,
-            ('external_ids', member_status))
+            ovn_const.OVN_MEMBER_STATUS_PREFIX + member_1['id']:
+                constants.ONLINE,
+            ovn_const.OVN_MEMBER_STATUS_PREFIX + member_2['id']:
+                constants.ERROR}
+        self.helper.ovn_nbdb_api.lb_update_external_ids.\
+            assert_called_once_with(self.ovn_hm_lb.uuid, member_status,
+                                    [ovn_const.OVN_MEMBER_STATUS_KEY])
         self.assertEqual(status['members'][0]['operating_status'],
                          constants.ONLINE)
         self.assertEqual(status['pools'][0]['operating_status'],
@@ -6688,43 +7176,469 @@ class TestOvnProviderHelper(ovn_base.TestOvnOctaviaBase):
         self.ovn_lb.vips = {'vip1:port1': 'ip1:port1,ip2:port1'}
         lb_external_ids = {'external_id1': 'val1'}
         mock_frame_vip_ips.return_value = {'vip1:port1': 'ip1:port1,ip2:port1'}
-        result = self.helper._refresh_lb_vips(
-            self.ovn_lb, lb_external_ids, is_sync=True)
+        result = self.helper._refresh_lb_vips(self.ovn_lb, lb_external_ids)
         self.assertEqual([], result)
+        self.helper.ovn_nbdb_api.lb_update_vips.assert_not_called()
 
     @mock.patch.object(ovn_helper.OvnProviderHelper, '_frame_vip_ips')
     def test_refresh_lb_vips_returns_db_operations_when_not_synced(
             self, mock_frame_vip_ips):
-        self.ovn_lb.vips = {'vip1:port1': 'ip1:port1,ip2:port1'}
+        self.ovn_lb.vips = {'vip1:port1': 'ip1:port1,ip2:port1',
+                            'vip2:port1': 'ip1:port1',
+                            'vip3:port1': 'ip1:port1'}
         lb_external_ids = {'external_id1': 'val1'}
         mock_frame_vip_ips.return_value = {'vip1:port1': 'ip1:port1,ip2:port1',
+                                           'vip2:port1': 'ip1:port1,ip2:port1',
                                            'fip1:port1': 'ip1:port1,ip2:port1'}
-        self.helper._refresh_lb_vips(
-            self.ovn_lb, lb_external_ids, is_sync=True)
-        self.helper.ovn_nbdb_api.db_clear.assert_called_once_with(
-            'Load_Balancer', self.ovn_lb.uuid, 'vips'
-        )
-        self.helper.ovn_nbdb_api.db_set.assert_called_once_with(
-            'Load_Balancer', self.ovn_lb.uuid,
-            ('vips', {'vip1:port1': 'ip1:port1,ip2:port1',
-                      'fip1:port1': 'ip1:port1,ip2:port1'})
-        )
+        result = self.helper._refresh_lb_vips(self.ovn_lb, lb_external_ids)
+        # Only the keys changed are written
+        self.helper.ovn_nbdb_api.lb_update_vips.assert_called_once_with(
+            self.ovn_lb.uuid,
+            {'vip2:port1': 'ip1:port1,ip2:port1',
+             'fip1:port1': 'ip1:port1,ip2:port1'},
+            ['vip3:port1'])
+        self.assertEqual(
+            [self.helper.ovn_nbdb_api.lb_update_vips.return_value], result)
+        self.helper.ovn_nbdb_api.db_clear.assert_not_called()
+        self.helper.ovn_nbdb_api.db_set.assert_not_called()
 
-    @mock.patch.object(ovn_helper.OvnProviderHelper, '_frame_vip_ips')
-    def test_refresh_lb_vips_returns_db_operations_when_is_sync_false(
-            self, mock_frame_vip_ips):
-        self.ovn_lb.vips = {'vip1:port1': 'ip1:port1,ip2:port1'}
-        lb_external_ids = {'external_id1': 'val1'}
-        mock_frame_vip_ips.return_value = {'vip1:port1': 'ip1:port1,ip2:port1'}
-        self.helper._refresh_lb_vips(
-            self.ovn_lb, lb_external_ids)
 
-        # Assert that the method returns the db_clear and db_set operations
-        self.helper.ovn_nbdb_api.db_clear.assert_called_once_with(
-            'Load_Balancer', self.ovn_lb.uuid, 'vips'
-        )
-        self.helper.ovn_nbdb_api.db_set.assert_called_once_with(
-            'Load_Balancer',
-            self.ovn_lb.uuid,
-            ('vips', {'vip1:port1': 'ip1:port1,ip2:port1'})
-        )
+class TestRequestsQueue(ovn_base.TestOvnOctaviaBase):
+
+    def setUp(self):
+        super().setUp()
+        self.requests = ovn_helper.RequestsQueue()
+        self.ovn_lb = mock.MagicMock(uuid=uuidutils.generate_uuid())
+
+    def _member_update(self, **kwargs):
+        info = {'id': self.member_id,
+                'address': self.member_address,
+                'protocol_port': self.member_port,
+                'pool_id': self.pool_id}
+        info.update(kwargs)
+        return {'type': ovn_const.REQ_TYPE_MEMBER_UPDATE, 'info': info}
+
+    def _hm_update_event(self, status):
+        return {'type': ovn_const.REQ_TYPE_HM_UPDATE_EVENT,
+                'info': {'ovn_lbs': [self.ovn_lb],
+                         'ip': self.member_address,
+                         'port': self.member_port,
+                         'status': status}}
+
+    def _get_all(self):
+        requests = []
+        while not self.requests.empty():
+            requests.append(self.requests.get_nowait())
+            self.requests.task_done()
+        return requests
+
+    def test_fold_member_update(self):
+        pool_update = {'type': ovn_const.REQ_TYPE_POOL_UPDATE,
+                       'info': {'id': self.pool_id,
+                                'loadbalancer_id': self.loadbalancer_id,
+                                'admin_state_up': True}}
+        self.requests.put(self._member_update(old_admin_state_up=True,
+                                              admin_state_up=False))
+        self.requests.put(pool_update)
+        self.requests.put(self._member_update(old_admin_state_up=False,
+                                              admin_state_up=True))
+        self.assertEqual(2, self.requests.qsize())
+        self.assertEqual({ovn_const.REQ_LANE_CRUD: 2,
+                          ovn_const.REQ_LANE_HM_EVENT: 0},
+                         self.requests.lanes_qsize())
+        self.assertEqual(2, self.requests.unfinished_tasks)
+        member_update, pool_update_ = self._get_all()
+        self.assertEqual(
+            self._member_update(old_admin_state_up=True,
+                                admin_state_up=True),
+            member_update)
+        self.assertEqual(pool_update, pool_update_)
+        self.assertEqual(0, self.requests.unfinished_tasks)
+
+    def test_fold_hm_update_event(self):
+        self.requests.put(self._hm_update_event(
+            ovn_const.HM_EVENT_MEMBER_PORT_OFFLINE))
+        self.requests.put(self._hm_update_event(
+            ovn_const.HM_EVENT_MEMBER_PORT_ONLINE))
+        self.requests.put(self._hm_update_event(
+            ovn_const.HM_EVENT_MEMBER_PORT_OFFLINE))
+        self.assertEqual(
+            [self._hm_update_event(ovn_const.HM_EVENT_MEMBER_PORT_OFFLINE)],
+            self._get_all())
+
+    def test_fold_barrier(self):
+        member_delete = {'type': ovn_const.REQ_TYPE_MEMBER_DELETE,
+                         'info': {'id': self.member_id,
+                                  'pool_id': self.pool_id}}
+        self.requests.put(self._member_update(admin_state_up=False))
+        self.requests.put(member_delete)
+        self.requests.put(self._member_update(admin_state_up=True))
+        self.assertEqual(
+            [self._member_update(admin_state_up=False),
+             member_delete,
+             self._member_update(admin_state_up=True)],
+            self._get_all())
+
+    def test_no_fold_dequeued_request(self):
+        self.requests.put(self._member_update(admin_state_up=False))
+        self.assertEqual(self._member_update(admin_state_up=False),
+                         self.requests.get_nowait())
+        self.requests.put(self._member_update(admin_state_up=True))
+        self.assertEqual([self._member_update(admin_state_up=True)],
+                         self._get_all())
+
+    def test_no_fold_different_resources(self):
+        other_member = self._member_update(admin_state_up=True)
+        other_member['info']['id'] = uuidutils.generate_uuid()
+        self.requests.put(self._member_update(admin_state_up=False))
+        self.requests.put(other_member)
+        self.assertEqual(2, self.requests.qsize())
+
+    def test_hm_event_lane(self):
+        self.requests = ovn_helper.RequestsQueue(hm_event_weight=2)
+        crud = [{'type': ovn_const.REQ_TYPE_LB_CREATE,
+                 'info': {'id': uuidutils.generate_uuid()}}
+                for _ in range(3)]
+        hm_events = []
+        for _ in range(3):
+            hm_event = self._hm_update_event(
+                ovn_const.HM_EVENT_MEMBER_PORT_ONLINE)
+            hm_event['info']['ip'] = uuidutils.generate_uuid()
+            hm_events.append(hm_event)
+        for request in crud + hm_events:
+            self.requests.put(request)
+        self.assertEqual(6, self.requests.qsize())
+        self.assertEqual(
+            [hm_events[0], hm_events[1], crud[0], hm_events[2], crud[1],
+             crud[2]],
+            self._get_all())
+
+    def test_metrics(self):
+        request_metrics = mock.Mock()
+        self.requests = ovn_helper.RequestsQueue(
+            request_metrics=request_metrics)
+        self.requests.put(self._member_update(admin_state_up=False))
+        self.requests.put(self._member_update(admin_state_up=True))
+        self._get_all()
+        request_metrics.request_queued.assert_has_calls(
+            [mock.call(ovn_const.REQ_TYPE_MEMBER_UPDATE)] * 2)
+        request_metrics.request_folded.assert_called_once_with(
+            ovn_const.REQ_TYPE_MEMBER_UPDATE)
+        request_metrics.request_started.assert_called_once_with(
+            ovn_const.REQ_TYPE_MEMBER_UPDATE, mock.ANY)
+
+    def test_fold_barrier_other_lane(self):
+        lb_create = {'type': ovn_const.REQ_TYPE_LB_CREATE,
+                     'info': {'id': self.loadbalancer_id}}
+        self.requests.put(self._hm_update_event(
+            ovn_const.HM_EVENT_MEMBER_PORT_OFFLINE))
+        self.requests.put(lb_create)
+        self.requests.put(self._hm_update_event(
+            ovn_const.HM_EVENT_MEMBER_PORT_ONLINE))
+        self.assertEqual(
+            [self._hm_update_event(ovn_const.HM_EVENT_MEMBER_PORT_ONLINE),
+             lb_create],
+            self._get_all())
+
+
+class TestStatusUpdater(ovn_base.TestOvnOctaviaBase):
+
+    def setUp(self):
+        super().setUp()
+        self.update_status = mock.Mock()
+        self.updater = ovn_helper.StatusUpdater(self.update_status)
+
+    def _run_updater(self):
+        self.updater.start()
+        self.updater.stop()
+        self.updater._thread.join(timeout=ovn_const.MAX_TIMEOUT_REQUEST)
+        self.assertFalse(self.updater._thread.is_alive())
+
+    def test_merge_statuses(self):
+        callback = mock.Mock()
+        self.updater.add({
+            constants.LOADBALANCERS: [
+                {constants.ID: self.loadbalancer_id,
+                 constants.PROVISIONING_STATUS: constants.ACTIVE}],
+            constants.MEMBERS: [
+                {constants.ID: self.member_id,
+                 constants.PROVISIONING_STATUS: constants.ACTIVE,
+                 constants.OPERATING_STATUS: constants.ONLINE}]})
+        self.updater.add({
+            constants.LOADBALANCERS: [
+                {constants.ID: self.loadbalancer_id,
+                 constants.PROVISIONING_STATUS: constants.ACTIVE,
+                 constants.OPERATING_STATUS: constants.DEGRADED}],
+            constants.POOLS: [
+                {constants.ID: '%s:D' % self.pool_id,
+                 constants.PROVISIONING_STATUS: constants.ACTIVE}],
+            constants.MEMBERS: [
+                {constants.ID: self.member_id,
+                 constants.OPERATING_STATUS: constants.ERROR}]},
+            callback=callback)
+        self._run_updater()
+        self.update_status.assert_called_once_with({
+            constants.LOADBALANCERS: [
+                {constants.ID: self.loadbalancer_id,
+                 constants.PROVISIONING_STATUS: constants.ACTIVE,
+                 constants.OPERATING_STATUS: constants.DEGRADED}],
+            constants.MEMBERS: [
+                {constants.ID: self.member_id,
+                 constants.PROVISIONING_STATUS: constants.ACTIVE,
+                 constants.OPERATING_STATUS: constants.ERROR}],
+            constants.POOLS: [
+                {constants.ID: self.pool_id,
+                 constants.PROVISIONING_STATUS: constants.ACTIVE}]})
+        callback.assert_called_once_with()
+
+    def test_update_status_error(self):
+        callback = mock.Mock()
+        self.update_status.side_effect = exceptions.UpdateStatusError(
+            fault_string='foo')
+        self.updater.add({
+            constants.LOADBALANCERS: [
+                {constants.ID: self.loadbalancer_id,
+                 constants.PROVISIONING_STATUS: constants.ACTIVE}]},
+            callback=callback)
+        self._run_updater()
+        self.update_status.assert_called_once_with(mock.ANY)
+        callback.assert_called_once_with()
+
+    def test_update_status_error_other_lb(self):
+        # The failure of the update of a load balancer does not drop the
+        # statuses of the other ones queued in the same batch.
+        lb2_id = uuidutils.generate_uuid()
+        lb1_status = {
+            constants.LOADBALANCERS: [
+                {constants.ID: self.loadbalancer_id,
+                 constants.PROVISIONING_STATUS: constants.ACTIVE}],
+            constants.MEMBERS: [
+                {constants.ID: self.member_id,
+                 constants.PROVISIONING_STATUS: constants.ACTIVE}]}
+        lb2_status = {
+            constants.LOADBALANCERS: [
+                {constants.ID: lb2_id,
+                 constants.PROVISIONING_STATUS: constants.ACTIVE}],
+            constants.POOLS: [
+                {constants.ID: self.pool_id,
+                 constants.PROVISIONING_STATUS: constants.ACTIVE}]}
+        self.update_status.side_effect = [
+            exceptions.UpdateStatusError(fault_string='foo'), None]
+        callback = mock.Mock()
+        self.updater.add(lb1_status)
+        self.updater.add(lb2_status, callback=callback)
+        self._run_updater()
+        self.update_status.assert_has_calls([
+            mock.call(lb1_status), mock.call(lb2_status)])
+        self.assertEqual(2, self.update_status.call_count)
+        callback.assert_called_once_with()
+
+    def test_status_several_lbs(self):
+        lb2_id = uuidutils.generate_uuid()
+        self.updater.add({
+            constants.LOADBALANCERS: [
+                {constants.ID: self.loadbalancer_id,
+                 constants.OPERATING_STATUS: constants.ONLINE},
+                {constants.ID: lb2_id,
+                 constants.OPERATING_STATUS: constants.ONLINE}],
+            constants.MEMBERS: [
+                {constants.ID: self.member_id,
+                 constants.OPERATING_STATUS: constants.ONLINE}]})
+        self._run_updater()
+        self.update_status.assert_has_calls([
+            mock.call({constants.LOADBALANCERS: [
+                {constants.ID: self.loadbalancer_id,
+                 constants.OPERATING_STATUS: constants.ONLINE}]}),
+            mock.call({constants.LOADBALANCERS: [
+                {constants.ID: lb2_id,
+                 constants.OPERATING_STATUS: constants.ONLINE}]}),
+            mock.call({constants.MEMBERS: [
+                {constants.ID: self.member_id,
+                 constants.OPERATING_STATUS: constants.ONLINE}]})],
+            any_order=True)
+        self.assertEqual(3, self.update_status.call_count)
+
+    def test_stop_flush(self):
+        # The statuses queued once the thread exited are sent by stop().
+        callback = mock.Mock()
+        self.updater.add({
+            constants.LOADBALANCERS: [
+                {constants.ID: self.loadbalancer_id,
+                 constants.PROVISIONING_STATUS: constants.ACTIVE}]},
+            callback=callback)
+        self.updater.stop()
+        self.update_status.assert_called_once_with({
+            constants.LOADBALANCERS: [
+                {constants.ID: self.loadbalancer_id,
+                 constants.PROVISIONING_STATUS: constants.ACTIVE}]})
+        callback.assert_called_once_with()
+
+    def test_add_after_stop(self):
+        self._run_updater()
+        callback = mock.Mock()
+        self.updater.add({
+            constants.LOADBALANCERS: [
+                {constants.ID: self.loadbalancer_id,
+                 constants.PROVISIONING_STATUS: constants.ACTIVE}]},
+            callback=callback)
+        self.update_status.assert_called_once_with({
+            constants.LOADBALANCERS: [
+                {constants.ID: self.loadbalancer_id,
+                 constants.PROVISIONING_STATUS: constants.ACTIVE}]})
+        callback.assert_called_once_with()
+        self.updater.stop()
+        self.update_status.assert_called_once_with(mock.ANY)
+
+    def test_request_handler(self):
+        ovn_conf.register_opts()
+        prov_helper = ovn_helper.OvnProviderHelper()
+        status = {constants.LOADBALANCERS: [
+            {constants.ID: self.loadbalancer_id,
+             constants.PROVISIONING_STATUS: constants.ACTIVE}]}
+        prov_helper._lb_request_func_maps = {
+            ovn_const.REQ_TYPE_LB_UPDATE: mock.Mock(return_value=status)}
+        with mock.patch.object(prov_helper._status_updater, 'add') as add:
+            prov_helper.requests[0].put(
+                {'type': ovn_const.REQ_TYPE_LB_UPDATE, 'info': {}})
+            prov_helper.shutdown()
+            prov_helper.helper_threads[0].join(
+                timeout=ovn_const.MAX_TIMEOUT_REQUEST)
+        add.assert_called_once_with(status, callback=None)
+
+
+class TestOvnProviderHelperJournal(ovn_base.TestOvnOctaviaBase):
+
+    def setUp(self):
+        super().setUp()
+        ovn_conf.register_opts()
+        self.config(request_journal='/foo/journal.sqlite', group='ovn')
+        self.mock_journal = mock.patch(
+            'ovn_octavia_provider.common.journal.RequestJournal').start()
+        self.journal = self.mock_journal.return_value
+        self.journal.claim_incomplete.return_value = []
+        self.journal.record.return_value = 'journal_id'
+        self.request = {'type': ovn_const.REQ_TYPE_MEMBER_DELETE,
+                        'info': {'id': self.member_id,
+                                 'pool_id': self.pool_id}}
+
+    def _create_helper(self):
+        helper = ovn_helper.OvnProviderHelper()
+        self.addCleanup(helper.shutdown)
+        return helper
+
+    @mock.patch.object(ovn_helper.OvnProviderHelper, 'request_handler')
+    def test_add_request(self, mock_request_handler):
+        helper = self._create_helper()
+        self.mock_journal.assert_called_once_with('/foo/journal.sqlite')
+        self.journal.start.assert_called_once_with()
+        request = copy.deepcopy(self.request)
+        helper.add_request(request)
+        self.journal.record.assert_called_once_with(request)
+        self.assertEqual(['journal_id'],
+                         request[ovn_const.REQ_JOURNAL_IDS])
+        self.assertIs(request, helper.requests[0].get_nowait())
+
+    @mock.patch.object(ovn_helper.OvnProviderHelper, 'request_handler')
+    def test_add_request_not_journaled(self, mock_request_handler):
+        helper = self._create_helper()
+        request = {'type': ovn_const.REQ_TYPE_HM_UPDATE_EVENT,
+                   'info': {'ovn_lbs': [mock.Mock()], 'ip': '10.0.0.1',
+                            'port': '80', 'status': ['online']}}
+        helper.add_request(request)
+        self.journal.record.assert_not_called()
+        self.assertNotIn(ovn_const.REQ_JOURNAL_IDS, request)
+
+    @mock.patch.object(ovn_helper.OvnProviderHelper, 'request_handler')
+    def test_replay_incomplete_requests(self, mock_request_handler):
+        self.request[ovn_const.REQ_JOURNAL_IDS] = ['old_journal_id']
+        self.journal.claim_incomplete.return_value = [self.request]
+        helper = self._create_helper()
+        self.journal.record.assert_not_called()
+        self.assertIs(self.request, helper.requests[0].get_nowait())
+
+    def test_request_handler_complete_after_status_update(self):
+        helper = self._create_helper()
+        status = {constants.LOADBALANCERS: [
+            {constants.ID: self.loadbalancer_id,
+             constants.PROVISIONING_STATUS: constants.ACTIVE}]}
+        helper._lb_request_func_maps = {
+            ovn_const.REQ_TYPE_MEMBER_DELETE: mock.Mock(return_value=status)}
+        with mock.patch.object(helper._status_updater, 'add') as add:
+            helper.add_request(self.request)
+            helper.shutdown()
+            helper.helper_threads[0].join(
+                timeout=ovn_const.MAX_TIMEOUT_REQUEST)
+        add.assert_called_once_with(status, callback=mock.ANY)
+        self.journal.complete.assert_not_called()
+        add.call_args[1]['callback']()
+        self.journal.complete.assert_called_once_with(['journal_id'])
+
+    def test_stop(self):
+        helper = self._create_helper()
+        calls = mock.Mock()
+        calls.member_delete.return_value = None
+        helper._lb_request_func_maps = {
+            ovn_const.REQ_TYPE_MEMBER_DELETE: calls.member_delete}
+        self.journal.stop = calls.journal_stop
+        with mock.patch.object(helper._status_updater, 'stop',
+                               calls.status_updater_stop):
+            helper.add_request(self.request)
+            helper.stop()
+        # The requests queued are processed before stopping the status
+        # updater and the journal.
+        self.assertEqual(
+            ['member_delete', 'status_updater_stop', 'journal_stop'],
+            [call[0] for call in calls.mock_calls])
+        self.assertFalse(helper.helper_threads[0].is_alive())
+
+    def test_stop_timeout(self):
+        helper = self._create_helper()
+        processing = threading.Event()
+        release = threading.Event()
+
+        def member_delete(info):
+            processing.set()
+            release.wait()
+
+        helper._lb_request_func_maps = {
+            ovn_const.REQ_TYPE_MEMBER_DELETE: member_delete}
+        helper.add_request(self.request)
+        processing.wait(timeout=ovn_const.MAX_TIMEOUT_REQUEST)
+        helper.stop(timeout=0.01)
+        self.assertTrue(helper.helper_threads[0].is_alive())
+        self.journal.stop.assert_not_called()
+        release.set()
+        helper.helper_threads[0].join(timeout=ovn_const.MAX_TIMEOUT_REQUEST)
+        self.journal.stop.assert_called_once_with()
+
+    def test_shutdown_does_not_wait(self):
+        helper = self._create_helper()
+        release = threading.Event()
+
+        def member_delete(info):
+            release.wait()
+
+        helper._lb_request_func_maps = {
+            ovn_const.REQ_TYPE_MEMBER_DELETE: member_delete}
+        helper.add_request(self.request)
+        helper.shutdown()
+        helper.shutdown()
+        self.assertTrue(helper.helper_threads[0].is_alive())
+        self.journal.stop.assert_not_called()
+        # The last worker exiting stops the journal.
+        release.set()
+        helper.helper_threads[0].join(timeout=ovn_const.MAX_TIMEOUT_REQUEST)
+        self.assertFalse(helper.helper_threads[0].is_alive())
+        self.journal.stop.assert_called_once_with()
+
+    def test_request_handler_complete(self):
+        helper = self._create_helper()
+        member_delete = mock.Mock(side_effect=Exception)
+        helper._lb_request_func_maps = {
+            ovn_const.REQ_TYPE_MEMBER_DELETE: member_delete}
+        helper.add_request(self.request)
+        helper.shutdown()
+        helper.helper_threads[0].join(timeout=ovn_const.MAX_TIMEOUT_REQUEST)
+        member_delete.assert_called_once_with(self.request['info'])
+        self.journal.complete.assert_called_once_with(['journal_id'])
+        self.journal.stop.assert_called_with()
@@ -186,3 +186,41 @@ class TestDBInconsistenciesPeriodics(ovn_base.TestOvnOctaviaBase):
             'Load_Balancer', 'foo1', 'ip_port_mappings')
         self.maint.ovn_nbdb_api.db_set.assert_called_once_with(
             'Load_Balancer', 'foo1', ('ip_port_mappings', mapping1))
+
+    def test_migrate_member_status_to_member_keys(self):
+        ovn_lbs = [
+            fakes.FakeOVNLB.create_one_lb(
+                attrs={
+                    'uuid': 'foo1',
+                    'external_ids': {
+                        ovn_const.OVN_MEMBER_STATUS_KEY:
+                            '{"m1": "ONLINE", "m2": "ONLINE"}',
+                        ovn_const.OVN_MEMBER_STATUS_PREFIX + 'm2':
+                            'ERROR'}}),
+            fakes.FakeOVNLB.create_one_lb(
+                attrs={
+                    'uuid': 'foo2',
+                    'external_ids': {
+                        ovn_const.OVN_MEMBER_STATUS_KEY: '{}'}}),
+            fakes.FakeOVNLB.create_one_lb(
+                attrs={
+                    'uuid': 'foo3',
+                    'external_ids': {
+                        ovn_const.OVN_MEMBER_STATUS_PREFIX + 'm3':
+                            'ONLINE'}}),
+        ]
+        self.maint.ovn_nbdb_api.db_find_rows.return_value.\
+            execute.return_value = ovn_lbs
+        self.assertRaises(periodics.NeverAgain,
+                          self.maint.migrate_member_status_to_member_keys)
+        # The status already stored in the key of a member is kept.
+        self.maint.ovn_nbdb_api.lb_update_external_ids.assert_has_calls([
+            mock.call('foo1',
+                      {ovn_const.OVN_MEMBER_STATUS_PREFIX + 'm1': 'ONLINE'},
+                      [ovn_const.OVN_MEMBER_STATUS_KEY]),
+            mock.call().execute(check_error=True),
+            mock.call('foo2', {}, [ovn_const.OVN_MEMBER_STATUS_KEY]),
+            mock.call().execute(check_error=True)])
+        self.assertEqual(
+            2, self.maint.ovn_nbdb_api.lb_update_external_ids.call_count)
+        self.maint.ovn_nbdb_api.db_set.assert_not_called()
@@ -0,0 +1,277 @@
+#!/usr/bin/env python3
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""Memory footprint of the OVN NB IDL used by the provider
+
+Loads a synthetic OVN Northbound database, shaped like the ones created by
+Neutron, in two IDLs registering the same tables: one replicating all their
+columns (as the provider used to do) and one replicating only the columns
+declared in OvnNbIdlForLb.TABLES. The memory allocated for the rows of each
+table is reported for both.
+
+No OVSDB server is needed, the rows are loaded by processing a monitor
+reply as the IDL does when it connects to the database.
+
+Usage: tools/nb_idl_memory_benchmark.py [--networks N] [--ports N] ...
+"""
+
+import argparse
+import json
+import os
+import tracemalloc
+import uuid
+
+from ovs.db import idl as ovs_idl
+
+from ovn_octavia_provider.ovsdb import impl_idl_ovn
+
+DEFAULT_SCHEMA = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), '..', 'ovn_octavia_provider',
+    'tests', 'unit', 'schemas', 'ovn-nb.ovsschema')
+
+
+def _uuid():
+    return str(uuid.uuid4())
+
+
+def _map(values):
+    return ['map', sorted(values.items())]
+
+
+def _set(values):
+    return ['set', values]
+
+
+def _uuids(uuids):
+    return _set([['uuid', value] for value in uuids])
+
+
+def _mac(i):
+    return 'fa:16:3e:%02x:%02x:%02x' % (
+        (i >> 16) & 0xff, (i >> 8) & 0xff, i & 0xff)
+
+
+def _ip(net, i):
+    return '10.%d.%d.%d' % (net // 256 % 256, net % 256, i % 250 + 2)
+
+
+def _neutron_ids(resource_id, **extra):
+    external_ids = {
+        'neutron:revision_number': '4',
+        'neutron:project_id': _uuid().replace('-', ''),
+        'neutron:security_group_ids': _uuid(),
+        'neutron:device_id': _uuid(),
+        'neutron:device_owner': 'compute:nova',
+        'neutron:network_name': 'neutron-%s' % resource_id,
+        'neutron:port_name': '',
+        'neutron:host_id': 'compute-%s' % resource_id[:4],
+    }
+    external_ids.update(extra)
+    return external_ids
+
+
+def build_nb(networks, ports, routers, lbs):
+    """Return the monitor reply (table -> uuid -> row) of a synthetic NB"""
+    nb = {table: {} for table in impl_idl_ovn.OvnNbIdlForLb.TABLES}
+    router_uuids = [_uuid() for _ in range(routers)]
+    router_ports = {router: [] for router in router_uuids}
+    router_lbs = {router: [] for router in router_uuids}
+    for net in range(networks):
+        net_id = _uuid()
+        router = router_uuids[net % routers]
+        ls_ports = []
+        ls_lbs = []
+        for i in range(ports):
+            lsp = _uuid()
+            port_id = _uuid()
+            ls_ports.append(lsp)
+            nb['Logical_Switch_Port'][lsp] = {
+                'name': port_id,
+                'addresses': '%s %s' % (_mac(net * ports + i), _ip(net, i)),
+                'dynamic_addresses': _set([]),
+                'port_security': '%s %s' % (
+                    _mac(net * ports + i), _ip(net, i)),
+                'external_ids': _map(_neutron_ids(
+                    net_id, **{'neutron:cidrs': '%s/24' % _ip(net, i)})),
+                'options': _map({'requested-chassis': 'compute-%d' % i,
+                                 'mcast_flood_reports': 'true'}),
+                'dhcpv4_options': ['uuid', _uuid()],
+                'up': True,
+                'enabled': True,
+            }
+        # The router interface of the network.
+        lrp = _uuid()
+        lrp_id = _uuid()
+        router_ports[router].append(lrp)
+        nb['Logical_Router_Port'][lrp] = {
+            'name': 'lrp-%s' % lrp_id,
+            'mac': _mac(net),
+            'networks': '%s/24' % _ip(net, -1),
+            'external_ids': _map(_neutron_ids(
+                net_id, **{'neutron:router_name': router})),
+            'options': _map({'gateway_mtu': '1442'}),
+            'ipv6_ra_configs': _map({}),
+            'enabled': True,
+        }
+        lsp = _uuid()
+        ls_ports.append(lsp)
+        nb['Logical_Switch_Port'][lsp] = {
+            'name': lrp_id,
+            'type': 'router',
+            'addresses': 'router',
+            'external_ids': _map(_neutron_ids(
+                net_id, **{'neutron:device_owner':
+                           'network:router_interface'})),
+            'options': _map({'router-port': 'lrp-%s' % lrp_id}),
+        }
+        for i in range(lbs):
+            lb = _uuid()
+            ls_lbs.append(lb)
+            router_lbs[router].append(lb)
+            vip = _ip(net, 200 + i)
+            nb['Load_Balancer'][lb] = {
+                'name': _uuid(),
+                'protocol': 'tcp',
+                'vips': _map({'%s:80' % vip: ','.join(
+                    '%s:80' % _ip(net, m) for m in range(3))}),
+                'external_ids': _map({
+                    'enabled': 'True',
+                    'ls_refs': '{"neutron-%s": 1}' % net_id,
+                    'lr_ref': 'neutron-%s' % router,
+                    'neutron:vip': vip,
+                    'neutron:vip_port_id': _uuid(),
+                    'listener_%s' % _uuid(): '80:pool_%s' % _uuid()}),
+            }
+        nb['Logical_Switch'][_uuid()] = {
+            'name': 'neutron-%s' % net_id,
+            'ports': _uuids(ls_ports),
+            'load_balancer': _uuids(ls_lbs),
+            'external_ids': _map(_neutron_ids(net_id)),
+            'other_config': _map({'mcast_snoop': 'false',
+                                  'mcast_flood_unregistered': 'false'}),
+        }
+    for router in router_uuids:
+        gw_chassis = _uuid()
+        gw_lrp = _uuid()
+        gw_port_id = _uuid()
+        router_ports[router].append(gw_lrp)
+        nb['Gateway_Chassis'][gw_chassis] = {
+            'name': 'lrp-%s_gw' % gw_port_id,
+            'chassis_name': 'network-0',
+            'priority': 1,
+        }
+        nb['Logical_Router_Port'][gw_lrp] = {
+            'name': 'lrp-%s' % gw_port_id,
+            'mac': _mac(routers + len(nb['NAT'])),
+            'networks': '172.24.4.%d/24' % (len(router_ports) % 250 + 2),
+            'gateway_chassis': _uuids([gw_chassis]),
+            'external_ids': _map(_neutron_ids(
+                router, **{'neutron:is_ext_gw': 'True'})),
+        }
+        nats = []
+        for i in range(ports):
+            nat = _uuid()
+            nats.append(nat)
+            nb['NAT'][nat] = {
+                'type': 'dnat_and_snat',
+                'external_ip': '172.24.%d.%d' % (i // 250, i % 250 + 2),
+                'logical_ip': _ip(i, i),
+                'external_mac': _mac(i),
+                'logical_port': _uuid(),
+                'external_ids': _map({
+                    'neutron:fip_id': _uuid(),
+                    'neutron:fip_port_id': _uuid(),
+                    'neutron:fip_network_id': _uuid(),
+                    'neutron:revision_number': '2',
+                    'neutron:router_name': 'neutron-%s' % router}),
+            }
+        nb['Logical_Router'][router] = {
+            'name': 'neutron-%s' % router,
+            'ports': _uuids(router_ports[router]),
+            'load_balancer': _uuids(router_lbs[router]),
+            'nat': _uuids(nats),
+            'external_ids': _map(_neutron_ids(
+                router, **{'neutron:gw_port_id': gw_port_id})),
+            'options': _map({'always_learn_from_arp_request': 'false',
+                             'dynamic_neigh_routers': 'true'}),
+            'enabled': True,
+        }
+    return nb
+
+
+def _create_idl(schema, tables):
+    helper = ovs_idl.SchemaHelper(location=schema)
+    impl_idl_ovn.register_tables(helper, tables)
+    return ovs_idl.Idl('unix:/nonexistent', helper)
+
+
+def load_nb(schema, tables, nb):
+    """Load the NB in an IDL and return the bytes retained per table"""
+    idl = _create_idl(schema, tables)
+    usage = {}
+    for table, rows in nb.items():
+        columns = idl.tables[table].columns
+        # The server only sends the monitored columns.
+        update = json.dumps({table: {
+            row_uuid: {'initial': {column: value
+                                   for column, value in row.items()
+                                   if column in columns}}
+            for row_uuid, row in rows.items()}})
+        # Parse the JSON message too, as the rows keep the objects created
+        # by the parser.
+        tracemalloc.start()
+        idl._Idl__parse_update(json.loads(update),
+                               ovs_idl.OVSDB_UPDATE2)
+        usage[table] = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+    return usage
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('--schema', default=DEFAULT_SCHEMA,
+                        help='OVN_Northbound schema file.')
+    parser.add_argument('--networks', type=int, default=1000,
+                        help='Number of Logical_Switch rows.')
+    parser.add_argument('--ports', type=int, default=20,
+                        help='Number of VM ports per network (and of '
+                             'FIPs per router).')
+    parser.add_argument('--routers', type=int, default=200,
+                        help='Number of Logical_Router rows.')
+    parser.add_argument('--lbs', type=int, default=1,
+                        help='Number of Load_Balancer rows per network.')
+    args = parser.parse_args()
+
+    nb = build_nb(args.networks, args.ports, args.routers, args.lbs)
+    all_columns = {table: None for table in impl_idl_ovn.OvnNbIdlForLb.TABLES}
+    before = load_nb(args.schema, all_columns, nb)
+    after = load_nb(args.schema, impl_idl_ovn.OvnNbIdlForLb.TABLES, nb)
+
+    row_format = '%-28s %8d %14d %14d %6.1f%%'
+    print('%-28s %8s %14s %14s %7s' % (
+        'Table', 'Rows', 'All (KiB)', 'Pruned (KiB)', 'Saved'))
+    for table, rows in nb.items():
+        if rows:
+            print(row_format % (
+                table, len(rows), before[table] / 1024, after[table] / 1024,
+                100.0 * (before[table] - after[table]) / before[table]))
+    total_before = sum(before.values())
+    total_after = sum(after.values())
+    print(row_format % (
+        'Total', sum(len(rows) for rows in nb.values()),
+        total_before / 1024, total_after / 1024,
+        100.0 * (total_before - total_after) / total_before))
+
+
+if __name__ == '__main__':
+    main()